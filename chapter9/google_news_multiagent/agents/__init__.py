@@ -3,10 +3,18 @@ from .collector import RSSCollectorAgent
 from .summarizer import NewsSummarizerAgent
 from .organizer import NewsOrganizerAgent
 from .reporter import ReportGeneratorAgent
+from .digester import NewsDigestAgent
+from .deduplicator import NearDuplicateAgent
+from .clusterer import StoryClusterAgent
+from .streamer import StreamingPipelineAgent
 
 __all__ = [
     "RSSCollectorAgent",
     "NewsSummarizerAgent",
     "NewsOrganizerAgent",
     "ReportGeneratorAgent",
+    "NewsDigestAgent",
+    "NearDuplicateAgent",
+    "StoryClusterAgent",
+    "StreamingPipelineAgent",
 ]
\ No newline at end of file
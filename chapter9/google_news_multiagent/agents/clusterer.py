@@ -0,0 +1,42 @@
+from langchain_core.messages import AIMessage
+
+from state import NewsState
+from config import Config
+from clustering import cluster_stories, story_text
+from token_budget import stage_input
+
+
+class StoryClusterAgent:
+    """같은 사건을 다룬 기사들을 스토리 하나로 묶는 에이전트 (요약/분류는 스토리 단위)"""
+
+    def __init__(self, threshold: float = None):
+        self.name = "Story Clusterer"
+        self.threshold = threshold or Config.STORY_CLUSTER_THRESHOLD
+
+    async def cluster_news(self, state: NewsState) -> NewsState:
+        """raw_news를 스토리 묶음(state.story_clusters)으로 나눕니다."""
+        print(f"\n[{self.name}] 스토리 묶기 시작...")
+
+        # ① 제목 + 분류용 도입부로 벡터화 후 평균 연결 병합 군집
+        texts = [story_text(news, stage_input(news, "category")) for news in state.raw_news]
+        clusters = cluster_stories(texts, self.threshold)
+
+        multi = [cluster for cluster in clusters if len(cluster) > 1]
+        saved = len(state.raw_news) - len(clusters)
+        state.story_clusters = clusters
+        state.run_stats["story_clusters"] = {
+            "articles": len(state.raw_news),
+            "stories": len(clusters),
+            "multi_source_stories": len(multi),
+            "llm_calls_saved": saved * 2,  # 요약 + 분류
+        }
+        print(
+            f"  기사 {len(state.raw_news)}건 → 스토리 {len(clusters)}개 "
+            f"(여러 기사로 묶인 스토리 {len(multi)}개)"
+        )
+
+        state.messages.append(
+            AIMessage(content=f"{len(state.raw_news)}개 기사를 {len(clusters)}개 스토리로 묶었습니다.")
+        )
+        print(f"[{self.name}] 스토리 묶기 완료\n")
+        return state
@@ -1,158 +1,556 @@
+import os
 import json
-import re
 import asyncio
+import hashlib
+import time
 from typing import Optional
+from urllib.parse import urlsplit
 
 import httpx
 import feedparser
 from pydantic.type_adapter import P
-import trafilatura
 from bs4 import BeautifulSoup
-from utils import convert_gmt_to_kst
+from utils import convert_gmt_to_kst, normalize_title, normalize_url
 from state import NewsState
+from config import Config
+from http_client import create_http_client, FetchScheduler, RETRYABLE_STATUS
+from extraction import ArticleExtractor, extract_chosun_content
+from cache import SQLiteCache, ArticleStore
+from metrics import RunMetrics
+from article import Article
+from decoder import (
+    build_decode_rpc,
+    build_request_payload,
+    parse_decode_response,
+    scan_data_p,
+)
 
 GOOGLE_NEWS_BASE_URL = "https://news.google.com"
 GOOGLE_NEWS_API_URL = f"{GOOGLE_NEWS_BASE_URL}/_/DotsSplashUi/data/batchexecute"
 
 KOREA_PARAMS = "hl=ko&gl=KR&ceid=KR:ko"
+BROWSER_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 
 class RSSCollectorAgent:
     """RSS 피드를 수집하는 에이전트"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        incremental: Optional[bool] = None,
+        rss_urls: Optional[list[str]] = None,
+        metrics: Optional[RunMetrics] = None,
+    ):
         self.name = "RSS Collector"
-        self.rss_url = f"{GOOGLE_NEWS_BASE_URL}/rss?{KOREA_PARAMS}"
-        self.feed=None
+        # 토픽/지역/검색 피드 등 여러 피드를 동시에 수집
+        self.rss_urls = list(rss_urls or Config.RSS_URLS)
+        self.api_url = GOOGLE_NEWS_API_URL
+        self.feeds: dict[str, feedparser.FeedParserDict] = {}
+        self._feed_validators: dict[str, dict] = {}
+        # 남은 항목 ID → 언론사 URL이 같아 제외한 항목 (남은 항목을 처리하면 함께 처리 완료로 기록)
+        self._url_duplicates: dict[str, list] = {}
+        # 다시 받아도 본문을 얻을 수 없는 원문 URL 키 (4xx, HTML 아닌 응답, 본문 추출 실패)
+        self._unfetchable: set[str] = set()
+        # 에이전트 수명 동안 재사용하는 커넥션 풀 (TLS 핸드셰이크/keep-alive 재사용)
+        self._client: Optional[httpx.AsyncClient] = None
+        # 전체/호스트별 동시성 제한 + 429·5xx·느린 응답 시 적응형 감속
+        self.scheduler = FetchScheduler(metrics=metrics)
+        self.extractor = ArticleExtractor()
+        # Google News 기사 ID → 원문 URL 영구 캐시 (반복 실행 시 GET/POST 왕복 생략)
+        self.url_cache = SQLiteCache(
+            path=os.path.join(Config.CACHE_DIR, "google_news_urls.sqlite3"),
+            table="decoded_urls",
+            ttl=Config.URL_CACHE_TTL,
+            max_entries=Config.URL_CACHE_MAX_ENTRIES,
+        )
+        # 정규화 URL → 추출 본문 저장소 (반복 실행 시 다운로드/추출 생략)
+        self.article_store = ArticleStore(
+            path=os.path.join(Config.CACHE_DIR, "articles.sqlite3"),
+            ttl=Config.ARTICLE_CACHE_TTL,
+            max_bytes=Config.ARTICLE_CACHE_MAX_BYTES,
+            store_html=Config.ARTICLE_CACHE_STORE_HTML,
+        )
+        # 증분 모드: 피드별 ETag/Last-Modified와 이미 처리한 항목의 지문을 보관
+        self.incremental = Config.INCREMENTAL if incremental is None else incremental
+        feed_state_path = os.path.join(Config.CACHE_DIR, "feed_state.sqlite3")
+        self.feed_validators = SQLiteCache(
+            path=feed_state_path,
+            table="feed_validators",
+            ttl=Config.SEEN_ENTRY_TTL,
+            max_entries=Config.SEEN_ENTRY_MAX_ENTRIES,
+        )
+        self.seen_entries = SQLiteCache(
+            path=feed_state_path,
+            table="seen_entries",
+            ttl=Config.SEEN_ENTRY_TTL,
+            max_entries=Config.SEEN_ENTRY_MAX_ENTRIES,
+        )
+        # 본문 수집에 실패한 항목의 지문과 실패 횟수 (실행 사이에도 보관)
+        self.failed_entries = SQLiteCache(
+            path=feed_state_path,
+            table="failed_entries",
+            ttl=Config.SEEN_ENTRY_TTL,
+            max_entries=Config.SEEN_ENTRY_MAX_ENTRIES,
+        )
 
-    def load_feed(self)-> None:
-        """RSS 피드를 로드합니다."""
-        self.feed=feedparser.parse(self.rss_url)
-    
+    @property
+    def metrics(self) -> RunMetrics:
+        """실행 지표 (요청 지연은 요청 스케줄러가 같은 객체에 기록)"""
+        return self.scheduler.metrics
+
+    @metrics.setter
+    def metrics(self, metrics: RunMetrics) -> None:
+        self.scheduler.metrics = metrics
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 HTTP 클라이언트 (최초 사용 시 생성)"""
+        if self._client is None:
+            self._client = create_http_client()
+        return self._client
+
+    async def aclose(self) -> None:
+        """공유 HTTP 클라이언트와 추출 워커 프로세스를 닫습니다."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        await asyncio.to_thread(self.extractor.shutdown)
+
+    async def __aenter__(self) -> "RSSCollectorAgent":
+        if self._client is None:
+            self._client = create_http_client()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def load_feed(self, rss_url: str) -> int:
+        """RSS 피드를 로드합니다. (증분 모드에서는 조건부 요청, 반환값은 HTTP 상태 코드)"""
+        headers = {}
+        if self.incremental and (validators := self.feed_validators.get(rss_url)):
+            validators = json.loads(validators)
+            if validators.get("etag"):
+                headers["if-none-match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["if-modified-since"] = validators["last_modified"]
+
+        response = await self.scheduler.request(
+            self.client, "GET", rss_url, headers=headers, follow_redirects=True
+        )
+
+        # 피드가 바뀌지 않았으면 파싱할 필요 없음
+        if response.status_code == 304:
+            self.feeds[rss_url] = feedparser.FeedParserDict(entries=[])
+            return response.status_code
+
+        response.raise_for_status()
+        self.feeds[rss_url] = feedparser.parse(response.content)
+        self._feed_validators[rss_url] = {
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+        }
+        return response.status_code
+
+    async def load_feeds(self, state: NewsState) -> dict[str, int]:
+        """모든 피드를 동시에 로드합니다. (실패한 피드는 오류만 기록하고 건너뜀)"""
+        results = await asyncio.gather(
+            *(self.load_feed(rss_url) for rss_url in self.rss_urls), return_exceptions=True
+        )
+        statuses = {}
+        for rss_url, result in zip(self.rss_urls, results):
+            if isinstance(result, Exception):
+                self.feeds.pop(rss_url, None)
+                print(f"RSS 피드 로드 실패 ({rss_url}): {result}")
+                state.error_log.append(f"RSSCollectorAgent: {rss_url} - {str(result)}")
+            else:
+                statuses[rss_url] = result
+        return statuses
+
+    @staticmethod
+    def merge_entries(feeds: list) -> list:
+        """여러 피드의 항목을 합치고 같은 기사(항목 ID/정규화 제목)는 하나만 남깁니다."""
+        merged = []
+        seen_ids = set()
+        seen_titles = set()
+        for feed in feeds:
+            for entry in feed.entries:
+                entry_id = entry.get("id") or entry.link
+                title_key = normalize_title(
+                    entry.get("title", ""), entry.get("source", {}).get("title", "")
+                )
+                if entry_id in seen_ids or (title_key and title_key in seen_titles):
+                    continue
+                seen_ids.add(entry_id)
+                if title_key:
+                    seen_titles.add(title_key)
+                merged.append(entry)
+        return merged
+
+    def dedupe_by_article_url(self, entries: list, decoded: dict[str, str]) -> list:
+        """디코딩된 언론사 URL이 같은 항목은 첫 번째만 남깁니다. (다운로드/요약 1회)"""
+        unique = []
+        first_ids: dict[str, str] = {}
+        for entry in entries:
+            url_key = normalize_url(decoded.get(self.google_news_url(entry), ""))
+            if url_key and url_key in first_ids:
+                self._url_duplicates.setdefault(first_ids[url_key], []).append(entry)
+                continue
+            if url_key:
+                first_ids[url_key] = self.entry_fingerprint(entry)[0]
+            unique.append(entry)
+        return unique
 
     @staticmethod
-    def extract_chosun_content(html_content):
-        """조선일보 기사 내용을 특별 처리합니다."""
-        pattern = r"Fusion\.globalContent\s*=\s*({.*?});"
-        match = re.search(pattern, html_content, re.DOTALL)
+    def entry_fingerprint(entry) -> tuple[str, str]:
+        """항목 ID와 내용 지문(제목/링크/발행·수정 시각)을 계산합니다."""
+        entry_id = entry.get("id") or entry.link
+        parts = [
+            entry.get("title", ""),
+            entry.link,
+            entry.get("published", ""),
+            entry.get("updated", ""),
+        ]
+        fingerprint = hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+        return entry_id, fingerprint
+
+    def select_new_entries(self, entries: list) -> list:
+        """이전 실행에서 처리하지 않았거나 내용이 바뀐 항목만 고릅니다."""
+        new_entries = []
+        for entry in entries:
+            entry_id, fingerprint = self.entry_fingerprint(entry)
+            if self.seen_entries.get(entry_id) != fingerprint:
+                new_entries.append(entry)
+        return new_entries
+
+
+    # 기존 호출부 호환용 (실제 구현은 extraction 모듈)
+    extract_chosun_content = staticmethod(extract_chosun_content)
+
+    @staticmethod
+    def google_news_article_id(google_news_url: str) -> str:
+        """Google News 기사 URL에서 기사 ID(경로 마지막 부분)를 추출합니다."""
+        return urlsplit(google_news_url).path.rstrip("/").rsplit("/", 1)[-1]
 
-        if match:
-            try:
-                content_data = json.loads(match.group(1))
-                texts=[]
-                if "content_elements" in content_data:
-                    for element in content_data["content_elements"]:
-                        if element.get("type") == "text" and "content" in element:
-                            texts.append(element["content"])
-                return"\n\n".join(texts)
-            except json.JSONDecodeError:
-                pass
-        return ""
     async def extract_article_url(self, google_news_url: str) -> Optional[str]:
+        """캐시를 먼저 확인하고, 없으면 Google News에서 원문 URL을 디코딩합니다."""
+        article_id = self.google_news_article_id(google_news_url)
+        if cached_url := self.url_cache.get(article_id):
+            return cached_url
+
+        article_url = await self.decode_article_url(google_news_url)
+        if article_url:
+            self.url_cache.set(article_id, article_url)
+        return article_url
+
+    async def fetch_data_p(self, google_news_url: str) -> Optional[str]:
+        """Google News 기사 페이지에서 c-wiz[data-p] 값을 가져옵니다."""
+        response = await self.scheduler.request(self.client, "GET", google_news_url)
+
+        # 정규식으로 속성만 빠르게 찾고, 실패하면 BeautifulSoup 전체 파싱으로 대체
+        if data_p := scan_data_p(response.text):
+            return data_p
+        return self.parse_data_p(response.text)
+
+    @staticmethod
+    def parse_data_p(page_html: str) -> Optional[str]:
+        """BeautifulSoup으로 c-wiz[data-p] 값을 찾습니다. (느리지만 견고한 경로)"""
+        soup = BeautifulSoup(page_html, "html.parser")
+
+        # c-wiz 태그에서 데이터 추출
+        data_element = soup.select_one("c-wiz[data-p]")
+        return data_element.get("data-p") if data_element else None
+
+    async def post_batchexecute(self, rpcs: list[list]) -> str:
+        """Google 내부 API(batchexecute)에 RPC 묶음을 전송합니다."""
+        headers = {
+            "content-type": "application/x-www-form-urlencoded;charset=UTF-8",
+            "user-agent": BROWSER_USER_AGENT,
+        }
+        api_response = await self.scheduler.request(
+            self.client, "POST", self.api_url, headers=headers, data=build_request_payload(rpcs)
+        )
+        return api_response.text
+
+    async def decode_article_url(self, google_news_url: str) -> Optional[str]:
         """
         ③ Stack Overflow 솔루션 활용
         참조: https://stackoverflow.com/questions/79388897/how-to-scrape-google-rssfeed-links/79388987#79388987
         Google News는 JavaScript를 사용하여 페이지를 리다이렉션 시키므로 내부 API를 직접 호출하여 우회
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(google_news_url)
-                soup = BeautifulSoup(response.text, "html.parser")
-
-                # c-wiz 태그에서 데이터 추출
-                data_element = soup.select_one("c-wiz[data-p]")
-                if not data_element:
-                    return None
-
-                # API 요청 페이로드 구성
-                raw_data = data_element.get("data-p")
-                json_data = json.loads(raw_data.replace("%.@.", '["garturlreq",'))
-                payload = {
-                    "f.req": json.dumps(
-                        [
-                            [
-                                [
-                                    "Fbv4je",
-                                    json.dumps(json_data[:-6] + json_data[-2:]),
-                                    "null",
-                                    "generic",
-                                ]
-                            ]
-                        ]
-                    )
-                }
-
-                headers = {
-                    "content-type": "application/x-www-form-urlencoded;charset=UTF-8",
-                    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                }
-
-                # Google 내부 API 호출
-                api_response = await client.post(
-                    GOOGLE_NEWS_API_URL, headers=headers, data=payload
-                )
-                cleaned_response = api_response.text.replace(")]}'", "")
-                response_data = json.loads(cleaned_response)
-                article_url = json.loads(response_data[0][2])[1]
-                return article_url
+        try:
+            data_p = await self.fetch_data_p(google_news_url)
+            if not data_p:
+                return None
+
+            response_text = await self.post_batchexecute([build_decode_rpc(data_p)])
+            return parse_decode_response(response_text).get("generic")
+
+        except Exception:
+            return None
 
+    async def decode_article_urls(self, google_news_urls: list[str]) -> dict[str, str]:
+        """여러 기사의 RPC를 묶어 batchexecute POST 몇 번으로 한꺼번에 디코딩합니다."""
+        # ① 기사 페이지에서 data-p 값을 동시에 수집
+        data_ps = await asyncio.gather(
+            *(self.fetch_data_p(url) for url in google_news_urls), return_exceptions=True
+        )
+        pending = [
+            (url, data_p)
+            for url, data_p in zip(google_news_urls, data_ps)
+            if isinstance(data_p, str) and data_p
+        ]
+
+        # ② DECODE_BATCH_SIZE개씩 RPC를 묶어 전송 (RPC 인덱스는 "1"부터)
+        async def decode_chunk(chunk: list[tuple[str, str]]) -> dict[str, str]:
+            rpcs = []
+            for i, (_, data_p) in enumerate(chunk, 1):
+                try:
+                    rpcs.append(build_decode_rpc(data_p, str(i)))
+                except (ValueError, TypeError):
+                    continue
+            if not rpcs:
+                return {}
+            try:
+                decoded = parse_decode_response(await self.post_batchexecute(rpcs))
             except Exception:
+                return {}
+            # ③ 응답의 RPC 인덱스로 원래 기사에 매핑
+            return {
+                url: decoded[str(i)]
+                for i, (url, _) in enumerate(chunk, 1)
+                if decoded.get(str(i))
+            }
+
+        batch_size = Config.DECODE_BATCH_SIZE
+        chunks = [pending[i : i + batch_size] for i in range(0, len(pending), batch_size)]
+        results = await asyncio.gather(*(decode_chunk(chunk) for chunk in chunks))
+        return {url: article_url for result in results for url, article_url in result.items()}
+
+    async def resolve_article_urls(self, google_news_urls: list[str]) -> dict[str, str]:
+        """캐시에 없는 기사만 일괄 디코딩하여 {Google News URL: 원문 URL}을 반환합니다."""
+        resolved = {}
+        misses = []
+        for url in google_news_urls:
+            if cached_url := self.url_cache.get(self.google_news_article_id(url)):
+                resolved[url] = cached_url
+            else:
+                misses.append(url)
+
+        if misses:
+            decoded = await self.decode_article_urls(misses)
+            # 일괄 응답에서 빠진 기사는 단건 경로로 한 번 더 시도
+            retry = [url for url in misses if url not in decoded]
+            retried = await asyncio.gather(*(self.decode_article_url(url) for url in retry))
+            decoded.update(
+                {url: article_url for url, article_url in zip(retry, retried) if article_url}
+            )
+            for url, article_url in decoded.items():
+                self.url_cache.set(self.google_news_article_id(url), article_url)
+            resolved.update(decoded)
+        return resolved
+
+    async def download_article(self, url: str) -> Optional[bytes]:
+        """기사 HTML을 공유 클라이언트로 스트리밍 다운로드합니다. (이벤트 루프를 막지 않음)"""
+        for attempt in range(Config.FETCH_MAX_RETRIES + 1):
+            chunks = []
+            size = 0
+            try:
+                # 슬롯을 얻은 뒤부터 기사 한 건의 전체 다운로드 시간을 제한 (연결/읽기 타임아웃과 별개)
+                async with self.scheduler.slot(url) as ticket:
+                    async with asyncio.timeout(Config.ARTICLE_TIMEOUT):
+                        async with self.client.stream(
+                            "GET",
+                            url,
+                            headers={"user-agent": BROWSER_USER_AGENT},
+                            follow_redirects=True,
+                        ) as response:
+                            ticket.update(response)
+                            status = response.status_code
+                            if status == 200:
+                                content_type = response.headers.get("content-type", "")
+                                if content_type and "html" not in content_type:
+                                    self._unfetchable.add(normalize_url(url))
+                                    return None
+
+                                async for chunk in response.aiter_bytes():
+                                    chunks.append(chunk)
+                                    size += len(chunk)
+                                    # 크기 상한을 넘으면 나머지는 받지 않음 (본문은 보통 앞부분에 위치)
+                                    if size >= Config.ARTICLE_MAX_BYTES:
+                                        break
+            except (httpx.HTTPError, TimeoutError):
                 return None
 
-    async def parse_entry(self, entry) -> dict[str, Optional[str]]:
-        """RSS 피드 항목을 파싱합니다."""
-        google_news_url = entry.link + KOREA_PARAMS
+            # 429/5xx는 스케줄러가 정한 백오프 후 재시도
+            if status in RETRYABLE_STATUS and attempt < Config.FETCH_MAX_RETRIES:
+                self.scheduler.retries += 1
+                continue
+            if status != 200:
+                if 400 <= status < 500 and status not in RETRYABLE_STATUS and status != 408:
+                    self._unfetchable.add(normalize_url(url))
+                return None
+            return b"".join(chunks)[: Config.ARTICLE_MAX_BYTES] or None
+        return None
+
+    async def fetch_article_content(self, original_url: str) -> str:
+        """저장소에 있으면 바로 반환하고, 없으면 다운로드 → 추출 후 저장합니다."""
+        url_key = normalize_url(original_url)
+        if cached := self.article_store.get(url_key):
+            return cached["text"]
+
+        downloaded = await self.download_article(original_url)
+        if not downloaded:
+            return ""
 
+        # ⑤ CPU를 쓰는 본문 추출은 프로세스 풀에서 (루프는 계속 다운로드)
+        content = await self.extractor.extract(original_url, downloaded)
+        if content:
+            self.article_store.put(url_key, content, downloaded)
+        else:
+            self._unfetchable.add(url_key)
+        return content
+
+    @staticmethod
+    def google_news_url(entry) -> str:
+        return entry.link + KOREA_PARAMS
+
+    async def parse_entry(self, entry) -> Article:
+        """RSS 피드 항목을 파싱합니다."""
         # ④ 실제 기사 URL 추출 및 내용 수집
-        original_url = await self.extract_article_url(google_news_url)
+        original_url = await self.extract_article_url(self.google_news_url(entry))
+        return await self.build_news_item(entry, original_url)
+
+    async def build_news_item(self, entry, original_url: Optional[str]) -> Article:
+        """원문 URL이 확인된 항목의 본문을 내려받아 뉴스 항목을 구성합니다."""
+        google_news_url = self.google_news_url(entry)
         content = ""
 
+        started = time.perf_counter()
         if original_url:
-            downloaded = trafilatura.fetch_url(original_url)
-
-            if downloaded:
-                # 모바일 헬스 조선은 리액트 아님
-                if (
-                    "m.health.chosun.com" not in original_url
-                    and "chosun.com" in original_url
-                ):
-                    content = self.extract_chosun_content(downloaded)
-                else:
-                    # ⑤ trafilatura로 일반 기사 추출 (한국어 최적화)
-                    content = trafilatura.extract(
-                        downloaded,
-                        include_comments=False,
-                        include_images=False,
-                        include_links=False,
-                        target_language="ko",
-                    )
-
-        return {
-            "title": entry.title,
-            "published_kst": convert_gmt_to_kst(entry.published),
-            "source": entry.source.get("title", "Unknown"),
-            "google_news_url": google_news_url,
-            "original_url": original_url,
-            "content": content or "",
+            content = await self.fetch_article_content(original_url)
+        self.metrics.observe_article(time.perf_counter() - started, entry.title, stage="collect")
+
+        # 요약/분류 단계 입력 길이는 Article 생성 시 토큰 예산에 맞춰 한 번만 계산
+        return Article(
+            title=entry.title,
+            content=content or "",
+            source=entry.source.get("title", "Unknown"),
+            published_kst=convert_gmt_to_kst(entry.published),
+            google_news_url=google_news_url,
+            original_url=original_url,
+        )
+
+    def give_up(self, entry_id: str, fingerprint: str, news: Article) -> bool:
+        """본문 수집에 실패한 항목을 더 재시도하지 않을지 판단합니다. (실패 횟수 기록)"""
+        if news.original_url and normalize_url(news.original_url) in self._unfetchable:
+            return True
+        record = json.loads(self.failed_entries.get(entry_id) or "{}")
+        attempts = record.get("attempts", 0) + 1 if record.get("fingerprint") == fingerprint else 1
+        if attempts >= Config.SEEN_ENTRY_MAX_ATTEMPTS:
+            return True
+        self.failed_entries.set(
+            entry_id, json.dumps({"fingerprint": fingerprint, "attempts": attempts})
+        )
+        return False
+
+    def mark_seen(self, entries: list, raw_news: list[Article]) -> None:
+        """본문까지 수집한 항목을 처리 완료로 기록합니다.
+
+        실패한 항목은 다음 실행에서 재시도하고, SEEN_ENTRY_MAX_ATTEMPTS번 실패했거나
+        다시 받아도 소용없는 실패(4xx, HTML 아닌 응답, 본문 추출 실패)면 처리 완료로 기록합니다.
+        """
+        all_done = True
+        for entry, news in zip(entries, raw_news):
+            entry_id, fingerprint = self.entry_fingerprint(entry)
+            if not news.content and not self.give_up(entry_id, fingerprint, news):
+                all_done = False
+                continue
+            self.seen_entries.set(entry_id, fingerprint)
+            # 같은 언론사 URL이라 제외한 항목도 다시 읽어 디코딩하지 않도록 함께 기록
+            for duplicate in self._url_duplicates.get(entry_id, []):
+                self.seen_entries.set(*self.entry_fingerprint(duplicate))
+
+        # 재시도할 항목이 없을 때만 검증자를 저장 (304로 재시도 항목을 놓치지 않도록)
+        if all_done:
+            for rss_url, validators in self._feed_validators.items():
+                self.feed_validators.set(rss_url, json.dumps(validators))
+
+    async def select_entries(self, state: NewsState) -> tuple[list, dict[str, str]]:
+        """피드를 읽어 본문을 받을 항목과 {Google News URL: 원문 URL}을 반환합니다."""
+        self.url_cache.reset_stats()
+        self.article_store.reset_stats()
+        self.scheduler.reset_stats()
+        self._feed_validators = {}
+        self._url_duplicates = {}
+        self._unfetchable = set()
+        feed_status = await self.load_feeds(state)
+
+        # ⑥ 여러 피드의 항목을 합치면서 같은 기사는 한 번만 처리
+        feed_entries = sum(
+            len(self.feeds[rss_url].entries) for rss_url in feed_status
+        )
+        entries = self.merge_entries([self.feeds[rss_url] for rss_url in feed_status])
+        merged_count = len(entries)
+        if self.incremental:
+            # 새로 나왔거나 바뀐 항목만 본문 수집/LLM 단계로 보냄
+            entries = self.select_new_entries(entries)
+            state.run_stats["incremental"] = {
+                "feed_status": feed_status,
+                "new_entries": len(entries),
+                "skipped_entries": merged_count - len(entries),
+            }
+            print(
+                f"증분 수집: 새 항목 {len(entries)}건 / "
+                f"건너뜀 {merged_count - len(entries)}건"
+            )
+
+        # ⑦ 원문 URL을 일괄 디코딩하고, 같은 언론사 URL은 다시 한 번 중복 제거
+        decoded = await self.resolve_article_urls(
+            [self.google_news_url(entry) for entry in entries]
+        )
+        entries = self.dedupe_by_article_url(entries, decoded)
+        state.run_stats["dedup"] = {
+            "feeds": len(feed_status),
+            "feed_entries": feed_entries,
+            "unique_entries": len(entries),
         }
+        print(f"피드 {len(feed_status)}개, 항목 {feed_entries}건 → 중복 제거 후 {len(entries)}건")
+        return entries, decoded
+
+    def finish_collect(self, state: NewsState, entries: list, raw_news: list[Article]) -> None:
+        """수집 결과와 캐시/요청 통계를 상태에 기록합니다."""
+        if self.incremental:
+            self.mark_seen(entries, raw_news)
+
+        state.raw_news = raw_news
+        state.run_stats["url_cache"] = self.url_cache.stats()
+        state.run_stats["article_cache"] = self.article_store.stats()
+        state.run_stats["fetch"] = self.scheduler.stats()
 
     async def collect_rss(self, state: NewsState) -> NewsState:
         """RSS 피드를 수집하고 상태를 업데이트합니다."""
         print("--- RSS 피드 수집 시작 ---")
 
+        # 외부(async with)에서 클라이언트 수명을 관리하지 않으면 이번 실행 후 닫음
+        managed = self._client is not None
         try:
-            if not self.feed:
-                self.load_feed()
+            entries, decoded = await self.select_entries(state)
 
-            # ⑥ 비동기로 모든 엔트리 동시 처리 (성능 최적화)
-            tasks = [self.parse_entry(entry) for entry in self.feed.entries]
+            # ⑧ 모든 엔트리를 비동기로 동시 처리
+            tasks = [
+                self.build_news_item(entry, decoded.get(self.google_news_url(entry)))
+                for entry in entries
+            ]
             raw_news = await asyncio.gather(*tasks)
 
-            state.raw_news = raw_news
+            self.finish_collect(state, entries, raw_news)
             print(f"총 {len(raw_news)}개의 뉴스 기사 수집 완료")
 
         except Exception as e:
             print(f"RSS 피드 수집 중 오류 발생: {e}")
             state.error_log.append(f"RSSCollectorAgent: {str(e)}")
+        finally:
+            if not managed:
+                await self.aclose()
 
         return state
 
@@ -0,0 +1,64 @@
+from langchain_core.messages import AIMessage
+
+from state import NewsState
+from config import Config
+from near_dup import MinHashLSH
+
+
+class NearDuplicateAgent:
+    """같은 사건을 거의 같은 본문으로 보도한 기사를 묶어 대표 기사만 남기는 에이전트"""
+
+    def __init__(self, threshold: float = None, llm_calls_per_article: int = 2):
+        self.name = "Near-Duplicate Filter"
+        self.index = MinHashLSH(
+            threshold=threshold or Config.NEAR_DUP_THRESHOLD,
+            num_perm=Config.NEAR_DUP_NUM_PERM,
+        )
+        # 기사 한 건당 이후 단계의 LLM 호출 수 (요약 + 분류 = 2, 통합 노드 = 1)
+        self.llm_calls_per_article = llm_calls_per_article
+
+    async def dedupe_news(self, state: NewsState) -> NewsState:
+        """유사 중복 기사를 그룹으로 묶고 대표 기사에 다른 출처를 붙입니다."""
+        print(f"\n[{self.name}] 유사 중복 기사 탐지 시작...")
+
+        # ① 본문이 있는 기사만 비교 (본문 없는 기사는 그대로 유지)
+        with_content = [i for i, news in enumerate(state.raw_news) if news.content]
+        groups = self.index.group([state.raw_news[i].content for i in with_content])
+
+        keep = set(range(len(state.raw_news))) - set(with_content)
+        representatives = {}
+        for group in groups:
+            members = [with_content[i] for i in group]
+            # ② 본문이 가장 긴 기사를 대표로 (같으면 피드에서 먼저 나온 기사)
+            leader = max(members, key=lambda i: (len(state.raw_news[i].content), -i))
+            keep.add(leader)
+            if len(members) > 1:
+                representatives[leader] = [i for i in members if i != leader]
+
+        # ③ 대표 기사에 나머지 기사의 출처/제목/링크를 붙여 원래 순서대로 유지
+        deduped = []
+        for i in sorted(keep):
+            news = state.raw_news[i]
+            if i in representatives:
+                news.annotate(other_sources=[state.raw_news[j].reference() for j in representatives[i]])
+            deduped.append(news)
+
+        removed = len(state.raw_news) - len(deduped)
+        state.run_stats["near_dup"] = {
+            "groups": len(representatives),
+            "duplicates": removed,
+            "summarize_llm_calls_saved": removed,
+            "categorize_llm_calls_saved": removed if self.llm_calls_per_article > 1 else 0,
+            "llm_calls_saved": removed * self.llm_calls_per_article,
+        }
+        print(
+            f"  유사 중복 그룹 {len(representatives)}개, 제외 {removed}건 "
+            f"→ LLM 호출 약 {removed * self.llm_calls_per_article}건 절약"
+        )
+
+        state.raw_news = deduped
+        state.messages.append(
+            AIMessage(content=f"유사 중복 기사 {removed}건을 대표 기사로 묶었습니다.")
+        )
+        print(f"[{self.name}] 중복 탐지 완료\n")
+        return state
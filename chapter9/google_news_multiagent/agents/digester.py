@@ -0,0 +1,161 @@
+import hashlib
+import json
+import os
+from collections import defaultdict
+from typing import Literal, Optional
+
+from pydantic import Field, create_model
+from langchain_openai import ChatOpenAI
+from langchain_core.messages import AIMessage
+from langchain_core.prompts import ChatPromptTemplate
+
+from state import NewsState
+from article import Article
+from config import Config
+from cache import SQLiteCache
+from llm_scheduler import LLMScheduler
+from token_budget import estimate_tokens, stage_input
+from dotenv import load_dotenv
+load_dotenv()
+
+
+class NewsDigestAgent:
+    """요약과 카테고리 분류를 LLM 호출 한 번으로 처리하는 에이전트 (요약 → 분류 2단계 대체)"""
+
+    def __init__(self, llm: ChatOpenAI, scheduler: Optional[LLMScheduler] = None):
+        self.name = "News Digester"
+        self.llm = llm
+        self.scheduler = scheduler or LLMScheduler()
+        self.metrics = self.scheduler.metrics
+        self.categories = Config.NEWS_CATEGORIES + ["기타"]
+
+        # ① 카테고리를 Config.NEWS_CATEGORIES 값으로 제한한 구조화 출력 스키마
+        self.schema = create_model(
+            "NewsDigest",
+            summary=(str, Field(description="뉴스 핵심 2-3문장 요약")),
+            category=(
+                Literal[tuple(Config.NEWS_CATEGORIES)],
+                Field(description="뉴스 카테고리"),
+            ),
+        )
+        self.prompt = ChatPromptTemplate.from_messages(
+            [
+                (
+                    "system",
+                    f"""당신은 전문 뉴스 요약·분류 전문가입니다.
+                    주어진 뉴스를 핵심만 간결하게 2-3문장으로 요약하고,
+                    다음 카테고리 중 하나로 분류해주세요: {", ".join(Config.NEWS_CATEGORIES)}
+                    - 사실만을 전달하고 추측은 피하세요
+                    - 중요한 숫자나 날짜는 포함하세요
+                    - 명확하고 이해하기 쉽게 작성하세요""",
+                ),
+                ("human", "제목: {title}\n내용: {content}\n\n위 뉴스의 요약과 카테고리:"),
+            ]
+        )
+        self.chain = self.prompt | self.llm.with_structured_output(self.schema)
+
+        # ② 요약+카테고리 영구 캐시 (요약 캐시와 같은 파일, 별도 테이블)
+        self.digest_cache = SQLiteCache(
+            path=os.path.join(Config.CACHE_DIR, "summaries.sqlite3"),
+            table="digests",
+            ttl=Config.SUMMARY_CACHE_TTL,
+            max_entries=Config.SUMMARY_CACHE_MAX_ENTRIES,
+        )
+        template = "\n".join(message.prompt.template for message in self.prompt.messages)
+        self._key_prefix = hashlib.sha256(
+            f"{template}\0{Config.MODEL_NAME}\0{Config.MAX_TOKENS}\0".encode("utf-8")
+        )
+
+    def digest_cache_key(self, news_item: Article) -> str:
+        digest = self._key_prefix.copy()
+        digest.update(f"{news_item.title}\0{stage_input(news_item, 'summary')}".encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def estimate_request_tokens(news_item: Article) -> int:
+        """요청 한 건의 토큰 사용량 추정 (입력 + 최대 출력)"""
+        return (
+            estimate_tokens(news_item.title + stage_input(news_item, "summary"))
+            + Config.MAX_TOKENS
+        )
+
+    def cached_digest(self, news_item: Article) -> Optional[tuple[str, Article]]:
+        """캐시된 요약·분류가 있으면 (카테고리, 요약을 덧붙인 기사), 없으면 None"""
+        if (cached := self.digest_cache.get(self.digest_cache_key(news_item))) is None:
+            return None
+        result = json.loads(cached)
+        return result["category"], news_item.annotate(ai_summary=result["summary"])
+
+    async def digest_single_news(self, news_item: Article) -> tuple[str, Article]:
+        """단일 뉴스 요약 + 분류 (오류 시 원본 내용과 '기타' 반환)"""
+        if (cached := self.cached_digest(news_item)) is not None:
+            return cached
+        return await self.request_digest(news_item)
+
+    async def digest_streamed(self, news_item: Article) -> tuple[str, Article]:
+        """스트리밍 모드 기사 한 건 요약·분류 (캐시 → 스케줄러 한도 안에서 LLM 요청)"""
+        if (cached := self.cached_digest(news_item)) is not None:
+            return cached
+        return await self.scheduler.run(
+            lambda: self.request_digest(news_item), self.estimate_request_tokens(news_item)
+        )
+
+    async def request_digest(self, news_item: Article) -> tuple[str, Article]:
+        """LLM으로 요약 + 분류하고 캐시에 저장 (오류 시 원본 내용과 '기타' 반환)"""
+        content = news_item.content
+        key = self.digest_cache_key(news_item)
+        try:
+            response = await self.chain.ainvoke(
+                {"title": news_item.title, "content": stage_input(news_item, "summary")}
+            )
+        except Exception as e:
+            self.metrics.count_error("NewsDigestAgent")
+            print(
+                f"  [{self.name}] 요약/분류 오류 (Title: {news_item.title}): {str(e)[:50]}..."
+            )
+            return "기타", news_item.annotate(ai_summary=content)
+
+        # ③ 본문이 너무 짧으면 요약 대신 원문 유지 (2단계 방식과 동일)
+        summary = response.summary.strip()
+        if len(content) < 50 or not summary:
+            summary = content
+        self.digest_cache.set(
+            key,
+            json.dumps({"summary": summary, "category": response.category}, ensure_ascii=False),
+        )
+        return response.category, news_item.annotate(ai_summary=summary)
+
+    async def digest_news(self, state: NewsState) -> NewsState:
+        """모든 뉴스를 요약하고 카테고리별로 정리"""
+        print(f"\n[{self.name}] 뉴스 요약·분류 시작...")
+        self.digest_cache.reset_stats()
+
+        results = await self.scheduler.map(
+            self.digest_single_news,
+            state.raw_news,
+            cost=self.estimate_request_tokens,
+            label="요약·분류",
+        )
+
+        # ④ 요약 목록과 카테고리별 인덱스 목록을 2단계 방식과 같은 형태로 저장 (보고서 에이전트 그대로 사용)
+        categorized = defaultdict(list)
+        for i, (category, _) in enumerate(results):
+            categorized[category if category in Config.NEWS_CATEGORIES else "기타"].append(i)
+
+        print("\n  카테고리별 분포:")
+        for category in self.categories:
+            if count := len(categorized.get(category, [])):
+                print(f"    {category}: {count}건")
+
+        state.summarized_news = [news_item for _, news_item in results]
+        state.categorized_news = dict(categorized)
+        state.run_stats["summary_cache"] = self.digest_cache.stats()
+        state.messages.append(
+            AIMessage(
+                content=f"{len(results)}개의 뉴스를 요약하고 "
+                f"{len(categorized)}개 카테고리로 분류했습니다."
+            )
+        )
+
+        print(f"[{self.name}] 요약·분류 완료\n")
+        return state
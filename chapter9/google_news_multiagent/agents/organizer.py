@@ -1,22 +1,39 @@
 # chapter9/google_news_multiagent/agents/organizer.py
-import asyncio
-from typing import Dict, Any, Tuple
+import zlib
+from typing import Optional, Tuple
 from collections import defaultdict
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import AIMessage
 from langchain_core.prompts import ChatPromptTemplate
 
 from state import NewsState
+from article import Article
 from config import Config
+from llm_scheduler import LLMScheduler
+from token_budget import estimate_tokens, stage_input
+from classifier import LocalCategoryClassifier, label_store, model_path, record_label
 from dotenv import load_dotenv
 load_dotenv()
 
 class NewsOrganizerAgent:
     """뉴스를 카테고리별로 정리하는 에이전트"""
 
-    def __init__(self, llm: ChatOpenAI):
+    def __init__(
+        self,
+        llm: ChatOpenAI,
+        scheduler: Optional[LLMScheduler] = None,
+        classifier: Optional[LocalCategoryClassifier] = None,
+    ):
         self.name = "News Organizer"
         self.llm = llm
+        self.scheduler = scheduler or LLMScheduler()
+        self.metrics = self.scheduler.metrics
+        # 로컬 분류기로 먼저 분류하고 확신도가 낮은 기사만 LLM 호출 (모델 파일이 없으면 LLM만 사용)
+        if classifier is None and Config.LOCAL_CLASSIFIER:
+            classifier = LocalCategoryClassifier.load(model_path())
+        self.classifier = classifier
+        # LLM 분류 결과는 분류기 재학습용으로 기록
+        self.labels = label_store()
         # '기타' 카테고리를 추가하여 예상치 못한 응답에 대비합니다.
         self.categories = Config.NEWS_CATEGORIES + ["기타"]
 
@@ -34,65 +51,159 @@ class NewsOrganizerAgent:
         )
         self.chain = self.categorize_prompt | self.llm
 
+    @staticmethod
+    def category_text(news_item: Article) -> str:
+        """분류 입력 - AI 요약, 요약이 없거나 실패해 원문이면 분류 예산으로 자른 본문"""
+        summary = news_item.ai_summary
+        if not summary or summary == news_item.content:
+            return stage_input(news_item, "category")
+        return summary
+
     async def categorize_single_news(
-        self, news_item: Dict[str, Any]
-    ) -> Tuple[str, Dict[str, Any]]:
+        self, news_item: Article
+    ) -> Tuple[str, Article]:
         """단일 뉴스의 카테고리 판단"""
         # ① LLM 비동기 호출로 뉴스 분류
         response = await self.chain.ainvoke(
             {
-                "title": news_item["title"],
-                "summary": news_item.get("ai_summary", news_item["content"]),
+                "title": news_item.title,
+                "summary": self.category_text(news_item),
             }
         )
         # ② LLM 응답에서 카테고리 추출
         category = response.content.strip()
+        if category in Config.NEWS_CATEGORIES:
+            record_label(self.labels, news_item.title, self.category_text(news_item), category)
         return category, news_item
 
+    @staticmethod
+    def is_audit_sample(news_item: Article) -> bool:
+        """제목 해시로 고정된 일부 기사 (실행마다 같은 기사가 검증 대상)"""
+        bucket = zlib.crc32(news_item.title.encode("utf-8")) % 10000
+        return bucket < Config.CLASSIFIER_AUDIT_RATE * 10000
+
+    def classify_locally(
+        self, summarized_news: list[Article]
+    ) -> Tuple[dict[int, str], dict[int, Tuple[str, bool]], list[int]]:
+        """로컬 분류 → (확정 {인덱스: 카테고리}, {인덱스: (예측, 확신 여부)}, LLM 필요 인덱스)"""
+        if self.classifier is None:
+            return {}, {}, list(range(len(summarized_news)))
+
+        decided, predicted, pending = {}, {}, []
+        for i, news in enumerate(summarized_news):
+            category, confidence = self.classifier.predict(news.title, self.category_text(news))
+            confident = confidence >= Config.CLASSIFIER_THRESHOLD
+            predicted[i] = (category, confident)
+            if confident and not self.is_audit_sample(news):
+                decided[i] = category
+            else:
+                pending.append(i)
+        return decided, predicted, pending
+
+    async def categorize_streamed(self, news_item: Article) -> Optional[str]:
+        """스트리밍 모드 기사 한 건 분류 (로컬 분류 → 필요하면 LLM, 실패하면 로컬 예측 또는 None)"""
+        predicted = None
+        if self.classifier is not None:
+            category, confidence = self.classifier.predict(
+                news_item.title, self.category_text(news_item)
+            )
+            predicted = category
+            if confidence >= Config.CLASSIFIER_THRESHOLD and not self.is_audit_sample(news_item):
+                return category
+        try:
+            category, _ = await self.scheduler.run(
+                lambda: self.categorize_single_news(news_item),
+                estimate_tokens(news_item.title + self.category_text(news_item)),
+            )
+            return category
+        except Exception as e:
+            self.metrics.count_error("NewsOrganizerAgent")
+            print(f"    분류 작업 실패: {e}")
+            return predicted
+
+    @staticmethod
+    def group_by_category(decided: dict[int, str]) -> dict[str, list[int]]:
+        """{인덱스: 카테고리}를 카테고리별 인덱스 목록으로 (정의되지 않은 카테고리는 '기타')"""
+        categorized = defaultdict(list)
+        for i in sorted(decided):
+            category = decided[i]
+            if category not in Config.NEWS_CATEGORIES:
+                category = "기타"
+            categorized[category].append(i)
+        return dict(categorized)
+
+    def print_distribution(self, categorized: dict[str, list[int]]) -> None:
+        print("\n  카테고리별 분포:")
+        for category in self.categories:
+            count = len(categorized.get(category, []))
+            if count > 0:
+                print(f"    {category}: {count}건")
+
     async def organize_news(self, state: NewsState) -> NewsState:
         """뉴스를 카테고리별로 정리"""
         print(f"\n[{self.name}] 뉴스 분류 시작...")
 
+        # ③ 분류 대상 (요약 단계 결과)
         summarized_news = state.summarized_news
-        total_news = len(summarized_news)
-        batch_size = Config.BATCH_SIZE
-        # ③ 분류된 뉴스 저장을 위한 dict
-        categorized = defaultdict(list)
 
-        # ④ 배치 처리를 위한 루프
-        for i in range(0, total_news, batch_size):
-            batch = summarized_news[i : i + batch_size]
-            batch_num = i // batch_size + 1
-            total_batches = (total_news + batch_size - 1) // batch_size
+        if near_dup := state.run_stats.get("near_dup"):
+            print(f"  유사 중복 제외로 절약한 분류 호출: {near_dup['categorize_llm_calls_saved']}건")
 
-            print(f"  배치 {batch_num}/{total_batches} 분류 중...")
+        # ④ 로컬 분류기로 먼저 분류 (확신도가 낮거나 검증 표본인 기사만 LLM으로)
+        decided, predicted, pending = self.classify_locally(summarized_news)
 
-            # ⑤ 비동기 분류 작업 생성
-            tasks = [self.categorize_single_news(news) for news in batch]
-            # ⑥ 모든 분류 작업 병렬 실행
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for result in results:
-                if isinstance(result, Exception):
-                    print(f"    분류 작업 실패: {result}")
-                    continue
+        # ⑤ 슬라이딩 윈도 스케줄링으로 LLM 분류 작업 실행 (결과는 입력 순서 유지)
+        results = await self.scheduler.map(
+            self.categorize_single_news,
+            [summarized_news[i] for i in pending],
+            cost=lambda news: estimate_tokens(news.title + self.category_text(news)),
+            return_exceptions=True,
+            label="분류",
+        )
 
-                category, news_item = result
-                # ⑦ 반환된 카테고리 유효성 검사
-                if category in Config.NEWS_CATEGORIES:
-                    categorized[category].append(news_item)
-                else:
-                    # ⑧ 정의되지 않은 카테고리는 '기타'로 처리
-                    categorized["기타"].append(news_item)
+        # 로컬 예측과 LLM 라벨 비교 (확신도 높은 검증 표본 / 확신도 낮은 기사)
+        agreement = {True: [0, 0], False: [0, 0]}
+        for i, result in zip(pending, results):
+            # ⑥ 실패한 작업은 로컬 예측이 있으면 그대로 사용, 없으면 건너뜀
+            if isinstance(result, Exception):
+                self.metrics.count_error("NewsOrganizerAgent")
+                print(f"    분류 작업 실패: {result}")
+                if i in predicted:
+                    decided[i] = predicted[i][0]
+                continue
+            category, _ = result
+            decided[i] = category
+            if i in predicted:
+                local_category, confident = predicted[i]
+                agreement[confident][0] += local_category == category
+                agreement[confident][1] += 1
+
+        # ⑦ 반환된 카테고리 유효성 검사 (정의되지 않은 카테고리는 '기타'로 처리)
+        categorized = self.group_by_category(decided)
+
+        if self.classifier is not None:
+            avoided = len(summarized_news) - len(pending)
+            rates = {
+                confident: agreed / compared if compared else None
+                for confident, (agreed, compared) in agreement.items()
+            }
+            state.run_stats["local_classifier"] = {
+                "llm_calls_avoided": avoided,
+                "llm_calls": len(pending),
+                "audited": agreement[True][1],
+                "agreement": rates[True],
+                "low_confidence_agreement": rates[False],
+            }
+            audit_rate = f"{rates[True]:.1%}" if rates[True] is not None else "-"
+            print(
+                f"  로컬 분류 {avoided}건 (LLM 호출 절약) / LLM 분류 {len(pending)}건, "
+                f"검증 표본 {agreement[True][1]}건 LLM 라벨 일치율 {audit_rate}"
+            )
 
-        print("\n  카테고리별 분포:")
-        for category in self.categories:
-            count = len(categorized.get(category, []))
-            if count > 0:
-                print(f"    {category}: {count}건")
+        self.print_distribution(categorized)
 
-        # ⑨ 상태 객체에 분류 결과 저장
-        state.categorized_news = dict(categorized)
+        # ⑧ 상태 객체에 분류 결과 저장
+        state.categorized_news = categorized
         state.messages.append(
             AIMessage(content=f"뉴스를 {len(categorized)}개 카테고리로 분류했습니다.")
         )
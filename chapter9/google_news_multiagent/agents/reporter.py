@@ -1,15 +1,53 @@
 from datetime import datetime
+from typing import Optional
 from langchain_core.messages import AIMessage
 
 from state import NewsState
+from article import Article
 from config import Config
+from metrics import RunMetrics
 
 
 class ReportGeneratorAgent:
     """최종 보고서를 생성하는 에이전트"""
 
-    def __init__(self):
+    def __init__(self, metrics: Optional[RunMetrics] = None):
         self.name = "Report Generator"
+        self.metrics = metrics or RunMetrics()
+
+    @staticmethod
+    def format_other_sources(news: Article) -> str:
+        """유사 중복으로 묶인 다른 언론사 기사 링크"""
+        if not news.other_sources:
+            return ""
+        links = ", ".join(
+            f"[{other['source']}]({other['original_url']})" for other in news.other_sources
+        )
+        return f"\n- **같은 내용 다른 출처**: {links}"
+
+    @staticmethod
+    def format_story_badge(news: Article) -> str:
+        """스토리(여러 기사 종합 요약)면 제목 뒤에 묶인 기사 수 표시"""
+        if not news.related_articles:
+            return ""
+        return f" (기사 {len(news.related_articles) + 1}건 종합)"
+
+    @staticmethod
+    def format_sources(news: Article) -> str:
+        """스토리는 묶인 모든 언론사를 중복 없이 나열"""
+        sources = [news.source] + [r["source"] for r in news.related_articles or []]
+        return ", ".join(dict.fromkeys(sources))
+
+    @staticmethod
+    def format_related(news: Article) -> str:
+        """스토리로 묶인 관련 보도 목록 (종합 요약의 근거 기사)"""
+        if not news.related_articles:
+            return ""
+        items = "\n".join(
+            f"  - [{related['source']}] [{related['title']}]({related['original_url']})"
+            for related in news.related_articles
+        )
+        return f"\n- **관련 보도 ({len(news.related_articles)}건)**:\n{items}"
 
     async def generate_report(self, state: NewsState) -> NewsState:
         """최종 보고서 생성"""
@@ -55,18 +93,19 @@ class ReportGeneratorAgent:
         news_sections = []
         for category in Config.NEWS_CATEGORIES:
             # ⑤ Walrus 연산자(:=)로 할당과 조건 검사를 동시에 수행
-            if news_list := state.categorized_news.get(category):
+            if indices := state.categorized_news.get(category):
+                news_list = [state.summarized_news[i] for i in indices]
                 section_header = f"### {category} ({len(news_list)}건)\n"
                 # ⑥ 카테고리별 표시 개수 제한 (Config.NEWS_PER_CATEGORY = 30)
                 display_count = min(len(news_list), Config.NEWS_PER_CATEGORY)
 
                 # ⑦ enumerate로 순번 매기며 뉴스 항목 문자열 생성
                 news_items_str = "\n".join(
-                    f"""#### {i}. {news["title"]}
-- **출처**: {news["source"]}
-- **발행**: {news.get("published_kst", "")}
-- **요약**: {news.get("ai_summary", news["content"])}
-- **링크**: [기사 보기]({news["original_url"]})"""
+                    f"""#### {i}. {news.title}{self.format_story_badge(news)}
+- **출처**: {self.format_sources(news)}
+- **발행**: {news.published_kst}
+- **요약**: {news.ai_summary or news.content}
+- **링크**: [기사 보기]({news.original_url}){self.format_other_sources(news)}{self.format_related(news)}"""
                     for i, news in enumerate(news_list[:display_count], 1)
                 )
 
@@ -92,6 +131,9 @@ class ReportGeneratorAgent:
 
         # 최종 보고서 조합
         state.final_report = "\n\n---\n\n".join(report_parts)
+        # 단계별 캐시 적중/미스와 오류 기록을 실행 지표로 모음 (보고서 옆 .metrics.json)
+        self.metrics.record_caches(state.run_stats)
+        self.metrics.record_errors(state.error_log)
         state.messages.append(AIMessage(content="최종 보고서가 생성되었습니다."))
 
         print(f"[{self.name}] 보고서 생성 완료")
@@ -0,0 +1,193 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from langchain_core.messages import AIMessage
+
+from article import Article
+from state import NewsState
+from config import Config
+from metrics import RunMetrics
+from extractive import SummaryPolicy
+from agents.collector import RSSCollectorAgent
+from agents.summarizer import NewsSummarizerAgent
+from agents.organizer import NewsOrganizerAgent
+from agents.digester import NewsDigestAgent
+
+
+class StreamingPipelineAgent:
+    """수집 → 요약 → 분류를 기사 단위로 겹쳐 실행하는 스트리밍 파이프라인
+
+    단계마다 워커 풀을 두고 크기가 정해진 asyncio.Queue로 기사 인덱스를 넘깁니다.
+    다음 단계가 밀리면 대기열이 가득 차서 앞 단계 워커가 기다리므로(배압)
+    다운로드한 본문이 메모리에 무한정 쌓이지 않습니다.
+    digester를 전달하면 요약·분류 두 단계 대신 digest 한 단계를 사용합니다.
+    """
+
+    def __init__(
+        self,
+        collector: RSSCollectorAgent,
+        summarizer: Optional[NewsSummarizerAgent] = None,
+        organizer: Optional[NewsOrganizerAgent] = None,
+        digester: Optional[NewsDigestAgent] = None,
+        queue_size: Optional[int] = None,
+        metrics: Optional[RunMetrics] = None,
+    ):
+        self.name = "Streaming Pipeline"
+        self.collector = collector
+        self.summarizer = summarizer
+        self.organizer = organizer
+        self.digester = digester
+        self.queue_size = queue_size or Config.STREAM_QUEUE_SIZE
+        self.metrics = metrics or RunMetrics()
+
+    async def run_stages(
+        self,
+        count: int,
+        stages: list[tuple[str, Callable[[int], Awaitable[Any]], int]],
+        state: NewsState,
+    ) -> dict[str, Any]:
+        """(이름, 처리 함수, 워커 수) 단계들을 대기열로 연결해 동시에 실행하고 통계를 반환합니다."""
+        # ① 첫 단계 입력은 전체 인덱스, 이후 단계 사이는 크기 제한 대기열
+        queues: list[asyncio.Queue] = [asyncio.Queue()]
+        queues += [asyncio.Queue(maxsize=self.queue_size) for _ in stages[1:]]
+        for i in range(count):
+            queues[0].put_nowait(i)
+        for _ in range(stages[0][2]):
+            queues[0].put_nowait(None)
+
+        started = time.perf_counter()
+        stats = {
+            name: {"done": 0, "failed": 0, "queue_peak": 0} for name, _, _ in stages
+        }
+        first_done: list[float] = []
+
+        async def worker(k: int) -> None:
+            name, handle, _ = stages[k]
+            outbox = queues[k + 1] if k + 1 < len(stages) else None
+            while (i := await queues[k].get()) is not None:
+                handled = time.perf_counter()
+                try:
+                    # 이 단계의 LLM 호출은 단계 이름으로 기록
+                    with self.metrics.stage(name):
+                        await handle(i)
+                except Exception as e:
+                    # 실패한 기사는 다음 단계로 넘기지 않음
+                    stats[name]["failed"] += 1
+                    state.error_log.append(f"StreamingPipeline: {name} - {str(e)}")
+                    continue
+                stats[name]["done"] += 1
+                if k > 0:
+                    # 수집 단계의 기사별 시간은 수집 에이전트가 기록
+                    self.metrics.observe_article(time.perf_counter() - handled, stage=name)
+                if outbox is None:
+                    if not first_done:
+                        first_done.append(time.perf_counter() - started)
+                    continue
+                # ② 다음 단계 대기열이 가득 차면 여기서 대기 (배압)
+                await outbox.put(i)
+                next_name = stages[k + 1][0]
+                stats[next_name]["queue_peak"] = max(stats[next_name]["queue_peak"], outbox.qsize())
+
+        async def run_stage(k: int) -> None:
+            name, _, workers = stages[k]
+            await asyncio.gather(*(worker(k) for _ in range(workers)))
+            stats[name]["finished_at"] = round(time.perf_counter() - started, 3)
+            # ③ 이 단계가 끝나면 다음 단계 워커 수만큼 종료 신호 전달
+            if k + 1 < len(stages):
+                for _ in range(stages[k + 1][2]):
+                    await queues[k + 1].put(None)
+
+        await asyncio.gather(*(run_stage(k) for k in range(len(stages))))
+        return {
+            "first_result_seconds": round(first_done[0], 3) if first_done else None,
+            "stages": stats,
+        }
+
+    async def run_pipeline(self, state: NewsState) -> NewsState:
+        """피드를 읽은 뒤 기사마다 본문 수집 → 요약 → 분류를 바로 이어서 처리합니다."""
+        print(f"--- {self.name} 시작 ---")
+        collector = self.collector
+        managed = collector._client is not None
+        try:
+            entries, decoded = await collector.select_entries(state)
+            raw_news: list[Optional[Article]] = [None] * len(entries)
+            summarized: list[Optional[Article]] = [None] * len(entries)
+            decided: dict[int, str] = {}
+
+            async def collect(i: int) -> None:
+                entry = entries[i]
+                raw_news[i] = await collector.build_news_item(
+                    entry, decoded.get(collector.google_news_url(entry))
+                )
+
+            stages = [("collect", collect, Config.FETCH_MAX_CONCURRENCY)]
+            policy = None
+            if self.digester is not None:
+                self.digester.digest_cache.reset_stats()
+
+                async def digest(i: int) -> None:
+                    category, summarized[i] = await self.digester.digest_streamed(raw_news[i])
+                    decided[i] = category
+
+                stages.append(("digest", digest, Config.LLM_MAX_CONCURRENCY))
+                summary_cache = self.digester.digest_cache
+            else:
+                self.summarizer.summary_cache.reset_stats()
+                policy = SummaryPolicy(self.summarizer.classifier)
+
+                async def summarize(i: int) -> None:
+                    summarized[i] = await self.summarizer.summarize_streamed(raw_news[i], policy)
+
+                async def organize(i: int) -> None:
+                    if (category := await self.organizer.categorize_streamed(summarized[i])) is not None:
+                        decided[i] = category
+
+                stages.append(("summarize", summarize, Config.LLM_MAX_CONCURRENCY))
+                stages.append(("organize", organize, Config.LLM_MAX_CONCURRENCY))
+                summary_cache = self.summarizer.summary_cache
+
+            # ④ 모든 단계를 동시에 실행 (LLM 호출은 공유 스케줄러 한도 안에서)
+            stream_stats = await self.run_stages(len(entries), stages, state)
+
+            collected = [news for news in raw_news if news is not None]
+            collector.finish_collect(
+                state, [e for e, news in zip(entries, raw_news) if news is not None], collected
+            )
+            # 분류는 요약이 끝난 기사만 거치므로 요약 실패로 빠진 자리만 당겨 인덱스를 맞춤
+            positions = [i for i, news in enumerate(summarized) if news is not None]
+            state.summarized_news = [summarized[i] for i in positions]
+            remap = {i: j for j, i in enumerate(positions)}
+            state.categorized_news = NewsOrganizerAgent.group_by_category(
+                {remap[i]: category for i, category in decided.items()}
+            )
+            state.run_stats["summary_cache"] = summary_cache.stats()
+            if policy is not None:
+                state.run_stats["summary_backend"] = policy.reasons
+            state.run_stats["streaming"] = stream_stats
+
+            print(
+                f"기사 {len(collected)}건 수집, {len(state.summarized_news)}건 요약, "
+                f"{len(decided)}건 분류 (첫 결과 {stream_stats['first_result_seconds']}s)"
+            )
+            for name, stage in stream_stats["stages"].items():
+                print(
+                    f"  {name}: 완료 {stage['done']}건, 실패 {stage['failed']}건, "
+                    f"대기열 최대 {stage['queue_peak']}건, 종료 {stage['finished_at']}s"
+                )
+            state.messages.append(
+                AIMessage(
+                    content=f"{len(state.summarized_news)}개의 뉴스를 스트리밍으로 요약하고 "
+                    f"{len(state.categorized_news)}개 카테고리로 분류했습니다."
+                )
+            )
+
+        except Exception as e:
+            print(f"스트리밍 파이프라인 오류 발생: {e}")
+            state.error_log.append(f"StreamingPipelineAgent: {str(e)}")
+        finally:
+            if not managed:
+                await collector.aclose()
+
+        print(f"--- {self.name} 완료 ---\n")
+        return state
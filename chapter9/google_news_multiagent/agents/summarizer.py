@@ -1,20 +1,57 @@
-import asyncio
-from typing import Dict, Any
+import hashlib
+import os
+from typing import List, Optional
+from pydantic import BaseModel, Field
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import AIMessage
 from langchain_core.prompts import ChatPromptTemplate
 
 from state import NewsState
+from article import Article
 from config import Config
+from cache import SQLiteCache
+from llm_scheduler import LLMScheduler
+from token_budget import estimate_tokens, stage_input, truncate_to_tokens
+from extractive import SummaryPolicy, extractive_summary
+from classifier import LocalCategoryClassifier, model_path
 from dotenv import load_dotenv
 load_dotenv()
 
+
+class ArticleSummary(BaseModel):
+    """묶음 요약 응답의 기사 한 건"""
+
+    id: int = Field(description="입력 기사의 id")
+    summary: str = Field(description="2-3문장 요약")
+
+
+class PackedSummaries(BaseModel):
+    """여러 기사를 한 번에 요약한 결과"""
+
+    summaries: List[ArticleSummary]
+
+
 class NewsSummarizerAgent:
     """뉴스를 요약하는 에이전트"""
 
-    def __init__(self, llm: ChatOpenAI):
+    def __init__(
+        self,
+        llm: ChatOpenAI,
+        scheduler: Optional[LLMScheduler] = None,
+        pack_size: Optional[int] = None,
+    ):
         self.name = "News Summarizer"
         self.llm = llm
+        # 요약/분류 에이전트가 같은 API 한도를 나눠 쓰도록 스케줄러 공유 가능
+        self.scheduler = scheduler or LLMScheduler()
+        # 실행 지표는 스케줄러와 같은 객체에 기록 (요약 실패 수 등)
+        self.metrics = self.scheduler.metrics
+        # 2 이상이면 기사 여러 건을 구조화 출력 요청 하나로 묶어 요약
+        self.pack_size = max(1, pack_size or Config.SUMMARY_PACK_SIZE)
+        # 저우선순위 카테고리 판단용 로컬 분류기 (EXTRACTIVE_CATEGORIES를 지정한 경우에만)
+        self.classifier = (
+            LocalCategoryClassifier.load(model_path()) if Config.EXTRACTIVE_CATEGORIES else None
+        )
         # ① 튜플 형식의 메시지로 간결하게 프롬프트 템플릿 구성
         self.prompt = ChatPromptTemplate.from_messages(
             [
@@ -32,57 +69,332 @@ class NewsSummarizerAgent:
                 ),
             ]
         )
+        # 묶음 요약 프롬프트 (시스템 지침은 요청당 한 번만 전송)
+        self.packed_prompt = ChatPromptTemplate.from_messages(
+            [
+                ("system", self.prompt.messages[0].prompt.template),
+                (
+                    "human",
+                    "{articles}\n\n위 뉴스를 각각 2-3문장으로 요약해주세요. "
+                    "각 요약에는 해당 기사의 id를 그대로 붙여주세요:",
+                ),
+            ]
+        )
+        self._packed_chain = None
+        # 스토리(같은 사건의 여러 기사) 종합 요약 프롬프트
+        self.story_prompt = ChatPromptTemplate.from_messages(
+            [
+                ("system", self.prompt.messages[0].prompt.template),
+                (
+                    "human",
+                    "{articles}\n\n위 기사들은 같은 사건을 다룬 여러 언론사 보도입니다. "
+                    "공통된 사실을 중심으로 종합해 2-3문장으로 요약해주세요:",
+                ),
+            ]
+        )
+        # 요약 결과 영구 캐시 (같은 프롬프트·모델·기사면 LLM 호출 생략)
+        self.summary_cache = SQLiteCache(
+            path=os.path.join(Config.CACHE_DIR, "summaries.sqlite3"),
+            table="summaries",
+            ttl=Config.SUMMARY_CACHE_TTL,
+            max_entries=Config.SUMMARY_CACHE_MAX_ENTRIES,
+        )
+        # 프롬프트 템플릿/모델/출력 길이가 바뀌면 키가 달라져 자동으로 새로 요약
+        self._key_prefixes = {
+            packed: hashlib.sha256(
+                f"{self._template_text(prompt)}\0{Config.MODEL_NAME}\0"
+                f"{Config.MAX_TOKENS}\0".encode("utf-8")
+            )
+            for packed, prompt in ((False, self.prompt), (True, self.packed_prompt))
+        }
+        self._story_key_prefix = hashlib.sha256(
+            f"{self._template_text(self.story_prompt)}\0{Config.MODEL_NAME}\0"
+            f"{Config.MAX_TOKENS}\0".encode("utf-8")
+        )
 
-    async def summarize_single_news(self, news_item: Dict[str, Any]) -> Dict[str, Any]:
-        """단일 뉴스 요약 (오류 발생 시 원본 내용 반환)"""
-        content = news_item.get("content", "")
-        try:
-            # ④ 최소 콘텐츠 길이 검증으로 불필요한 API 호출 방지
-            if not content or len(content) < 50:
-                return {**news_item, "ai_summary": content}
+    @staticmethod
+    def _template_text(prompt: ChatPromptTemplate) -> str:
+        return "\n".join(message.prompt.template for message in prompt.messages)
 
+    def summary_cache_key(self, news_item: Article, packed: bool = False) -> str:
+        """프롬프트 템플릿, 모델, MAX_TOKENS, 제목, 잘린 본문의 해시"""
+        digest = self._key_prefixes[packed].copy()
+        digest.update(f"{news_item.title}\0{stage_input(news_item, 'summary')}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def cached_summary(self, news_item: Article) -> Optional[Article]:
+        """LLM 호출 없이 요약할 수 있으면 결과를, 아니면 None을 반환합니다."""
+        content = news_item.content
+        # ④ 최소 콘텐츠 길이 검증으로 불필요한 API 호출 방지
+        if not content or len(content) < 50:
+            return news_item.annotate(ai_summary=content)
+        # 묶음 요약에서 빠져 기사별로 요약한 결과는 단일 키로 저장되므로 묶음 키 다음에 조회
+        keys = [self.summary_cache_key(news_item, packed=True)] if self.pack_size > 1 else []
+        keys.append(self.summary_cache_key(news_item))
+        for attempt, key in enumerate(keys):
+            if (summary := self.summary_cache.get(key)) is not None:
+                break
+        self.summary_cache.misses -= attempt  # 기사 한 건은 적중/미스 한 번으로 집계
+        if summary is None:
+            return None
+        return news_item.annotate(ai_summary=summary)
+
+    async def summarize_single_news(self, news_item: Article) -> Article:
+        """단일 뉴스 요약 (캐시 우선, 오류 발생 시 원본 내용 반환)"""
+        cached = self.cached_summary(news_item)
+        if cached is not None:
+            return cached
+        return await self.request_summary(news_item)
+
+    async def request_summary(self, news_item: Article) -> Article:
+        """LLM으로 요약하고 성공한 결과를 캐시에 저장합니다."""
+        content = news_item.content
+        try:
             # ⑤ LCEL(LangChain Expression Language) 체인 구성
             chain = self.prompt | self.llm
             summary_response = await chain.ainvoke(
                 {
-                    "title": news_item["title"],
-                    "content": content[:500],
+                    "title": news_item.title,
+                    "content": stage_input(news_item, "summary"),
                 }
             )
             summary = summary_response.content.strip()
-            # ⑥ 요약 결과 검증 및 폴백 처리
-            return {**news_item, "ai_summary": summary or content}
+            # ⑥ 요약 결과 검증 및 폴백 처리 (정상 요약만 캐시)
+            if not summary:
+                return news_item.annotate(ai_summary=content)
+            self.summary_cache.set(self.summary_cache_key(news_item), summary)
+            return news_item.annotate(ai_summary=summary)
 
         except Exception as e:
             # ⑦ 간결한 오류 로깅과 원본 반환으로 서비스 연속성 보장
+            self.metrics.count_error("NewsSummarizerAgent")
             print(
-                f"  [{self.name}] 요약 오류 (Title: {news_item['title']}): {str(e)[:50]}..."
+                f"  [{self.name}] 요약 오류 (Title: {news_item.title}): {str(e)[:50]}..."
+            )
+            return news_item.annotate(ai_summary=content)  # 오류 시 원본 사용
+
+    @property
+    def packed_chain(self):
+        """묶음 요약 체인 (출력 토큰 한도를 기사 수만큼 늘린 구조화 출력)"""
+        if self._packed_chain is None:
+            llm = self.llm
+            if "max_tokens" in type(llm).model_fields:
+                llm = llm.model_copy(update={"max_tokens": Config.MAX_TOKENS * self.pack_size})
+            self._packed_chain = self.packed_prompt | llm.with_structured_output(PackedSummaries)
+        return self._packed_chain
+
+    @staticmethod
+    def format_pack(news_items: List[Article]) -> str:
+        """묶음 요청 본문 (id는 묶음 안에서 1부터 부여)"""
+        return "\n\n".join(
+            f"[id: {i}]\n제목: {news.title}\n내용: {stage_input(news, 'summary')}"
+            for i, news in enumerate(news_items, 1)
+        )
+
+    async def request_packed_summaries(
+        self, news_items: List[Article]
+    ) -> List[Optional[Article]]:
+        """기사 여러 건을 한 번에 요약합니다. 검증에 실패한 항목은 None으로 반환합니다."""
+        try:
+            response = await self.packed_chain.ainvoke(
+                {"articles": self.format_pack(news_items)}
             )
-            return {**news_item, "ai_summary": content}  # 오류 시 원본 사용
+            summaries = response.summaries
+        except Exception as e:
+            self.metrics.count_error("NewsSummarizerAgent")
+            print(f"  [{self.name}] 묶음 요약 오류 ({len(news_items)}건): {str(e)[:50]}...")
+            return [None] * len(news_items)
+
+        # 범위를 벗어난 id, 중복 id, 빈 요약은 버리고 기사별 요청으로 다시 처리
+        results: List[Optional[Article]] = [None] * len(news_items)
+        for item in summaries:
+            summary = item.summary.strip()
+            index = item.id - 1
+            if not summary or not 0 <= index < len(news_items) or results[index] is not None:
+                continue
+            news = news_items[index]
+            self.summary_cache.set(self.summary_cache_key(news, packed=True), summary)
+            results[index] = news.annotate(ai_summary=summary)
+        return results
+
+    @staticmethod
+    def estimate_request_tokens(news_item: Article) -> int:
+        """요청 한 건의 토큰 사용량 추정 (입력 + 최대 출력)"""
+        content = news_item.content
+        if not content or len(content) < 50:
+            return 0
+        return (
+            estimate_tokens(news_item.title + stage_input(news_item, "summary"))
+            + Config.MAX_TOKENS
+        )
+
+    async def summarize_pending(self, news_items: List[Article]) -> List[Article]:
+        """캐시에 없는 기사 요약 (묶음 모드면 묶음 요청 후 누락분만 기사별 요청)"""
+        results: List[Optional[Article]] = [None] * len(news_items)
+        if self.pack_size > 1:
+            packs = [
+                news_items[i : i + self.pack_size]
+                for i in range(0, len(news_items), self.pack_size)
+            ]
+            packed_results = await self.scheduler.map(
+                self.request_packed_summaries,
+                packs,
+                cost=lambda pack: sum(map(self.estimate_request_tokens, pack)),
+                label="묶음 요약",
+            )
+            results = [result for pack in packed_results for result in pack]
+            missing = results.count(None)
+            if missing:
+                print(f"  묶음 응답에서 누락/오류 {missing}건 → 기사별 요약으로 재처리")
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        single_results = await self.scheduler.map(
+            self.request_summary,
+            [news_items[i] for i in pending],
+            cost=self.estimate_request_tokens,
+            label="요약",
+        )
+        for i, result in zip(pending, single_results):
+            results[i] = result
+        return results
+
+    @staticmethod
+    def story_members(members: List[Article]) -> List[Article]:
+        """프롬프트에 넣을 기사 (본문이 긴 순서로 최대 STORY_MAX_ARTICLES건)"""
+        ranked = sorted(members, key=lambda news: len(news.content), reverse=True)
+        return ranked[: Config.STORY_MAX_ARTICLES]
+
+    def story_cache_key(self, members: List[Article]) -> str:
+        digest = self._story_key_prefix.copy()
+        for news in self.story_members(members):
+            digest.update(f"{news.title}\0{stage_input(news, 'summary')}\0".encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def format_story(members: List[Article]) -> str:
+        """스토리 요청 본문 (전체가 요약 입력 예산 안에 들도록 기사별로 나눠 자름)"""
+        budget = max(Config.SUMMARY_INPUT_TOKENS // len(members), 60)
+        return "\n\n".join(
+            f"[{news.source}] {news.title}\n"
+            f"내용: {truncate_to_tokens(stage_input(news, 'summary'), budget)}"
+            for news in members
+        )
+
+    @staticmethod
+    def merge_other_sources(members: List[Article]) -> Optional[list[dict]]:
+        """스토리 기사들에 붙은 유사 중복 출처를 링크 기준 중복 없이 합침 (없으면 None)"""
+        merged = {}
+        for news in members:
+            for other in news.other_sources or []:
+                merged.setdefault(other["original_url"] or other["title"], other)
+        return list(merged.values()) or None
+
+    async def request_story_summary(self, members: List[Article]) -> Article:
+        """같은 사건을 다룬 기사들을 종합 요약 하나로 (대표 기사에 관련 보도를 붙여 반환)"""
+        prompt_members = self.story_members(members)
+        representative = prompt_members[0]
+        related = [news.reference() for news in members if news is not representative]
+        # 유사 중복 단계에서 다른 기사에 붙은 출처도 대표 기사로 모음
+        other_sources = self.merge_other_sources(members)
+
+        if Config.SUMMARY_BACKEND == "extractive":
+            summary = extractive_summary(representative.content, Config.EXTRACTIVE_SENTENCES)
+            return representative.annotate(
+                ai_summary=summary, related_articles=related, other_sources=other_sources
+            )
+
+        key = self.story_cache_key(members)
+        summary = self.summary_cache.get(key)
+        if summary is None:
+            try:
+                response = await (self.story_prompt | self.llm).ainvoke(
+                    {"articles": self.format_story(prompt_members)}
+                )
+                summary = response.content.strip()
+                if summary:
+                    self.summary_cache.set(key, summary)
+            except Exception as e:
+                self.metrics.count_error("NewsSummarizerAgent")
+                print(f"  [{self.name}] 스토리 요약 오류 ({len(members)}건): {str(e)[:50]}...")
+            if not summary:
+                # 종합 요약 실패 시 대표 기사 단독 요약으로 대체
+                summary = (await self.summarize_single_news(representative)).ai_summary
+
+        return representative.annotate(
+            ai_summary=summary, related_articles=related, other_sources=other_sources
+        )
+
+    async def summarize_articles(
+        self, news_items: List[Article]
+    ) -> tuple[List[Article], SummaryPolicy]:
+        """단독 기사 요약 (캐시 → 추출/LLM 정책 → 기사별 또는 묶음 LLM 요청)"""
+        # ⑧ 캐시에 있는 요약은 바로 사용하고, 나머지만 LLM 스케줄러로 전달
+        summarized_news = [self.cached_summary(news) for news in news_items]
+        pending = [i for i, news in enumerate(summarized_news) if news is None]
+        if self.summary_cache.hits:
+            print(f"  캐시된 요약 사용: {self.summary_cache.hits}건")
+
+        # ⑨ 기사별로 추출 요약/LLM 요약 결정 (추출 요약은 LLM 없이 바로 처리)
+        policy = SummaryPolicy(self.classifier)
+        llm_pending = []
+        for i in pending:
+            news = news_items[i]
+            if policy.choose(news, self.estimate_request_tokens(news)) == "extractive":
+                summary = extractive_summary(news.content, Config.EXTRACTIVE_SENTENCES)
+                summarized_news[i] = news.annotate(ai_summary=summary)
+            else:
+                llm_pending.append(i)
+        if len(llm_pending) < len(pending):
+            print(f"  추출 요약: {len(pending) - len(llm_pending)}건 ({policy.reasons})")
+
+        # ⑩ 슬라이딩 윈도 스케줄링: 한 요청이 끝나면 바로 다음 요청 시작 (배치 대기 없음)
+        results = await self.summarize_pending([news_items[i] for i in llm_pending])
+        for i, result in zip(llm_pending, results):
+            summarized_news[i] = result
+        return summarized_news, policy
+
+    async def summarize_streamed(
+        self, news_item: Article, policy: SummaryPolicy
+    ) -> Article:
+        """스트리밍 모드 기사 한 건 요약 (캐시 → 추출/LLM 정책 → 스케줄러 한도 안에서 LLM 요청)"""
+        cached = self.cached_summary(news_item)
+        if cached is not None:
+            return cached
+        cost = self.estimate_request_tokens(news_item)
+        if policy.choose(news_item, cost) == "extractive":
+            summary = extractive_summary(news_item.content, Config.EXTRACTIVE_SENTENCES)
+            return news_item.annotate(ai_summary=summary)
+        return await self.scheduler.run(lambda: self.request_summary(news_item), cost)
 
     async def summarize_news(self, state: NewsState) -> NewsState:
-        """모든 뉴스를 비동기로 요약"""
+        """모든 뉴스를 비동기로 요약 (스토리로 묶인 기사는 스토리마다 종합 요약 하나)"""
         print(f"\n[{self.name}] 뉴스 요약 시작...")
+        self.summary_cache.reset_stats()
+        if near_dup := state.run_stats.get("near_dup"):
+            print(f"  유사 중복 제외로 절약한 요약 호출: {near_dup['summarize_llm_calls_saved']}건")
 
-        batch_size = Config.BATCH_SIZE
-        summarized_news = []
         raw_news = state.raw_news
-        total_news = len(raw_news)
-
-        # ⑧ 배치 단위 순차 처리로 API 부하 분산
-        for i in range(0, total_news, batch_size):
-            batch = raw_news[i : i + batch_size]
-            batch_num = i // batch_size + 1
-            total_batches = (total_news + batch_size - 1) // batch_size
+        clusters = state.story_clusters or [[i] for i in range(len(raw_news))]
+        singles = [cluster for cluster in clusters if len(cluster) == 1]
+        stories = [cluster for cluster in clusters if len(cluster) > 1]
 
-            print(f"  배치 {batch_num}/{total_batches} 처리 중...")
+        single_results, policy = await self.summarize_articles([raw_news[c[0]] for c in singles])
+        story_results = await self.scheduler.map(
+            self.request_story_summary,
+            [[raw_news[i] for i in cluster] for cluster in stories],
+            cost=lambda members: Config.SUMMARY_INPUT_TOKENS + Config.MAX_TOKENS,
+            label="스토리 요약",
+        )
 
-            tasks = [self.summarize_single_news(news) for news in batch]
-            batch_results = await asyncio.gather(*tasks)
-            summarized_news.extend(batch_results)
+        # 스토리 순서(첫 기사 위치)대로 결과 정렬
+        by_first = {c[0]: r for c, r in zip(singles, single_results)}
+        by_first.update({c[0]: r for c, r in zip(stories, story_results)})
+        summarized_news = [by_first[cluster[0]] for cluster in clusters]
 
-        # ⑨ LangGraph 워크플로우 상태 업데이트
+        # ⑪ LangGraph 워크플로우 상태 업데이트
         state.summarized_news = summarized_news
+        state.run_stats["summary_cache"] = self.summary_cache.stats()
+        state.run_stats["summary_backend"] = policy.reasons
         state.messages.append(
             AIMessage(content=f"{len(summarized_news)}개의 뉴스 요약을 완료했습니다.")
         )
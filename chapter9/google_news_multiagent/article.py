@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from token_budget import stage_input_ends
+
+
+@dataclass(slots=True)
+class Article:
+    """기사 한 건의 레코드 (__slots__로 속성만 저장)
+
+    본문은 한 번만 보관하고 단계별 LLM 입력은 본문 앞부분 길이(summary_end 등)로만 기록합니다.
+    이후 단계는 사본을 만들지 않고 같은 객체에 요약(ai_summary)·관련 기사를 덧붙입니다.
+    """
+
+    title: str
+    content: str = ""
+    source: str = "Unknown"
+    published_kst: str = ""
+    google_news_url: str = ""
+    original_url: Optional[str] = None
+    # 단계별 입력 = content[:*_end] (음수면 생성 시 토큰 예산으로 계산)
+    summary_end: int = -1
+    category_end: int = -1
+    ai_summary: Optional[str] = None
+    # 유사 중복으로 묶인 다른 출처 / 스토리로 묶인 관련 보도 ({source, title, original_url})
+    other_sources: Optional[list[dict[str, Any]]] = None
+    related_articles: Optional[list[dict[str, Any]]] = None
+
+    def __post_init__(self) -> None:
+        if self.summary_end < 0 or self.category_end < 0:
+            ends = stage_input_ends(self.content)
+            self.summary_end, self.category_end = ends["summary"], ends["category"]
+
+    def annotate(self, **fields: Any) -> "Article":
+        """다음 단계 결과를 같은 객체에 기록하고 자신을 반환 (사본을 만들지 않음)"""
+        for name, value in fields.items():
+            setattr(self, name, value)
+        return self
+
+    def stage_input(self, stage: str) -> str:
+        """단계별 토큰 예산으로 자른 본문 ("summary" / "category")"""
+        return self.content[: getattr(self, f"{stage}_end")]
+
+    def reference(self) -> dict[str, Any]:
+        """다른 기사에 붙일 출처/제목/링크"""
+        return {"source": self.source, "title": self.title, "original_url": self.original_url}
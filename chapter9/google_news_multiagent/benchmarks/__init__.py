@@ -0,0 +1,3 @@
+# benchmarks/__init__.py
+# 로컬 스텁 서버를 이용한 성능 측정 스크립트 모음
+# 실행 예: python -m benchmarks.bench_http_client
@@ -0,0 +1,43 @@
+"""
+기사 본문 저장소 벤치마크 - 같은 피드를 두 번 수집할 때 첫 실행(다운로드+추출)과
+두 번째 실행(ArticleStore 적중)의 시간과 기사 다운로드 수를 비교합니다.
+
+실행: python -m benchmarks.bench_article_cache [--articles 60] [--delay-ms 100]
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+
+from config import Config
+from benchmarks.stub_server import StubNewsServer
+
+
+async def run(args) -> None:
+    # 벤치마크용 임시 캐시 디렉터리 사용 (실제 캐시에 영향 없음)
+    Config.CACHE_DIR = tempfile.mkdtemp(prefix="news_bench_")
+    from agents.collector import RSSCollectorAgent
+    from state import NewsState
+
+    with StubNewsServer(
+        n_articles=args.articles, handshake_delay=0, article_delay=args.delay_ms / 1000
+    ) as server:
+        print(f"기사 {args.articles}건, 기사당 응답 지연 {args.delay_ms}ms\n")
+        print(f"{'실행':<6}{'시간(s)':>10}{'기사 다운로드':>14}{'본문 캐시 적중':>16}")
+        for i in (1, 2):
+            # 실행마다 새 에이전트 (프로세스 재시작과 같은 조건, 저장소 파일만 공유)
+            async with RSSCollectorAgent(rss_urls=[server.rss_url]) as collector:
+                collector.api_url = server.api_url
+                server.reset_counters()
+                started = time.perf_counter()
+                state = await collector.collect_rss(NewsState())
+                elapsed = time.perf_counter() - started
+            hits = state.run_stats["article_cache"]["hits"]
+            print(f"{i:<6}{elapsed:>10.3f}{server.requests.get('article', 0):>14}{hits:>16}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=60)
+    parser.add_argument("--delay-ms", type=float, default=100.0)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,58 @@
+"""
+기사 다운로드 벤치마크 - async 함수 안에서 동기 trafilatura.fetch_url을 호출하는 방식(before)과
+공유 클라이언트로 스트리밍하는 download_article(after)을 비교합니다.
+
+before는 다운로드마다 이벤트 루프가 멈추므로 전체 시간이 기사 지연의 합에 가깝고,
+after는 가장 느린 기사 하나의 지연에 가까워야 합니다. (스텁은 단일 호스트이므로
+HTTP_MAX_CONNECTIONS_PER_HOST 단위로 묶여서 처리됩니다.)
+
+실행: python -m benchmarks.bench_article_download [--articles 30] [--delay-ms 200]
+"""
+import argparse
+import asyncio
+import time
+
+import trafilatura
+
+from agents.collector import RSSCollectorAgent
+from benchmarks.stub_server import StubNewsServer
+
+
+async def download_blocking(urls: list[str]) -> list:
+    """before: 코루틴 안에서 동기 다운로드"""
+
+    async def fetch(url: str):
+        return trafilatura.fetch_url(url)
+
+    return await asyncio.gather(*(fetch(url) for url in urls))
+
+
+async def download_streaming(urls: list[str]) -> list:
+    """after: 공유 AsyncClient로 스트리밍 다운로드"""
+    async with RSSCollectorAgent() as agent:
+        return await asyncio.gather(*(agent.download_article(url) for url in urls))
+
+
+async def run(args) -> None:
+    with StubNewsServer(
+        n_articles=args.articles, handshake_delay=0, article_delay=args.delay_ms / 1000
+    ) as server:
+        urls = [f"{server.base_url}/article/{aid}" for aid in server.article_ids()]
+
+        print(f"기사 {len(urls)}건, 기사당 응답 지연 {args.delay_ms}ms\n")
+        print(f"{'방식':<8}{'시간(s)':>10}{'성공':>8}")
+        for label, download in (
+            ("before", download_blocking),
+            ("after", download_streaming),
+        ):
+            started = time.perf_counter()
+            results = await download(urls)
+            elapsed = time.perf_counter() - started
+            print(f"{label:<8}{elapsed:>10.3f}{sum(1 for r in results if r):>8}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=30)
+    parser.add_argument("--delay-ms", type=float, default=200.0)
+    asyncio.run(run(parser.parse_args()))
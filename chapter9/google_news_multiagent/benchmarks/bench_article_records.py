@@ -0,0 +1,119 @@
+"""
+기사 레코드 벤치마크 - 기사 수천 건을 수집 → 요약 → 분류하는 동안 상태가 들고 있는 기사 레코드의
+최대 메모리(tracemalloc)와 체크포인트 직렬화 크기를 비교합니다.
+
+before: 기사마다 dict + 단계별 입력 문자열(summary_input, category_input) 사본,
+        요약 단계는 {**news, "ai_summary": ...}로 dict 사본, categorized_news는 기사 dict 목록
+after : Article(__slots__) + 단계별 입력은 본문 앞부분 길이만 기록, 요약은 같은 객체에 기록,
+        categorized_news는 summarized_news 인덱스 목록
+
+본문/요약 문자열은 두 방식이 같으므로 측정 전에 만들어 두고 레코드가 더하는 메모리만 잽니다.
+
+실행: python -m benchmarks.bench_article_records [--news 5000]
+"""
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from article import Article
+from config import Config
+from benchmarks.bench_extractive_summary import make_article
+from token_budget import truncate_to_tokens
+
+
+def make_inputs(n: int, rng: random.Random) -> list[tuple[str, str, str]]:
+    """(제목, 본문, 요약) 목록"""
+    return [
+        (
+            f"벤치마크 기사 {i} - 언론사 {i % 40}",
+            make_article(rng, rng.randint(15, 40)),
+            f"가짜 요약 {i}: " + make_article(rng, 2),
+        )
+        for i in range(n)
+    ]
+
+
+def before_flow(inputs, categories) -> dict:
+    raw_news = [
+        {
+            "title": title,
+            "content": content,
+            "source": f"언론사 {i % 40}",
+            "published_kst": "2026-10-18 09:00",
+            "google_news_url": f"https://news.google.com/rss/articles/{i}",
+            "original_url": f"https://press.example/{i}",
+            "summary_input": truncate_to_tokens(content, Config.SUMMARY_INPUT_TOKENS),
+            "category_input": truncate_to_tokens(content, Config.CATEGORY_INPUT_TOKENS),
+        }
+        for i, (title, content, _) in enumerate(inputs)
+    ]
+    summarized = [{**news, "ai_summary": s} for news, (_, _, s) in zip(raw_news, inputs)]
+    categorized: dict[str, list[dict]] = {}
+    for news, category in zip(summarized, categories):
+        categorized.setdefault(category, []).append(news)
+    return {"raw_news": raw_news, "summarized_news": summarized, "categorized_news": categorized}
+
+
+def after_flow(inputs, categories) -> dict:
+    raw_news = [
+        Article(
+            title=title,
+            content=content,
+            source=f"언론사 {i % 40}",
+            published_kst="2026-10-18 09:00",
+            google_news_url=f"https://news.google.com/rss/articles/{i}",
+            original_url=f"https://press.example/{i}",
+        )
+        for i, (title, content, _) in enumerate(inputs)
+    ]
+    summarized = [news.annotate(ai_summary=s) for news, (_, _, s) in zip(raw_news, inputs)]
+    categorized: dict[str, list[int]] = {}
+    for i, category in enumerate(categories):
+        categorized.setdefault(category, []).append(i)
+    return {"raw_news": raw_news, "summarized_news": summarized, "categorized_news": categorized}
+
+
+def measure(flow, inputs, categories) -> tuple[dict, float, float]:
+    """상태 생성 시간(s)과 최대 추가 메모리(MB)"""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    state = flow(inputs, categories)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return state, elapsed, peak / 1e6
+
+
+def checkpoint_bytes(state: dict) -> int:
+    # 체크포인트는 상태 필드(채널)마다 따로 직렬화
+    serde = JsonPlusSerializer()
+    return sum(len(serde.dumps_typed(value)[1]) for value in state.values())
+
+
+def main(args) -> None:
+    rng = random.Random(0)
+    inputs = make_inputs(args.news, rng)
+    categories = [rng.choice(Config.NEWS_CATEGORIES) for _ in inputs]
+    text_mb = sum(len(c.encode("utf-8")) for _, c, _ in inputs) / 1e6
+    print(f"기사 {args.news}건 (본문 합계 {text_mb:.1f}MB UTF-8)\n")
+    print(f"{'방식':<8}{'생성(s)':>10}{'최대 메모리(MB)':>17}{'기사당(B)':>11}{'체크포인트(MB)':>16}")
+
+    for label, flow in (("before", before_flow), ("after", after_flow)):
+        state, elapsed, peak_mb = measure(flow, inputs, categories)
+        saved_mb = checkpoint_bytes(state) / 1e6
+        print(
+            f"{label:<8}{elapsed:>10.3f}{peak_mb:>17.1f}{peak_mb * 1e6 / args.news:>11.0f}"
+            f"{saved_mb:>16.1f}"
+        )
+        del state
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--news", type=int, default=5000)
+    main(parser.parse_args())
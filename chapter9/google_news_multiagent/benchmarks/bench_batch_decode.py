@@ -0,0 +1,42 @@
+"""
+원문 URL 일괄 디코딩 벤치마크 - 기사마다 batchexecute POST를 보내는 방식(single)과
+RPC를 DECODE_BATCH_SIZE개씩 묶어 보내는 방식(batch)의 POST 수와 시간을 비교합니다.
+
+실행: python -m benchmarks.bench_batch_decode [--articles 60] [--latency-ms 80]
+"""
+import argparse
+import asyncio
+import time
+
+from agents.collector import RSSCollectorAgent
+from benchmarks.stub_server import StubNewsServer
+
+
+async def run(args) -> None:
+    with StubNewsServer(
+        n_articles=args.articles, handshake_delay=0, response_delay=args.latency_ms / 1000
+    ) as server:
+        urls = [f"{server.base_url}/rss/articles/{aid}" for aid in server.article_ids()]
+        print(f"기사 {len(urls)}건, 요청당 서버 지연 {args.latency_ms}ms\n")
+        print(f"{'방식':<8}{'시간(s)':>10}{'POST':>8}{'디코딩 성공':>12}")
+
+        async with RSSCollectorAgent() as agent:
+            agent.api_url = server.api_url
+            for label, decode in (
+                ("single", lambda: asyncio.gather(*map(agent.decode_article_url, urls))),
+                ("batch", lambda: agent.decode_article_urls(urls)),
+            ):
+                server.reset_counters()
+                started = time.perf_counter()
+                results = await decode()
+                elapsed = time.perf_counter() - started
+                decoded = len(results) if isinstance(results, dict) else sum(map(bool, results))
+                posts = server.requests.get("batchexecute", 0)
+                print(f"{label:<8}{elapsed:>10.3f}{posts:>8}{decoded:>12}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=60)
+    parser.add_argument("--latency-ms", type=float, default=80.0)
+    asyncio.run(run(parser.parse_args()))
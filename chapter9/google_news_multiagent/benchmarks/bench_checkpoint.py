@@ -0,0 +1,101 @@
+"""
+체크포인트 벤치마크 - SQLite 체크포인터를 켰을 때의 쓰기 비용(시간/바이트)과,
+분류 단계에서 실패한 실행을 이어서 실행(resume)할 때 다시 하는 작업량을 처음부터 다시 실행한 경우와 비교합니다.
+
+실행: python -m benchmarks.bench_checkpoint [--news 60] [--latency 0.2]
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from config import Config
+from benchmarks.fake_llm import FakeNewsChatModel
+from benchmarks.stub_server import StubNewsServer
+
+
+async def run(args) -> None:
+    from agents.collector import RSSCollectorAgent
+    from agents.organizer import NewsOrganizerAgent
+    from checkpoint import SQLiteCheckpointSaver
+    from workflow import create_news_workflow
+    from state import NewsState
+
+    Config.SUMMARY_BACKEND = "llm"
+    organize_news = NewsOrganizerAgent.organize_news
+    crash = {"on": False}
+
+    async def crashing_organize(self, state):
+        # 분류 단계에서 프로세스가 죽은 상황 재현
+        if crash["on"]:
+            raise RuntimeError("분류 단계 강제 실패")
+        return await organize_news(self, state)
+
+    NewsOrganizerAgent.organize_news = crashing_organize
+
+    with StubNewsServer(n_articles=args.news, handshake_delay=0) as server:
+
+        async def invoke(checkpointer, run_id, state):
+            llm = FakeNewsChatModel(latency=args.latency, seed=1)
+            server.reset_counters()
+            async with RSSCollectorAgent(rss_urls=[server.rss_url]) as collector:
+                collector.api_url = server.api_url
+                app = create_news_workflow(llm, collector=collector, checkpointer=checkpointer)
+                started = time.perf_counter()
+                try:
+                    await app.ainvoke(state, {"configurable": {"thread_id": run_id}})
+                except RuntimeError:
+                    pass
+                elapsed = time.perf_counter() - started
+            return elapsed, llm.calls, sum(server.requests.values())
+
+        # ① 체크포인트 쓰기 비용
+        print(f"기사 {args.news}건, 가짜 모델 지연 {args.latency}s\n")
+        print(f"{'체크포인트':<12}{'시간(s)':>10}{'쓰기(s)':>10}{'기록(KB)':>10}{'파일(KB)':>10}")
+        for enabled in (False, True):
+            Config.CACHE_DIR = tempfile.mkdtemp(prefix="news_bench_")
+            checkpointer = SQLiteCheckpointSaver() if enabled else None
+            elapsed, _, _ = await invoke(checkpointer, "overhead", NewsState())
+            if checkpointer is None:
+                print(f"{'off':<12}{elapsed:>10.3f}{'-':>10}{'-':>10}{'-':>10}")
+                continue
+            stats = checkpointer.stats()
+            size = sum(
+                os.path.getsize(checkpointer.path + suffix)
+                for suffix in ("", "-wal")
+                if os.path.exists(checkpointer.path + suffix)
+            )
+            print(
+                f"{'on':<12}{elapsed:>10.3f}{stats['write_seconds']:>10.3f}"
+                f"{stats['bytes_written'] / 1024:>10.0f}{size / 1024:>10.0f}"
+            )
+
+        # ② 분류 단계 실패 후: 처음부터 다시 실행 vs 체크포인트에서 이어서 실행
+        print(f"\n{'복구 방식':<14}{'시간(s)':>10}{'LLM 호출':>10}{'HTTP 요청':>10}")
+        # restart-cold: 캐시도 없는 새 환경, restart-warm: URL/본문/요약 캐시는 남아 있는 재실행
+        for label, resume, warm in (
+            ("restart-cold", False, False),
+            ("restart-warm", False, True),
+            ("resume", True, True),
+        ):
+            Config.CACHE_DIR = tempfile.mkdtemp(prefix="news_bench_")
+            checkpointer = SQLiteCheckpointSaver()
+            crash["on"] = True
+            await invoke(checkpointer, "crashed", NewsState())
+            crash["on"] = False
+            if not warm:
+                Config.CACHE_DIR = tempfile.mkdtemp(prefix="news_bench_")
+            elapsed, calls, requests = await invoke(
+                checkpointer if resume else None,
+                "crashed",
+                None if resume else NewsState(),
+            )
+            print(f"{label:<14}{elapsed:>10.3f}{calls:>10}{requests:>10}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--news", type=int, default=60)
+    parser.add_argument("--latency", type=float, default=0.2)
+    asyncio.run(run(parser.parse_args()))
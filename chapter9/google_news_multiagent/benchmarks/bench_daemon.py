@@ -0,0 +1,111 @@
+"""
+상주 모드 벤치마크 - cron처럼 실행마다 새 프로세스를 띄우는 방식(cron)과
+한 프로세스에서 클라이언트/추출 워커/캐시 연결을 유지하며 반복 실행하는 상주 모드(daemon)의
+실행별 소요 시간을 비교합니다. (cron은 프로세스 시작과 import 시간 포함)
+상주 모드의 /health, /last-run 엔드포인트 응답도 함께 확인합니다.
+
+실행: python -m benchmarks.bench_daemon [--news 60] [--runs 3] [--latency 0.1]
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from config import Config
+from benchmarks.stub_server import StubNewsServer
+
+
+async def run_child(args) -> None:
+    """cron 방식의 실행 한 번 (새 프로세스에서 import부터 보고서 저장까지)"""
+    Config.CACHE_DIR = args.cache_dir
+    from benchmarks.fake_llm import FakeNewsChatModel
+    from agents.collector import RSSCollectorAgent
+    from daemon import NewsDaemon
+
+    collector = RSSCollectorAgent(rss_urls=[args.rss_url])
+    collector.api_url = args.api_url
+    llm = FakeNewsChatModel(latency=args.latency, seed=1)
+    async with NewsDaemon(llm, collector=collector, output_dir=args.output_dir) as daemon:
+        await daemon.run_forever(max_runs=1)
+
+
+async def run(args) -> None:
+    import httpx
+
+    from benchmarks.fake_llm import FakeNewsChatModel
+    from agents.collector import RSSCollectorAgent
+
+    Config.SUMMARY_BACKEND = "llm"
+    output_dir = tempfile.mkdtemp(prefix="news_bench_reports_")
+    with StubNewsServer(n_articles=args.news, handshake_delay=0.03) as server:
+        print(f"기사 {args.news}건, 실행 {args.runs}회, 가짜 모델 지연 {args.latency}s\n")
+
+        # ① cron: 실행마다 새 프로세스 (캐시 디렉터리는 공유 = 디스크 캐시는 따뜻함)
+        cache_dir = tempfile.mkdtemp(prefix="news_bench_")
+        cron_times = []
+        for _ in range(args.runs):
+            started = time.perf_counter()
+            subprocess.run(
+                [
+                    sys.executable, "-m", "benchmarks.bench_daemon", "--child",
+                    "--rss-url", server.rss_url, "--api-url", server.api_url,
+                    "--cache-dir", cache_dir, "--output-dir", output_dir,
+                    "--latency", str(args.latency),
+                ],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                env={**os.environ, "SUMMARY_BACKEND": "llm"},
+            )
+            cron_times.append(time.perf_counter() - started)
+
+        # ② daemon: 한 프로세스에서 반복 실행
+        Config.CACHE_DIR = tempfile.mkdtemp(prefix="news_bench_")
+        from daemon import NewsDaemon
+
+        collector = RSSCollectorAgent(rss_urls=[server.rss_url])
+        collector.api_url = server.api_url
+        llm = FakeNewsChatModel(latency=args.latency, seed=1)
+        daemon_times = []
+        server.reset_counters()
+        async with NewsDaemon(llm, collector=collector, interval=0, output_dir=output_dir) as daemon:
+            http_server = await daemon.start_server(port=args.port)
+            for _ in range(args.runs):
+                started = time.perf_counter()
+                await daemon.run_once()
+                daemon_times.append(time.perf_counter() - started)
+            async with httpx.AsyncClient() as client:
+                health = await client.get(f"http://{Config.DAEMON_HOST}:{args.port}/health")
+                last_run = await client.get(f"http://{Config.DAEMON_HOST}:{args.port}/last-run")
+                metrics = await client.get(f"http://{Config.DAEMON_HOST}:{args.port}/metrics")
+            http_server.close()
+            await http_server.wait_closed()
+        daemon_connections = server.connections
+
+        print(f"\n{'실행':<6}{'cron(s)':>10}{'daemon(s)':>12}")
+        for i, (cron, resident) in enumerate(zip(cron_times, daemon_times), 1):
+            print(f"{i:<6}{cron:>10.3f}{resident:>12.3f}")
+        print(f"\ndaemon 전체 실행의 새 TCP 연결: {daemon_connections}개")
+        print(f"/health → {health.status_code} {health.text}")
+        print(f"/last-run → {last_run.status_code} {last_run.text[:300]}")
+        print(f"/metrics → {metrics.status_code}, {len(metrics.text.splitlines())}줄")
+        reports = [name for name in os.listdir(output_dir) if name.endswith(".md")]
+        leftovers = [name for name in os.listdir(output_dir) if name.endswith(".tmp")]
+        print(f"보고서 {len(reports)}개 저장, 남은 임시 파일 {len(leftovers)}개 ({output_dir})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--news", type=int, default=60)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--rss-url", help=argparse.SUPPRESS)
+    parser.add_argument("--api-url", help=argparse.SUPPRESS)
+    parser.add_argument("--cache-dir", help=argparse.SUPPRESS)
+    parser.add_argument("--output-dir", help=argparse.SUPPRESS)
+    parsed = parser.parse_args()
+    asyncio.run(run_child(parsed) if parsed.child else run(parsed))
@@ -0,0 +1,76 @@
+"""
+c-wiz[data-p] 추출 마이크로 벤치마크 - BeautifulSoup 전체 파싱과 정규식 스캔의
+페이지당 파싱 시간과 최대 메모리(tracemalloc)를 비교합니다.
+
+--fixtures 로 저장해 둔 Google News 기사 페이지(*.html) 폴더를 지정할 수 있고,
+지정하지 않으면 스텁 서버의 페이지 생성기로 고정 크기 페이지를 만듭니다.
+
+실행: python -m benchmarks.bench_data_p_scan [--fixtures DIR] [--page-kb 400] [--repeat 20]
+"""
+import argparse
+import glob
+import os
+import time
+import tracemalloc
+
+from agents.collector import RSSCollectorAgent
+from benchmarks.stub_server import StubNewsServer
+from decoder import scan_data_p
+
+
+def load_pages(args) -> list[str]:
+    if args.fixtures:
+        pages = []
+        for path in sorted(glob.glob(os.path.join(args.fixtures, "*.html"))):
+            with open(path, encoding="utf-8") as f:
+                pages.append(f.read())
+        return pages
+    stub = StubNewsServer(n_articles=5, page_padding_kb=args.page_kb)
+    return [stub.render_google_page(aid) for aid in stub.article_ids()]
+
+
+def measure(parse, pages: list[str], repeat: int) -> tuple[float, float, list]:
+    """페이지당 평균 시간(ms)과 최대 메모리(KB)"""
+    results = [parse(page) for page in pages]
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for page in pages:
+            parse(page)
+    per_page_ms = (time.perf_counter() - started) / (repeat * len(pages)) * 1000
+
+    peak_kb = 0.0
+    for page in pages:
+        tracemalloc.start()
+        parse(page)
+        peak_kb = max(peak_kb, tracemalloc.get_traced_memory()[1] / 1024)
+        tracemalloc.stop()
+    return per_page_ms, peak_kb, results
+
+
+def main(args) -> None:
+    pages = load_pages(args)
+    if not pages:
+        raise SystemExit("측정할 페이지가 없습니다.")
+    avg_kb = sum(len(page) for page in pages) / len(pages) / 1024
+    print(f"페이지 {len(pages)}개 (평균 {avg_kb:.0f}KB), 반복 {args.repeat}회\n")
+    print(f"{'방식':<14}{'ms/페이지':>12}{'최대 메모리(KB)':>18}")
+
+    baseline = None
+    for label, parse in (
+        ("beautifulsoup", RSSCollectorAgent.parse_data_p),
+        ("regex-scan", scan_data_p),
+    ):
+        per_page_ms, peak_kb, results = measure(parse, pages, args.repeat)
+        if baseline is None:
+            baseline = results
+        assert results == baseline, "두 방식의 추출 결과가 다릅니다"
+        print(f"{label:<14}{per_page_ms:>12.3f}{peak_kb:>18.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fixtures", help="저장된 *.html 페이지 폴더")
+    parser.add_argument("--page-kb", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=20)
+    main(parser.parse_args())
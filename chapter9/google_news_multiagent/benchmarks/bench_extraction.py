@@ -0,0 +1,47 @@
+"""
+본문 추출 벤치마크 - 이벤트 루프 스레드에서 바로 추출하는 방식(inline)과
+ArticleExtractor 프로세스 풀로 분산하는 방식(pool)을 비교합니다.
+
+실행: python -m benchmarks.bench_extraction [--articles 200] [--paragraphs 200] [--workers N]
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.stub_server import StubNewsServer
+from extraction import ArticleExtractor
+
+
+async def run(args) -> None:
+    # 서버를 띄우지 않고 스텁의 HTML 생성기만 사용
+    stub = StubNewsServer(n_articles=args.articles, article_paragraphs=args.paragraphs)
+    pages = [
+        (f"https://example.com/{aid}", stub.render_article(aid).encode("utf-8"))
+        for aid in stub.article_ids()
+    ]
+    size_kb = sum(len(html) for _, html in pages) / len(pages) / 1024
+    print(f"기사 {len(pages)}건 (평균 {size_kb:.0f}KB), 워커 {args.workers}개\n")
+    print(f"{'방식':<8}{'시간(s)':>10}{'기사/s':>10}")
+
+    for label, workers in (("inline", 0), ("pool", args.workers)):
+        extractor = ArticleExtractor(max_workers=workers)
+        if workers:
+            # 워커 기동(spawn + import) 비용은 측정에서 제외
+            await asyncio.gather(*(extractor.extract(*pages[0]) for _ in range(workers)))
+
+        started = time.perf_counter()
+        texts = await asyncio.gather(*(extractor.extract(url, html) for url, html in pages))
+        elapsed = time.perf_counter() - started
+        extractor.shutdown()
+
+        assert all(texts), "추출 실패 기사가 있습니다"
+        print(f"{label:<8}{elapsed:>10.3f}{len(pages) / elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=200)
+    parser.add_argument("--paragraphs", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,70 @@
+"""
+추출 요약 벤치마크 - 단일 코어에서 TextRank 추출 요약의 초당 처리 기사 수와,
+요약 방식 정책(auto)을 켰을 때 요약 단계의 LLM 호출 수/처리 시간을 LLM 전용(llm)과 비교합니다.
+
+실행: python -m benchmarks.bench_extractive_summary [--articles 300] [--budget 8000]
+"""
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from dataclasses import replace
+
+from article import Article
+from config import Config
+from benchmarks.fake_llm import FakeNewsChatModel
+from extractive import extractive_summary
+
+SUBJECTS = "정부 한국은행 삼성전자 국회 업계 전문가 관계자 시민단체 서울시 연구진".split()
+OBJECTS = "예산안을 기준금리를 반도체 투자를 법안을 수출 전망을 대책을 신제품을 조사 결과를".split()
+VERBS = "발표했다 동결했다 확대했다 통과시켰다 내놨다 공개했다 검토하고 있다고 밝혔다".split()
+
+
+def make_article(rng: random.Random, n_sentences: int) -> str:
+    return " ".join(
+        f"{rng.choice(SUBJECTS)}는 {rng.randint(1, 31)}일 {rng.choice(OBJECTS)} "
+        f"{rng.choice(OBJECTS)} {rng.choice(VERBS)}."
+        for _ in range(n_sentences)
+    )
+
+
+async def run(args) -> None:
+    rng = random.Random(0)
+    # 단신(2-4문장)과 일반 기사(10-35문장) 혼합
+    articles = [
+        make_article(rng, rng.randint(2, 4) if rng.random() < 0.3 else rng.randint(10, 35))
+        for _ in range(args.articles)
+    ]
+
+    started = time.perf_counter()
+    for text in articles:
+        extractive_summary(text, Config.EXTRACTIVE_SENTENCES)
+    elapsed = time.perf_counter() - started
+    print(f"추출 요약: {len(articles)}건 {elapsed:.3f}s → 초당 {len(articles) / elapsed:.0f}건 (단일 코어)\n")
+
+    Config.CACHE_DIR = tempfile.mkdtemp(prefix="news_bench_")
+    Config.SUMMARY_LLM_TOKEN_BUDGET = args.budget
+    from agents.summarizer import NewsSummarizerAgent
+    from state import NewsState
+
+    news = [Article(title=f"벤치마크 기사 {i}", content=text) for i, text in enumerate(articles)]
+    print(f"{'방식':<12}{'시간(s)':>10}{'LLM 호출':>10}  정책 결과")
+    for backend in ("llm", "auto"):
+        Config.SUMMARY_BACKEND = backend
+        Config.CACHE_DIR = tempfile.mkdtemp(prefix="news_bench_")
+        llm = FakeNewsChatModel(latency=args.latency)
+        agent = NewsSummarizerAgent(llm)
+        started = time.perf_counter()
+        # 요약은 기사 레코드에 직접 기록되므로 방식마다 새 레코드로 실행
+        state = await agent.summarize_news(NewsState(raw_news=[replace(n) for n in news]))
+        elapsed = time.perf_counter() - started
+        print(f"{backend:<12}{elapsed:>10.3f}{llm.calls:>10}  {state.run_stats['summary_backend']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=300)
+    parser.add_argument("--budget", type=int, default=40000, help="auto 모드 요약 LLM 토큰 상한")
+    parser.add_argument("--latency", type=float, default=0.2)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,79 @@
+"""
+요청 스케줄러 벤치마크 - 여러 언론사(스텁 서버 여러 개) 기사를 한꺼번에 내려받을 때
+제한 없는 동시 요청(before)과 FetchScheduler(after)의 성공 건수와 시간을 비교합니다.
+
+첫 번째 스텁은 동시 요청이 3개를 넘으면 429를 돌려주는 '민감한' 언론사입니다.
+
+실행: python -m benchmarks.bench_fetch_scheduler [--articles 40] [--publishers 3]
+"""
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from config import Config
+from agents.collector import RSSCollectorAgent
+from benchmarks.stub_server import StubNewsServer
+
+
+async def download_unbounded(urls: list[str]) -> list:
+    """before: 스케줄러 없이 모든 요청을 동시에 (429는 그대로 실패)"""
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(limits=limits, timeout=Config.HTTP_TIMEOUT) as client:
+
+        async def fetch(url: str):
+            try:
+                response = await client.get(url)
+                return response.content if response.status_code == 200 else None
+            except httpx.HTTPError:
+                return None
+
+        return await asyncio.gather(*(fetch(url) for url in urls))
+
+
+async def download_scheduled(urls: list[str]) -> list:
+    """after: 호스트별 적응형 동시성 + 백오프 재시도"""
+    async with RSSCollectorAgent() as agent:
+        results = await asyncio.gather(*(agent.download_article(url) for url in urls))
+        print(f"  스케줄러 통계: {agent.scheduler.stats()}")
+        return results
+
+
+async def run(args) -> None:
+    Config.FETCH_BACKOFF_BASE = 0.2
+    servers = [
+        StubNewsServer(
+            n_articles=args.articles,
+            handshake_delay=0,
+            article_delay=0.1,
+            max_concurrent_articles=3 if i == 0 else 0,
+        ).start()
+        for i in range(args.publishers)
+    ]
+    try:
+        urls = [
+            f"{server.base_url}/article/{aid}"
+            for server in servers
+            for aid in server.article_ids()
+        ]
+        print(f"언론사 {len(servers)}곳 x 기사 {args.articles}건\n")
+        for label, download in (("before", download_unbounded), ("after", download_scheduled)):
+            for server in servers:
+                server.reset_counters()
+            started = time.perf_counter()
+            results = await download(urls)
+            elapsed = time.perf_counter() - started
+            rejected = sum(server.requests.get("article_429", 0) for server in servers)
+            ok = sum(1 for r in results if r)
+            print(f"{label:<8}시간 {elapsed:.3f}s, 성공 {ok}/{len(urls)}, 429 응답 {rejected}회")
+    finally:
+        for server in servers:
+            server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=40)
+    parser.add_argument("--publishers", type=int, default=3)
+    asyncio.run(run(parser.parse_args()))
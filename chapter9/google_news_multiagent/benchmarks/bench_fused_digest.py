@@ -0,0 +1,51 @@
+"""
+요약·분류 통합 벤치마크 - 요약 → 분류 2단계 그래프(before)와 구조화 출력 한 번으로
+요약과 카테고리를 함께 받는 digest 노드(after)의 처리 시간, LLM 호출 수, 토큰 수를 비교합니다.
+(스텁 서버에서 수집까지 포함한 전체 그래프 실행, 수집 단계는 두 방식이 동일)
+
+실행: python -m benchmarks.bench_fused_digest [--news 60] [--latency 0.5]
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+
+from config import Config
+from benchmarks.fake_llm import FakeNewsChatModel
+from benchmarks.stub_server import StubNewsServer
+
+
+async def run(args) -> None:
+    from agents.collector import RSSCollectorAgent
+    from workflow import create_news_workflow
+    from state import NewsState
+
+    with StubNewsServer(n_articles=args.news, handshake_delay=0) as server:
+        print(f"기사 {args.news}건, 가짜 모델 지연 {args.latency}s\n")
+        print(
+            f"{'방식':<8}{'시간(s)':>10}{'LLM 호출':>10}{'입력 토큰':>12}"
+            f"{'출력 토큰':>12}{'보고서 기사':>12}"
+        )
+        for label, fused in (("before", False), ("after", True)):
+            # 방식마다 새 임시 캐시 (이전 실행의 요약/본문 캐시를 쓰지 않음)
+            Config.CACHE_DIR = tempfile.mkdtemp(prefix="news_bench_")
+            llm = FakeNewsChatModel(latency=args.latency, seed=1)
+            async with RSSCollectorAgent(rss_urls=[server.rss_url]) as collector:
+                collector.api_url = server.api_url
+                app = create_news_workflow(llm, collector=collector, fused=fused)
+                started = time.perf_counter()
+                final_state = await app.ainvoke(NewsState())
+                elapsed = time.perf_counter() - started
+            reported = sum(len(v) for v in final_state["categorized_news"].values())
+            assert final_state["final_report"]
+            print(
+                f"{label:<8}{elapsed:>10.3f}{llm.calls:>10}{llm.input_tokens:>12}"
+                f"{llm.output_tokens:>12}{reported:>12}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--news", type=int, default=60)
+    parser.add_argument("--latency", type=float, default=0.5)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,57 @@
+"""
+공유 커넥션 풀 벤치마크 - 기사마다 새 AsyncClient를 여는 방식(before)과
+에이전트가 하나의 클라이언트를 재사용하는 방식(after)을 비교합니다.
+
+실행: python -m benchmarks.bench_http_client [--articles 60] [--handshake-ms 30]
+"""
+import argparse
+import asyncio
+import time
+
+from agents.collector import RSSCollectorAgent
+from benchmarks.stub_server import StubNewsServer
+
+
+async def decode_with_fresh_clients(server: StubNewsServer, urls: list[str]) -> list:
+    """before: 기사마다 에이전트(=새 AsyncClient)를 만들고 닫음"""
+
+    async def decode_one(url: str):
+        async with RSSCollectorAgent() as agent:
+            agent.api_url = server.api_url
+            return await agent.extract_article_url(url)
+
+    return await asyncio.gather(*(decode_one(url) for url in urls))
+
+
+async def decode_with_shared_client(server: StubNewsServer, urls: list[str]) -> list:
+    """after: 하나의 에이전트가 커넥션 풀을 공유"""
+    async with RSSCollectorAgent() as agent:
+        agent.api_url = server.api_url
+        return await asyncio.gather(*(agent.extract_article_url(url) for url in urls))
+
+
+async def run(args) -> None:
+    with StubNewsServer(
+        n_articles=args.articles, handshake_delay=args.handshake_ms / 1000
+    ) as server:
+        urls = [f"{server.base_url}/rss/articles/{aid}" for aid in server.article_ids()]
+
+        print(f"기사 {len(urls)}건, 연결당 핸드셰이크 지연 {args.handshake_ms}ms\n")
+        print(f"{'방식':<8}{'시간(s)':>10}{'TCP 연결':>10}{'디코딩 성공':>12}")
+        for label, decode in (
+            ("before", decode_with_fresh_clients),
+            ("after", decode_with_shared_client),
+        ):
+            server.reset_counters()
+            started = time.perf_counter()
+            results = await decode(server, urls)
+            elapsed = time.perf_counter() - started
+            decoded = sum(1 for url in results if url)
+            print(f"{label:<8}{elapsed:>10.3f}{server.connections:>10}{decoded:>12}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=60)
+    parser.add_argument("--handshake-ms", type=float, default=30.0)
+    asyncio.run(run(parser.parse_args()))
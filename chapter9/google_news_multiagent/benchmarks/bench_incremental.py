@@ -0,0 +1,51 @@
+"""
+증분 수집 벤치마크 - 같은 피드를 연속으로 폴링할 때 첫 실행(전체 수집)과
+이후 실행(ETag 조건부 요청 + 처리한 항목 건너뛰기)의 시간과 요청 수를 비교합니다.
+
+실행: python -m benchmarks.bench_incremental [--articles 60] [--runs 3]
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+
+from config import Config
+from benchmarks.fake_llm import FakeNewsChatModel
+from benchmarks.stub_server import StubNewsServer
+
+
+async def run(args) -> None:
+    # 벤치마크용 임시 캐시 디렉터리 사용 (실제 캐시에 영향 없음)
+    Config.CACHE_DIR = tempfile.mkdtemp(prefix="news_bench_")
+    from agents.collector import RSSCollectorAgent
+    from workflow import create_news_workflow
+    from state import NewsState
+
+    with StubNewsServer(n_articles=args.articles, article_delay=0.05) as server:
+        print(f"기사 {args.articles}건, 증분 모드로 {args.runs}회 폴링\n")
+        print(f"{'실행':<6}{'시간(ms)':>10}{'새 항목':>8}{'피드 응답':>10}{'HTTP 요청':>10}{'LLM 호출':>10}")
+
+        llm = FakeNewsChatModel()
+        async with RSSCollectorAgent(incremental=True) as collector:
+            collector.rss_urls = [server.rss_url]
+            collector.api_url = server.api_url
+            app = create_news_workflow(llm, collector=collector)
+            for i in range(1, args.runs + 1):
+                server.reset_counters()
+                llm.calls = 0
+                started = time.perf_counter()
+                final = await app.ainvoke(NewsState())
+                elapsed = (time.perf_counter() - started) * 1000
+                stats = final["run_stats"]["incremental"]
+                print(
+                    f"{i:<6}{elapsed:>10.1f}{stats['new_entries']:>8}"
+                    f"{stats['feed_status'][server.rss_url]:>10}"
+                    f"{sum(server.requests.values()):>10}{llm.calls:>10}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=60)
+    parser.add_argument("--runs", type=int, default=3)
+    asyncio.run(run(parser.parse_args()))
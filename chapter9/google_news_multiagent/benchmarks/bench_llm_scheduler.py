@@ -0,0 +1,69 @@
+"""
+LLM 호출 스케줄링 벤치마크 - BATCH_SIZE 단위로 gather 후 다음 배치를 시작하는 방식(before)과
+슬라이딩 윈도 스케줄러(after)의 요약 단계 처리 시간을 지연 편차가 큰 가짜 모델로 비교합니다.
+
+실행: python -m benchmarks.bench_llm_scheduler [--news 100] [--latency 0.3] [--jitter 0.25]
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from dataclasses import replace
+
+from article import Article
+from config import Config
+from benchmarks.fake_llm import FakeNewsChatModel
+from llm_scheduler import LLMScheduler
+
+
+def make_news(n: int) -> list[Article]:
+    return [
+        Article(title=f"벤치마크 기사 {i}", content=f"기사 {i}의 본문입니다. " * 20)
+        for i in range(n)
+    ]
+
+
+async def batch_barrier(agent, news: list[Article]) -> list[Article]:
+    # 기존 방식: 배치 안의 가장 느린 요청이 끝나야 다음 배치 시작
+    results = []
+    for i in range(0, len(news), Config.BATCH_SIZE):
+        batch = news[i : i + Config.BATCH_SIZE]
+        results.extend(await asyncio.gather(*(agent.request_summary(n) for n in batch)))
+    return results
+
+
+async def run(args) -> None:
+    # 벤치마크용 임시 캐시 디렉터리 사용 (요약 캐시를 거치지 않고 매번 LLM 호출)
+    Config.CACHE_DIR = tempfile.mkdtemp(prefix="news_bench_")
+    from agents.summarizer import NewsSummarizerAgent
+
+    news = make_news(args.news)
+    print(
+        f"기사 {args.news}건, 지연 {args.latency}±{args.jitter}s, "
+        f"동시 요청 {Config.BATCH_SIZE}개\n"
+    )
+    print(f"{'방식':<8}{'시간(s)':>10}{'LLM 호출':>10}")
+
+    for label in ("before", "after"):
+        llm = FakeNewsChatModel(latency=args.latency, jitter=args.jitter, seed=1)
+        scheduler = LLMScheduler(
+            max_concurrency=Config.BATCH_SIZE, requests_per_minute=0, tokens_per_minute=0
+        )
+        agent = NewsSummarizerAgent(llm, scheduler)
+        items = [replace(n) for n in news]  # 요약이 레코드에 직접 기록되므로 방식마다 새 레코드
+        started = time.perf_counter()
+        if label == "before":
+            results = await batch_barrier(agent, items)
+        else:
+            results = await scheduler.map(agent.request_summary, items, label="요약")
+        elapsed = time.perf_counter() - started
+        assert [r.title for r in results] == [n.title for n in news]
+        print(f"{label:<8}{elapsed:>10.3f}{llm.calls:>10}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--news", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--jitter", type=float, default=0.25)
+    asyncio.run(run(parser.parse_args()))
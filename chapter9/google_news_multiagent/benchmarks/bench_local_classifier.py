@@ -0,0 +1,79 @@
+"""
+로컬 분류기 벤치마크 - 카테고리별 어휘로 만든 합성 기사로 학습한 뒤
+검증 기사에서 임계값별 로컬 처리 비율(LLM 호출 절약), LLM 라벨과의 일치율, 분류 시간을 측정합니다.
+(합성 데이터의 정답 카테고리를 LLM 라벨로 간주)
+
+실행: python -m benchmarks.bench_local_classifier [--train 600] [--valid 300] [--noise 0.8]
+"""
+import argparse
+import random
+import time
+
+from config import Config
+from classifier import LocalCategoryClassifier
+
+VOCABULARY = {
+    "경제": "주가 코스피 금리 환율 수출 반도체실적 기업 투자 물가 부동산 증시 매출 영업이익 은행",
+    "정치": "대통령 국회 여당 야당 의원 선거 공천 법안 탄핵 총리 정당 국정감사 대표 특검",
+    "사회": "경찰 검찰 사고 화재 재판 판결 학교 노동 파업 수사 구속 피해자 병원 의료",
+    "생활/문화": "영화 드라마 공연 여행 음식 축제 전시 배우 가수 날씨 건강 패션 도서 방송",
+    "IT/과학": "인공지능 AI 스마트폰 반도체 우주 연구 로봇 소프트웨어 데이터 플랫폼 통신 게임 과학자 기술",
+    "외교": "외교부 정상회담 북한 미국 중국 일본 대사 협상 제재 유엔 동맹 방문 장관 국제",
+}
+COMMON = "오늘 발표 관련 이번 지난 올해 정부 국내 해외 전망 논란 계획 소식 확대 추진"
+
+
+def make_articles(n: int, noise: float, rng: random.Random) -> list[tuple[str, str, str]]:
+    words = {category: vocab.split() for category, vocab in VOCABULARY.items()}
+    common = COMMON.split()
+    articles = []
+    for _ in range(n):
+        category = rng.choice(Config.NEWS_CATEGORIES)
+
+        def pick() -> str:
+            # noise 비율만큼 다른 카테고리/공통 어휘를 섞어 애매한 기사 생성
+            r = rng.random()
+            if r < noise / 2:
+                return rng.choice(words[rng.choice(Config.NEWS_CATEGORIES)])
+            if r < noise:
+                return rng.choice(common)
+            return rng.choice(words[category])
+
+        title = " ".join(pick() for _ in range(6)) + " - 합성일보"
+        summary = " ".join(pick() for _ in range(20))
+        articles.append((title, summary, category))
+    return articles
+
+
+def main(args) -> None:
+    rng = random.Random(0)
+    train = make_articles(args.train, args.noise, rng)
+    valid = make_articles(args.valid, args.noise, rng)
+
+    started = time.perf_counter()
+    model = LocalCategoryClassifier.fit(train)
+    print(f"학습 {len(train)}건: {time.perf_counter() - started:.2f}s")
+
+    started = time.perf_counter()
+    predictions = [model.predict(title, summary) for title, summary, _ in valid]
+    per_item = (time.perf_counter() - started) / len(valid) * 1e6
+    print(f"분류 시간: 기사당 {per_item:.0f}us (LLM 호출 대신)\n")
+
+    print(f"{'임계값':>6}{'로컬 처리':>10}{'LLM 호출':>10}{'일치율(로컬)':>14}{'전체 정확도':>12}")
+    for threshold in (0.0, 0.5, 0.7, 0.8, 0.9):
+        local = [(p, y) for (p, prob), (_, _, y) in zip(predictions, valid) if prob >= threshold]
+        agreement = sum(p == y for p, y in local) / len(local) if local else 0.0
+        # 로컬에서 확신하지 못한 기사는 LLM이 분류한다고 보고 정답 처리
+        overall = (sum(p == y for p, y in local) + len(valid) - len(local)) / len(valid)
+        print(
+            f"{threshold:>6.1f}{len(local):>10}{len(valid) - len(local):>10}"
+            f"{agreement:>14.1%}{overall:>12.1%}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--train", type=int, default=600)
+    parser.add_argument("--valid", type=int, default=300)
+    parser.add_argument("--noise", type=float, default=0.8)
+    main(parser.parse_args())
@@ -0,0 +1,58 @@
+"""
+다중 피드 수집 벤치마크 - 서로 겹치는 피드 여러 개를 피드마다 따로 수집하는 방식(before)과
+하나의 수집 에이전트가 합쳐서 중복 제거하는 방식(after)의 기사 다운로드 수와 LLM 호출 수를 비교합니다.
+
+실행: python -m benchmarks.bench_multi_feed [--feeds 5] [--per-feed 30] [--shift 10]
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+
+from config import Config
+from benchmarks.fake_llm import FakeNewsChatModel
+from benchmarks.stub_server import StubNewsServer
+
+
+async def run(args) -> None:
+    # 벤치마크용 임시 캐시 디렉터리 사용 (실제 캐시에 영향 없음)
+    Config.CACHE_DIR = tempfile.mkdtemp(prefix="news_bench_")
+    from agents.collector import RSSCollectorAgent
+    from workflow import create_news_workflow
+    from state import NewsState
+
+    n_unique = args.per_feed + args.shift * (args.feeds - 1)
+    with StubNewsServer(n_articles=n_unique, handshake_delay=0) as server:
+        feed_urls = [
+            f"{server.rss_url}?offset={i * args.shift}&count={args.per_feed}"
+            for i in range(args.feeds)
+        ]
+        print(f"피드 {args.feeds}개 x {args.per_feed}건 (고유 기사 {n_unique}건)\n")
+        print(f"{'방식':<8}{'시간(s)':>10}{'기사 다운로드':>14}{'LLM 호출':>10}")
+
+        async def collect(groups: list[list[str]]) -> tuple[float, int, int]:
+            # 방식마다 새 캐시 (before 안의 피드별 실행끼리는 캐시 공유)
+            Config.CACHE_DIR = tempfile.mkdtemp(prefix="news_bench_")
+            server.reset_counters()
+            llm = FakeNewsChatModel()
+            started = time.perf_counter()
+            for rss_urls in groups:
+                async with RSSCollectorAgent(rss_urls=rss_urls) as collector:
+                    collector.api_url = server.api_url
+                    await create_news_workflow(llm, collector=collector).ainvoke(NewsState())
+            return time.perf_counter() - started, server.requests.get("article", 0), llm.calls
+
+        for label, groups in (
+            ("before", [[url] for url in feed_urls]),
+            ("after", [feed_urls]),
+        ):
+            elapsed, downloads, calls = await collect(groups)
+            print(f"{label:<8}{elapsed:>10.3f}{downloads:>14}{calls:>10}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--feeds", type=int, default=5)
+    parser.add_argument("--per-feed", type=int, default=30)
+    parser.add_argument("--shift", type=int, default=10)
+    asyncio.run(run(parser.parse_args()))
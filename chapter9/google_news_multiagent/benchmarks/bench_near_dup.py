@@ -0,0 +1,108 @@
+"""
+유사 중복 기사 벤치마크 - 같은 사건을 언론사마다 조금씩 고쳐 쓴 합성 기사 묶음에서
+MinHash + LSH 그룹 정확도(정밀도/재현율), 기사당 처리 시간, 요약/분류 LLM 호출 절약을 측정합니다.
+
+실행: python -m benchmarks.bench_near_dup [--events 30] [--copies 3] [--unique 40] [--edit 0.05]
+"""
+import argparse
+import asyncio
+import itertools
+import random
+import tempfile
+import time
+from dataclasses import replace
+
+from article import Article
+from config import Config
+from benchmarks.bench_extractive_summary import make_article
+from benchmarks.fake_llm import FakeNewsChatModel
+from near_dup import MinHashLSH
+
+OUTLETS = ["한국경제", "경향신문", "조선일보", "연합뉴스", "매일경제", "한겨레"]
+
+
+def rewrite(text: str, rng: random.Random, edit: float, outlet: str) -> str:
+    # 단어 일부 치환 + 언론사 머리말/꼬리말 추가 (전재 기사에 흔한 형태)
+    words = [
+        rng.choice(["이날", "또한", "한편", "특히"]) if rng.random() < edit else word
+        for word in text.split(" ")
+    ]
+    return f"[{outlet}] " + " ".join(words) + f" ⓒ {outlet} 무단전재 및 재배포 금지."
+
+
+def make_corpus(args, rng: random.Random) -> tuple[list[Article], list[int]]:
+    news, truth = [], []
+    for event in range(args.events):
+        base = make_article(rng, rng.randint(12, 30))
+        for outlet in rng.sample(OUTLETS, args.copies):
+            news.append(Article(title=f"사건 {event} - {outlet}", source=outlet,
+                                original_url=f"https://{outlet}.example/{event}",
+                                content=rewrite(base, rng, args.edit, outlet)))
+            truth.append(event)
+    for i in range(args.unique):
+        outlet = rng.choice(OUTLETS)
+        news.append(Article(title=f"단독 {i} - {outlet}", source=outlet,
+                            original_url=f"https://{outlet}.example/u{i}",
+                            content=make_article(rng, rng.randint(12, 30))))
+        truth.append(args.events + i)
+    order = list(range(len(news)))
+    rng.shuffle(order)
+    return [news[i] for i in order], [truth[i] for i in order]
+
+
+def pairs(groups) -> set:
+    return {pair for group in groups for pair in itertools.combinations(sorted(group), 2)}
+
+
+async def run(args) -> None:
+    rng = random.Random(0)
+    news, truth = make_corpus(args, rng)
+    print(
+        f"기사 {len(news)}건 (사건 {args.events}개 x 언론사 {args.copies}곳 + 단독 {args.unique}건), "
+        f"단어 수정 비율 {args.edit}, 임계값 {Config.NEAR_DUP_THRESHOLD}\n"
+    )
+
+    index = MinHashLSH(Config.NEAR_DUP_THRESHOLD, Config.NEAR_DUP_NUM_PERM)
+    started = time.perf_counter()
+    groups = index.group([n.content for n in news])
+    per_item = (time.perf_counter() - started) / len(news) * 1e3
+    expected = {}
+    for i, label in enumerate(truth):
+        expected.setdefault(label, []).append(i)
+    found, true = pairs(groups), pairs(expected.values())
+    precision = len(found & true) / len(found) if found else 1.0
+    recall = len(found & true) / len(true) if true else 1.0
+    print(
+        f"LSH 밴드 {index.bands} x {index.rows}행, 그룹 {sum(len(g) > 1 for g in groups)}개, "
+        f"정밀도 {precision:.1%}, 재현율 {recall:.1%}, 기사당 {per_item:.2f}ms\n"
+    )
+
+    Config.CACHE_DIR = tempfile.mkdtemp(prefix="news_bench_")
+    from agents.deduplicator import NearDuplicateAgent
+    from agents.summarizer import NewsSummarizerAgent
+    from agents.organizer import NewsOrganizerAgent
+    from state import NewsState
+
+    Config.SUMMARY_BACKEND = "llm"
+    print(f"{'방식':<8}{'시간(s)':>10}{'요약/분류 기사':>14}{'LLM 호출':>10}")
+    for label, dedupe in (("before", False), ("after", True)):
+        Config.CACHE_DIR = tempfile.mkdtemp(prefix="news_bench_")
+        llm = FakeNewsChatModel(latency=args.latency)
+        state = NewsState(raw_news=[replace(n) for n in news])  # 방식마다 새 레코드
+        started = time.perf_counter()
+        if dedupe:
+            state = await NearDuplicateAgent().dedupe_news(state)
+        state = await NewsSummarizerAgent(llm).summarize_news(state)
+        state = await NewsOrganizerAgent(llm).organize_news(state)
+        elapsed = time.perf_counter() - started
+        print(f"{label:<8}{elapsed:>10.3f}{len(state.summarized_news):>14}{llm.calls:>10}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=30)
+    parser.add_argument("--copies", type=int, default=3)
+    parser.add_argument("--unique", type=int, default=40)
+    parser.add_argument("--edit", type=float, default=0.05)
+    parser.add_argument("--latency", type=float, default=0.2)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,65 @@
+"""
+묶음 요약 벤치마크 - 기사마다 요청하는 방식(K=1)과 기사 K건을 구조화 출력 요청 하나로
+묶는 방식의 처리 시간, LLM 호출 수, 입력/출력 토큰 수를 비교합니다.
+(가짜 모델: 요청당 고정 지연 + 출력 토큰당 지연, 묶음 응답 일부 누락)
+
+실행: python -m benchmarks.bench_packed_summary [--news 60] [--packs 1,4,8,16] [--drop-rate 0.05]
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from dataclasses import replace
+
+from article import Article
+from config import Config
+from benchmarks.fake_llm import FakeNewsChatModel
+
+
+async def run(args) -> None:
+    # 벤치마크용 임시 캐시 디렉터리 사용 (실행마다 새로 만들어 캐시 적중 없음)
+    Config.CACHE_DIR = tempfile.mkdtemp(prefix="news_bench_")
+    from agents.summarizer import NewsSummarizerAgent
+    from llm_scheduler import LLMScheduler
+    from state import NewsState
+
+    news = [
+        Article(title=f"벤치마크 기사 {i}", content=f"기사 {i}의 본문 문장입니다. " * 40)
+        for i in range(args.news)
+    ]
+    print(
+        f"기사 {args.news}건, 요청 지연 {args.latency}s + 출력 토큰당 {args.per_token}s, "
+        f"묶음 누락률 {args.drop_rate}\n"
+    )
+    print(
+        f"{'K':>4}{'시간(s)':>10}{'LLM 호출':>10}{'입력 토큰':>12}{'출력 토큰':>12}"
+        f"{'요약 완료':>10}"
+    )
+
+    for k in (int(k) for k in args.packs.split(",")):
+        Config.CACHE_DIR = tempfile.mkdtemp(prefix="news_bench_")
+        llm = FakeNewsChatModel(
+            latency=args.latency, per_token_latency=args.per_token, drop_rate=args.drop_rate
+        )
+        scheduler = LLMScheduler(requests_per_minute=0, tokens_per_minute=0)
+        agent = NewsSummarizerAgent(llm, scheduler, pack_size=k)
+        started = time.perf_counter()
+        state = await agent.summarize_news(NewsState(raw_news=[replace(n) for n in news]))
+        elapsed = time.perf_counter() - started
+        summarized = sum(
+            n.ai_summary.startswith("가짜 요약") for n in state.summarized_news
+        )
+        print(
+            f"{k:>4}{elapsed:>10.3f}{llm.calls:>10}{llm.input_tokens:>12}"
+            f"{llm.output_tokens:>12}{summarized:>10}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--news", type=int, default=60)
+    parser.add_argument("--packs", default="1,4,8,16")
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--per-token", type=float, default=0.01)
+    parser.add_argument("--drop-rate", type=float, default=0.05)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,257 @@
+"""
+전체 파이프라인 오프라인 벤치마크 - create_news_workflow를 외부 네트워크 없이 처음부터 끝까지 실행합니다.
+
+RSS, Google News 기사 페이지, batchexecute 디코딩 응답, 언론사 HTML은 로컬 스텁 서버가 응답하고
+(--html-dir로 저장해 둔 실제 언론사 HTML 사용 가능), LLM은 지연/편차를 설정한 가짜 모델을 사용합니다.
+
+시나리오(그래프 구성)마다 새 프로세스에서 실행하므로 최대 RSS가 서로 섞이지 않으며,
+노드별 소요 시간, 처리량(기사/s), 최대 RSS, LLM 호출·토큰 수, 스텁 서버 요청 수를 출력하고
+JSON 결과 파일로 저장합니다. --compare로 이전 결과(예: 다른 커밋)와 비교할 수 있습니다.
+
+실행: python -m benchmarks.bench_pipeline [--news 200] [--latency 0.2] [--jitter 0.1]
+      [--scenarios default,fused,streaming] [--warm] [--no-rate-limit]
+      [--output FILE] [--compare FILE]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from config import Config
+from benchmarks.stub_server import StubNewsServer
+
+# 시나리오 이름 → create_news_workflow 인자
+SCENARIOS = {
+    "default": {},
+    "fused": {"fused": True},
+    "streaming": {"streaming": True},
+    "plain": {"dedupe": False, "cluster": False},
+}
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def peak_rss_mb(who: int) -> float:
+    """getrusage 최대 RSS (리눅스는 KB, macOS는 바이트 단위)"""
+    peak = resource.getrusage(who).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def run_scenario(args) -> dict:
+    """시나리오 한 번 실행 (자식 프로세스) → 측정값"""
+    Config.CACHE_DIR = args.cache_dir
+    if args.no_rate_limit:
+        # 기사 수천 건 실행에서 분당 요청/토큰 한도 대기가 측정을 가리지 않도록
+        Config.LLM_REQUESTS_PER_MINUTE = 0
+        Config.LLM_TOKENS_PER_MINUTE = 0
+    from langchain_core.messages import HumanMessage
+
+    from benchmarks.fake_llm import FakeNewsChatModel
+    from agents.collector import RSSCollectorAgent
+    from workflow import create_news_workflow
+    from metrics import RunMetrics
+    from state import NewsState
+
+    rss_after_import = peak_rss_mb(resource.RUSAGE_SELF)
+    llm = FakeNewsChatModel(latency=args.latency, jitter=args.jitter, seed=1)
+    metrics = RunMetrics()
+    stages: dict[str, float] = {}
+    final_state: dict = {}
+    async with RSSCollectorAgent(rss_urls=[args.rss_url]) as collector:
+        collector.api_url = args.api_url
+        app = create_news_workflow(
+            llm, collector=collector, metrics=metrics, **SCENARIOS[args.child]
+        )
+        started = mark = time.perf_counter()
+        # ① 노드가 끝날 때마다 소요 시간 기록 (updates), 마지막 전체 상태 보관 (values)
+        async for mode, chunk in app.astream(
+            NewsState(messages=[HumanMessage(content="벤치마크 실행")]),
+            stream_mode=["updates", "values"],
+        ):
+            if mode == "updates":
+                now = time.perf_counter()
+                for node in chunk:
+                    stages[node] = round(now - mark, 3)
+                mark = now
+            else:
+                final_state = chunk
+        elapsed = time.perf_counter() - started
+    # ② 본문 추출 프로세스 풀은 collector 종료 시 정리되므로 이후에 자식 프로세스 RSS 측정
+
+    articles = len(final_state.get("raw_news", []))
+    return {
+        "wall_seconds": round(elapsed, 3),
+        "stages": stages,
+        "articles": articles,
+        "summarized": len(final_state.get("summarized_news", [])),
+        "reported": sum(len(v) for v in final_state.get("categorized_news", {}).values()),
+        "articles_per_second": round(articles / elapsed, 2) if elapsed else None,
+        "llm_calls": llm.calls,
+        "llm_input_tokens": llm.input_tokens,
+        "llm_output_tokens": llm.output_tokens,
+        "errors": len(final_state.get("error_log", [])),
+        "report_ok": bool(final_state.get("final_report")),
+        "rss_after_import_mb": rss_after_import,
+        "peak_rss_mb": peak_rss_mb(resource.RUSAGE_SELF),
+        "peak_rss_workers_mb": peak_rss_mb(resource.RUSAGE_CHILDREN),
+        # 에이전트가 기록한 실행 지표 (도메인별 HTTP 지연, LLM 지연·토큰, 캐시 적중률 등)
+        "metrics": metrics.to_dict(),
+    }
+
+
+def spawn_scenario(name: str, server: StubNewsServer, cache_dir: str, args) -> dict:
+    """시나리오를 새 프로세스에서 실행하고 결과 JSON과 스텁 서버 요청 수를 돌려줌"""
+    server.reset_counters()
+    fd, result_file = tempfile.mkstemp(prefix="news_bench_", suffix=".json")
+    os.close(fd)
+    try:
+        subprocess.run(
+            [
+                sys.executable, "-m", "benchmarks.bench_pipeline", "--child", name,
+                "--rss-url", server.rss_url, "--api-url", server.api_url,
+                "--cache-dir", cache_dir, "--result-file", result_file,
+                "--latency", str(args.latency), "--jitter", str(args.jitter),
+                *(["--no-rate-limit"] if args.no_rate_limit else []),
+            ],
+            check=True,
+            stdout=None if args.verbose else subprocess.DEVNULL,
+        )
+        with open(result_file, encoding="utf-8") as f:
+            result = json.load(f)
+    finally:
+        os.unlink(result_file)
+    result["http_requests"] = dict(server.requests)
+    result["http_connections"] = server.connections
+    return result
+
+
+def print_results(results: dict) -> None:
+    print(
+        f"{'시나리오':<18}{'시간(s)':>9}{'기사/s':>9}{'LLM 호출':>10}{'입력 토큰':>11}"
+        f"{'최대 RSS(MB)':>14}{'워커 RSS(MB)':>14}{'오류':>6}"
+    )
+    for name, r in results.items():
+        print(
+            f"{name:<18}{r['wall_seconds']:>9.3f}{r['articles_per_second']:>9.1f}{r['llm_calls']:>10}"
+            f"{r['llm_input_tokens']:>11}{r['peak_rss_mb']:>14.1f}{r['peak_rss_workers_mb']:>14.1f}"
+            f"{r['errors']:>6}"
+        )
+    print("\n노드별 소요 시간(s)")
+    for name, r in results.items():
+        print(f"  {name:<16}" + ", ".join(f"{node} {t:.3f}" for node, t in r["stages"].items()))
+
+
+def print_comparison(previous: dict, current: dict) -> None:
+    """같은 이름의 시나리오끼리 주요 지표 변화율 출력"""
+    print(f"\n이전 결과({previous.get('commit')}) 대비 변화")
+    keys = ("wall_seconds", "articles_per_second", "llm_calls", "peak_rss_mb")
+    print(f"{'시나리오':<18}" + "".join(f"{key:>22}" for key in keys))
+    for name, r in current["scenarios"].items():
+        before = previous.get("scenarios", {}).get(name)
+        if before is None:
+            continue
+        cells = []
+        for key in keys:
+            old, new = before.get(key), r.get(key)
+            change = f"{(new - old) / old:+.1%}" if old else "-"
+            cells.append(f"{old} → {new} ({change})")
+        print(f"{name:<18}" + "".join(f"{cell:>22}" for cell in cells))
+
+
+def run(args) -> None:
+    from utils import write_atomic
+
+    names = args.scenarios.split(",")
+    for name in names:
+        if name not in SCENARIOS:
+            raise SystemExit(f"알 수 없는 시나리오: {name} (사용 가능: {', '.join(SCENARIOS)})")
+
+    results: dict[str, dict] = {}
+    with StubNewsServer(
+        n_articles=args.news,
+        handshake_delay=args.handshake,
+        article_delay=args.article_delay,
+        article_html_dir=args.html_dir,
+    ) as server:
+        print(
+            f"기사 {args.news}건, 가짜 모델 지연 {args.latency}±{args.jitter}s, "
+            f"연결 지연 {args.handshake}s, 기사 응답 지연 {args.article_delay}s\n"
+        )
+        for name in names:
+            # 시나리오마다 빈 캐시에서 시작 (--warm이면 같은 캐시로 한 번 더 실행)
+            cache_dir = tempfile.mkdtemp(prefix="news_bench_")
+            results[name] = spawn_scenario(name, server, cache_dir, args)
+            if args.warm:
+                results[f"{name}-warm"] = spawn_scenario(name, server, cache_dir, args)
+
+    print_results(results)
+    output = {
+        "commit": git_commit(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {
+            "news": args.news,
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "handshake": args.handshake,
+            "article_delay": args.article_delay,
+            "html_dir": args.html_dir,
+            "llm_max_concurrency": Config.LLM_MAX_CONCURRENCY,
+            "rate_limit": not args.no_rate_limit,
+            "extract_workers": Config.EXTRACT_WORKERS,
+        },
+        "scenarios": results,
+    }
+    path = args.output or os.path.join(
+        RESULTS_DIR, f"pipeline_{datetime.now():%Y%m%d_%H%M%S}_{output['commit']}.json"
+    )
+    write_atomic(path, json.dumps(output, ensure_ascii=False, indent=2))
+    print(f"\n결과 저장: {path}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print_comparison(json.load(f), output)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--news", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--jitter", type=float, default=0.1)
+    parser.add_argument("--handshake", type=float, default=0.03)
+    parser.add_argument("--article-delay", type=float, default=0.05)
+    parser.add_argument("--html-dir", help="저장해 둔 언론사 HTML(*.html) 디렉터리")
+    parser.add_argument("--scenarios", default="default,fused,streaming")
+    parser.add_argument("--warm", action="store_true", help="같은 캐시로 한 번 더 실행")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--no-rate-limit", action="store_true", help="LLM 분당 요청/토큰 한도 끄기")
+    parser.add_argument("--verbose", action="store_true", help="에이전트 출력 표시")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--rss-url", help=argparse.SUPPRESS)
+    parser.add_argument("--api-url", help=argparse.SUPPRESS)
+    parser.add_argument("--cache-dir", help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", help=argparse.SUPPRESS)
+    parsed = parser.parse_args()
+    if parsed.child:
+        result = asyncio.run(run_scenario(parsed))
+        with open(parsed.result_file, "w", encoding="utf-8") as f:
+            json.dump(result, f)
+    else:
+        run(parsed)
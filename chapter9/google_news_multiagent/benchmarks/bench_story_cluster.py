@@ -0,0 +1,133 @@
+"""
+스토리 묶기 벤치마크 - 같은 사건을 언론사마다 다른 표현으로 쓴 합성 기사 묶음에서
+TF-IDF 평균 연결 군집의 정확도(쌍 정밀도/재현율)와 요약/분류 LLM 호출 수를 비교합니다.
+
+유사 중복(near_dup)과 달리 복사본이 아니라 사건 어휘(주체·대상·숫자)만 공유하는 기사입니다.
+
+실행: python -m benchmarks.bench_story_cluster [--events 30] [--outlets 3] [--unique 40]
+"""
+import argparse
+import asyncio
+import itertools
+import random
+import tempfile
+import time
+from dataclasses import replace
+
+from article import Article
+from config import Config
+from benchmarks.bench_extractive_summary import make_article
+from clustering import cluster_stories, story_text
+
+OUTLETS = ["한국경제", "경향신문", "조선일보", "연합뉴스", "매일경제", "한겨레"]
+ACTORS = (
+    "삼성전자 현대차 LG에너지솔루션 SK하이닉스 카카오 네이버 포스코 한국전력 쿠팡 셀트리온 "
+    "기획재정부 국토교통부 산업통상자원부 금융위원회 공정거래위원회 서울시 부산시 경기도 "
+    "한국은행 국민연금 대법원 검찰 국회 환경부 교육부 보건복지부 KT 한화 롯데 CJ"
+).split()
+TOPICS = (
+    "배터리 공장 반도체 설비 전기차 보조금 부동산 대출 기준금리 청년 일자리 원전 수출 "
+    "플랫폼 규제 의대 정원 출산 지원금 탄소 배출권 물류센터 신약 임상 수도권 교통망"
+).split()
+TITLE_TEMPLATES = [
+    "{actor}, {topic} {amount}억 {action}",
+    "[단독] {actor} '{topic}' {action}…규모 {amount}억",
+    "{topic} {amount}억 원 {action}한 {actor}",
+    "{actor} {action} 발표…{topic}에 {amount}억 투입",
+]
+LEAD_TEMPLATES = [
+    "{actor}가 {day}일 {topic} 관련 {amount}억 원 규모의 계획을 {action}했다.",
+    "{day}일 업계에 따르면 {actor}는 {topic}에 {amount}억 원을 쓰기로 했다.",
+    "{actor}의 {topic} {action} 소식이 {day}일 전해졌다. 규모는 {amount}억 원이다.",
+]
+ACTIONS = "발표 추진 확정 검토 착수 승인".split()
+
+
+def make_corpus(args, rng: random.Random) -> tuple[list[Article], list[int]]:
+    news, truth = [], []
+    for event in range(args.events):
+        fact = {
+            "actor": rng.choice(ACTORS),
+            "topic": " ".join(rng.sample(TOPICS, 2)),
+            "amount": rng.randint(100, 9999),
+            "day": rng.randint(1, 31),
+        }
+        for outlet in rng.sample(OUTLETS, args.outlets):
+            words = {**fact, "action": rng.choice(ACTIONS)}
+            title = rng.choice(TITLE_TEMPLATES).format(**words)
+            content = rng.choice(LEAD_TEMPLATES).format(**words) + " " + make_article(rng, 8)
+            news.append(Article(title=f"{title} - {outlet}", source=outlet,
+                                original_url=f"https://{outlet}.example/{event}",
+                                content=content))
+            truth.append(event)
+    for i in range(args.unique):
+        outlet = rng.choice(OUTLETS)
+        words = {"actor": rng.choice(ACTORS), "topic": " ".join(rng.sample(TOPICS, 2)),
+                 "amount": rng.randint(100, 9999), "day": rng.randint(1, 31),
+                 "action": rng.choice(ACTIONS)}
+        content = rng.choice(LEAD_TEMPLATES).format(**words) + " " + make_article(rng, 8)
+        news.append(Article(title=rng.choice(TITLE_TEMPLATES).format(**words) + f" - {outlet}",
+                            source=outlet, original_url=f"https://{outlet}.example/u{i}",
+                            content=content))
+        truth.append(args.events + i)
+    order = list(range(len(news)))
+    rng.shuffle(order)
+    return [news[i] for i in order], [truth[i] for i in order]
+
+
+def pairs(groups) -> set:
+    return {pair for group in groups for pair in itertools.combinations(sorted(group), 2)}
+
+
+async def run(args) -> None:
+    rng = random.Random(0)
+    news, truth = make_corpus(args, rng)
+    print(
+        f"기사 {len(news)}건 (사건 {args.events}개 x 언론사 {args.outlets}곳 + 단독 {args.unique}건)\n"
+    )
+
+    expected = {}
+    for i, label in enumerate(truth):
+        expected.setdefault(label, []).append(i)
+    true = pairs(expected.values())
+    texts = [story_text(n, n.stage_input("category")) for n in news]
+    print(f"{'임계값':<8}{'스토리':>8}{'정밀도':>10}{'재현율':>10}{'시간(ms)':>10}")
+    for threshold in sorted({0.3, 0.4, 0.5, 0.6, 0.7, Config.STORY_CLUSTER_THRESHOLD}):
+        started = time.perf_counter()
+        clusters = cluster_stories(texts, threshold)
+        elapsed = (time.perf_counter() - started) * 1e3
+        found = pairs(clusters)
+        precision = len(found & true) / len(found) if found else 1.0
+        recall = len(found & true) / len(true) if true else 1.0
+        print(f"{threshold:<8}{len(clusters):>8}{precision:>10.1%}{recall:>10.1%}{elapsed:>10.1f}")
+    print()
+
+    Config.CACHE_DIR = tempfile.mkdtemp(prefix="news_bench_")
+    from benchmarks.fake_llm import FakeNewsChatModel
+    from agents.clusterer import StoryClusterAgent
+    from agents.summarizer import NewsSummarizerAgent
+    from agents.organizer import NewsOrganizerAgent
+    from state import NewsState
+
+    Config.SUMMARY_BACKEND = "llm"
+    print(f"{'방식':<8}{'시간(s)':>10}{'요약 항목':>10}{'LLM 호출':>10}")
+    for label, cluster in (("before", False), ("after", True)):
+        Config.CACHE_DIR = tempfile.mkdtemp(prefix="news_bench_")
+        llm = FakeNewsChatModel(latency=args.latency)
+        state = NewsState(raw_news=[replace(n) for n in news])  # 방식마다 새 레코드
+        started = time.perf_counter()
+        if cluster:
+            state = await StoryClusterAgent().cluster_news(state)
+        state = await NewsSummarizerAgent(llm).summarize_news(state)
+        state = await NewsOrganizerAgent(llm).organize_news(state)
+        elapsed = time.perf_counter() - started
+        print(f"{label:<8}{elapsed:>10.3f}{len(state.summarized_news):>10}{llm.calls:>10}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=30)
+    parser.add_argument("--outlets", type=int, default=3)
+    parser.add_argument("--unique", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.2)
+    asyncio.run(run(parser.parse_args()))
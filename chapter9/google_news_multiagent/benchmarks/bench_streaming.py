@@ -0,0 +1,69 @@
+"""
+스트리밍 파이프라인 벤치마크 - 단계 장벽이 있는 그래프(before: collect → summarize → organize)와
+기사마다 단계를 바로 이어서 처리하는 스트리밍 노드(after)의 전체 시간과 첫 결과까지의 시간을 비교합니다.
+
+기사 다운로드 지연을 기사마다 다르게 주어(느린 언론사) 장벽 대기 비용을 재현하며,
+가장 느린 기사 한 건의 경로(다운로드 + 요약 + 분류 지연)를 임계 경로로 함께 출력합니다.
+
+실행: python -m benchmarks.bench_streaming [--news 60] [--spread 2.0] [--latency 0.5]
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+
+from config import Config
+from benchmarks.fake_llm import FakeNewsChatModel
+from benchmarks.stub_server import StubNewsServer
+
+
+async def run(args) -> None:
+    from agents.collector import RSSCollectorAgent
+    from workflow import create_news_workflow
+    from state import NewsState
+
+    # 전체 기사를 한 번에 봐야 하는 단계는 두 방식 모두 끔 (스트리밍에서 미사용)
+    Config.SUMMARY_BACKEND = "llm"
+    Config.LOCAL_CLASSIFIER = False
+    with StubNewsServer(
+        n_articles=args.news, handshake_delay=0, article_delay_spread=args.spread
+    ) as server:
+        delays = [server.article_delay_for(aid) for aid in server.article_ids()]
+        critical_path = max(delays) + 2 * (args.latency + args.jitter)
+        # 동시성 한도(호스트별 연결 수, LLM 동시 요청 수)로 정해지는 처리량 하한
+        throughput_bound = max(
+            sum(delays) / Config.HTTP_MAX_CONNECTIONS_PER_HOST,
+            2 * args.news * args.latency / Config.LLM_MAX_CONCURRENCY,
+        )
+        print(
+            f"기사 {args.news}건, 다운로드 지연 0~{args.spread}s (최대 {max(delays):.2f}s), "
+            f"가짜 모델 지연 {args.latency}±{args.jitter}s\n"
+            f"기사 한 건 임계 경로 약 {critical_path:.2f}s, 동시성 한도로 정해지는 하한 약 "
+            f"{throughput_bound:.2f}s\n"
+        )
+        print(f"{'방식':<8}{'시간(s)':>10}{'첫 결과(s)':>12}{'LLM 호출':>10}{'보고서 기사':>12}")
+        for label, streaming in (("before", False), ("after", True)):
+            Config.CACHE_DIR = tempfile.mkdtemp(prefix="news_bench_")
+            llm = FakeNewsChatModel(latency=args.latency, jitter=args.jitter, seed=1)
+            async with RSSCollectorAgent(rss_urls=[server.rss_url]) as collector:
+                collector.api_url = server.api_url
+                app = create_news_workflow(
+                    llm, collector=collector, dedupe=False, cluster=False, streaming=streaming
+                )
+                started = time.perf_counter()
+                final_state = await app.ainvoke(NewsState())
+                elapsed = time.perf_counter() - started
+            reported = sum(len(v) for v in final_state["categorized_news"].values())
+            assert final_state["final_report"]
+            first = final_state["run_stats"].get("streaming", {}).get("first_result_seconds")
+            first = f"{first:.3f}" if first is not None else "-"
+            print(f"{label:<8}{elapsed:>10.3f}{first:>12}{llm.calls:>10}{reported:>12}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--news", type=int, default=60)
+    parser.add_argument("--spread", type=float, default=2.0)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--jitter", type=float, default=0.2)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,48 @@
+"""
+요약 캐시 벤치마크 - 같은 기사 묶음을 두 번 요약할 때 첫 실행(캐시 미스)과
+두 번째 실행(캐시 적중)의 LLM 호출 수와 기사당 처리 시간을 비교합니다.
+
+실행: python -m benchmarks.bench_summary_cache [--news 200] [--latency 0.2]
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from dataclasses import replace
+
+from article import Article
+from config import Config
+from benchmarks.fake_llm import FakeNewsChatModel
+
+
+async def run(args) -> None:
+    # 벤치마크용 임시 캐시 디렉터리 사용 (실제 캐시에 영향 없음)
+    Config.CACHE_DIR = tempfile.mkdtemp(prefix="news_bench_")
+    from agents.summarizer import NewsSummarizerAgent
+    from state import NewsState
+
+    news = [
+        Article(title=f"벤치마크 기사 {i}", content=f"기사 {i}의 본문입니다. " * 40)
+        for i in range(args.news)
+    ]
+    print(f"기사 {args.news}건, 가짜 모델 지연 {args.latency}s\n")
+    print(f"{'실행':<8}{'시간(s)':>10}{'기사당(us)':>12}{'LLM 호출':>10}{'캐시 적중':>10}")
+
+    for label in ("cold", "warm"):
+        llm = FakeNewsChatModel(latency=args.latency)
+        agent = NewsSummarizerAgent(llm)
+        started = time.perf_counter()
+        state = await agent.summarize_news(NewsState(raw_news=[replace(n) for n in news]))
+        elapsed = time.perf_counter() - started
+        hits = state.run_stats["summary_cache"]["hits"]
+        print(
+            f"{label:<8}{elapsed:>10.3f}{elapsed / args.news * 1e6:>12.1f}"
+            f"{llm.calls:>10}{hits:>10}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--news", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.2)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,65 @@
+"""
+토큰 예산 자르기 벤치마크 - 한국어/영문 혼합 비율이 다른 기사에 대해 content[:500](before)과
+토큰 예산 자르기(after)의 입력 토큰 수 편차, 문장 중간에서 잘린 비율, 처리 시간을 비교합니다.
+
+실행: python -m benchmarks.bench_token_budget [--articles 300]
+"""
+import argparse
+import random
+import statistics
+import time
+
+from config import Config
+from token_budget import estimate_tokens, truncate_to_tokens
+
+KOREAN = [
+    "정부는 18일 내년도 예산안을 국회에 제출했다.",
+    "한국은행은 기준금리를 연 3.25%로 동결했다고 밝혔다.",
+    "업계에서는 하반기 수출 회복세가 이어질 것으로 전망하고 있다.",
+    "관계자는 \"추가 대책을 검토하고 있다\"고 말했다.",
+]
+ENGLISH = [
+    "Samsung Electronics reported an operating profit of 9.1 trillion won.",
+    "The company said demand for AI accelerators remained strong.",
+    "Analysts expect memory prices to rise through the next quarter.",
+    "NVIDIA CEO Jensen Huang visited Seoul on Tuesday.",
+]
+
+
+def make_article(rng: random.Random, english_ratio: float) -> str:
+    sentences = [
+        rng.choice(ENGLISH if rng.random() < english_ratio else KOREAN) for _ in range(30)
+    ]
+    return " ".join(sentences)
+
+
+def ends_mid_sentence(text: str) -> bool:
+    return not text.rstrip().endswith((".", "!", "?", "\"", "”"))
+
+
+def main(args) -> None:
+    rng = random.Random(0)
+    articles = [make_article(rng, rng.choice((0.0, 0.3, 0.7, 1.0))) for _ in range(args.articles)]
+    budget = Config.SUMMARY_INPUT_TOKENS
+    print(f"기사 {args.articles}건 (영문 비율 0/30/70/100% 혼합), 요약 입력 예산 {budget}토큰\n")
+    print(f"{'방식':<8}{'평균 토큰':>10}{'표준편차':>10}{'최대':>8}{'문장 중간 절단':>16}{'기사당(us)':>12}")
+
+    for label, cut in (
+        ("before", lambda text: text[:500]),
+        ("after", lambda text: truncate_to_tokens(text, budget)),
+    ):
+        started = time.perf_counter()
+        inputs = [cut(text) for text in articles]
+        per_item = (time.perf_counter() - started) / len(articles) * 1e6
+        tokens = [estimate_tokens(text) for text in inputs]
+        mid = sum(map(ends_mid_sentence, inputs)) / len(inputs)
+        print(
+            f"{label:<8}{statistics.mean(tokens):>10.1f}{statistics.pstdev(tokens):>10.1f}"
+            f"{max(tokens):>8}{mid:>16.0%}{per_item:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=300)
+    main(parser.parse_args())
@@ -0,0 +1,116 @@
+"""
+벤치마크용 가짜 채팅 모델 - OpenAI 호출 없이 지연 시간과 호출 수를 재현합니다.
+"""
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+from typing import Any, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from config import Config
+
+
+class FakeNewsChatModel(BaseChatModel):
+    """요약 요청에는 문장을, 분류 요청에는 카테고리를 돌려주는 가짜 모델
+
+    구조화 출력(with_structured_output)으로 묶음 요약을 요청하면 "[id: N]" 마다
+    요약 하나를 도구 호출 인자로 돌려주며, drop_rate 비율만큼 항목을 빠뜨립니다.
+    스키마에 category가 있으면 요약과 카테고리를 함께 돌려줍니다.
+    """
+
+    latency: float = 0.0  # 호출당 평균 지연(초)
+    jitter: float = 0.0  # 지연 편차(초, 균등 분포)
+    per_token_latency: float = 0.0  # 출력 토큰당 추가 지연(초)
+    drop_rate: float = 0.0  # 묶음 응답에서 빠뜨릴 항목 비율
+    seed: int = 0
+    calls: int = 0
+    input_chars: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-news-chat"
+
+    def bind_tools(self, tools: list, **kwargs: Any):
+        kwargs.pop("tool_choice", None)
+        return self.bind(tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs)
+
+    def _delay(self, output_tokens: int) -> float:
+        jitter = random.uniform(-self.jitter, self.jitter)
+        return max(0.0, self.latency + jitter + output_tokens * self.per_token_latency)
+
+    @staticmethod
+    def _summary(digest: int) -> str:
+        return f"가짜 요약 {digest % 10000:04d}. 벤치마크용으로 생성된 두 번째 문장입니다."
+
+    def _respond(self, messages: list[BaseMessage], tools: Optional[list]) -> AIMessage:
+        self.calls += 1
+        prompt = "\n".join(str(message.content) for message in messages)
+        self.input_chars += len(prompt)
+        digest = int(hashlib.md5(f"{self.seed}:{prompt}".encode("utf-8")).hexdigest(), 16)
+        tool_calls = []
+
+        properties = tools[0]["function"]["parameters"]["properties"] if tools else {}
+        if "category" in properties:
+            # 요약+분류 동시 요청: 같은 입력에는 항상 같은 카테고리
+            args = {
+                "summary": self._summary(digest),
+                "category": Config.NEWS_CATEGORIES[digest % len(Config.NEWS_CATEGORIES)],
+            }
+            tool_calls = [
+                {"name": tools[0]["function"]["name"], "args": args, "id": f"call_{self.calls}"}
+            ]
+            text = ""
+            output_chars = len(json.dumps(args, ensure_ascii=False))
+        elif tools:
+            # 묶음 요약: 본문의 [id: N] 마다 요약 하나 (일부는 drop_rate로 누락)
+            rng = random.Random(digest)
+            items = [
+                {"id": int(i), "summary": self._summary(digest + int(i))}
+                for i in re.findall(r"\[id: (\d+)\]", prompt)
+                if rng.random() >= self.drop_rate
+            ]
+            args = {"summaries": items}
+            tool_calls = [
+                {"name": tools[0]["function"]["name"], "args": args, "id": f"call_{self.calls}"}
+            ]
+            text = ""
+            output_chars = len(json.dumps(args, ensure_ascii=False))
+        elif "카테고리" in str(messages[0].content):
+            # 같은 입력에는 항상 같은 카테고리 (결과 재현 가능)
+            text = Config.NEWS_CATEGORIES[digest % len(Config.NEWS_CATEGORIES)]
+            output_chars = len(text)
+        else:
+            text = self._summary(digest)
+            output_chars = len(text)
+
+        usage = {
+            "input_tokens": len(prompt) // 2,
+            "output_tokens": output_chars // 2,
+            "total_tokens": (len(prompt) + output_chars) // 2,
+        }
+        self.input_tokens += usage["input_tokens"]
+        self.output_tokens += usage["output_tokens"]
+        return AIMessage(content=text, tool_calls=tool_calls, usage_metadata=usage)
+
+    def _generate(
+        self, messages: list[BaseMessage], stop: Optional[list[str]] = None, **kwargs: Any
+    ) -> ChatResult:
+        message = self._respond(messages, kwargs.get("tools"))
+        time.sleep(self._delay(message.usage_metadata["output_tokens"]))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(
+        self, messages: list[BaseMessage], stop: Optional[list[str]] = None, **kwargs: Any
+    ) -> ChatResult:
+        message = self._respond(messages, kwargs.get("tools"))
+        await asyncio.sleep(self._delay(message.usage_metadata["output_tokens"]))
+        return ChatResult(generations=[ChatGeneration(message=message)])
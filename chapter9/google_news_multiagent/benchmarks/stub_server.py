@@ -0,0 +1,269 @@
+"""
+Google News / 언론사 서버를 흉내 내는 로컬 스텁 서버 (벤치마크 전용)
+
+- GET  /rss[?offset=K&count=M]           : N개 항목(또는 K부터 M개)의 RSS 피드
+- GET  /rss/articles/<id>                : c-wiz[data-p]가 포함된 Google News 기사 페이지
+- POST /_/DotsSplashUi/data/batchexecute : 원문 URL 디코딩 API
+- GET  /article/<id>                     : 언론사 기사 HTML (동시 요청 상한 초과 시 429)
+
+새 TCP 연결마다 handshake_delay 만큼 지연시켜 TLS 핸드셰이크 비용을 재현합니다.
+article_html_dir를 주면 생성한 기사 대신 저장해 둔 실제 언론사 HTML(*.html)을 돌아가며 응답합니다.
+"""
+import html
+import json
+import os
+import random
+import re
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+API_PATH = "/_/DotsSplashUi/data/batchexecute"
+ARTICLE_ID_PATTERN = re.compile(r"art\d{5}")
+# 기사마다 다른 어휘를 쓰도록 음절 조합으로 만든 가상 단어 (유사 중복/스토리 묶기에 걸리지 않음)
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주"
+ARTICLE_WORDS = [a + b for a in SYLLABLES for b in SYLLABLES]
+
+
+def article_words(aid: str, salt: str, n: int) -> list[str]:
+    """기사 ID로 고정한 난수로 고른 가상 단어 n개"""
+    rng = random.Random(f"{aid}:{salt}")
+    return [rng.choice(ARTICLE_WORDS) for _ in range(n)]
+
+
+class StubNewsServer:
+    """백그라운드 스레드에서 동작하는 스텁 서버"""
+
+    def __init__(
+        self,
+        n_articles: int = 60,
+        handshake_delay: float = 0.03,
+        response_delay: float = 0.0,
+        article_delay: float = 0.0,
+        article_delay_spread: float = 0.0,
+        page_padding_kb: int = 0,
+        article_paragraphs: int = 20,
+        max_concurrent_articles: int = 0,
+        article_html_dir: str = None,
+    ):
+        self.n_articles = n_articles
+        self.handshake_delay = handshake_delay
+        self.response_delay = response_delay
+        self.article_delay = article_delay
+        # 기사마다 0 ~ spread초 추가 지연 (ID로 고정, 느린 언론사 재현)
+        self.article_delay_spread = article_delay_spread
+        self.page_padding_kb = page_padding_kb
+        self.article_paragraphs = article_paragraphs
+        # 0보다 크면 동시 기사 요청이 이 수를 넘을 때 429로 응답 (언론사 rate limit 재현)
+        self.max_concurrent_articles = max_concurrent_articles
+        self.articles_in_flight = 0
+        # 저장해 둔 언론사 HTML (기사 ID 번호 순서대로 돌아가며 사용)
+        self.article_pages: list[str] = []
+        if article_html_dir:
+            for name in sorted(os.listdir(article_html_dir)):
+                if name.endswith(".html"):
+                    with open(os.path.join(article_html_dir, name), encoding="utf-8", errors="replace") as f:
+                        self.article_pages.append(f.read())
+            if not self.article_pages:
+                raise ValueError(f"{article_html_dir}에 .html 파일이 없습니다.")
+        self.started_at = time.time()
+        self.connections = 0
+        self.requests: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def rss_url(self) -> str:
+        return f"{self.base_url}/rss"
+
+    @property
+    def api_url(self) -> str:
+        return f"{self.base_url}{API_PATH}"
+
+    def article_ids(self) -> list[str]:
+        return [f"art{i:05d}" for i in range(self.n_articles)]
+
+    def article_delay_for(self, aid: str) -> float:
+        return self.article_delay + random.Random(aid).random() * self.article_delay_spread
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.requests[key] = self.requests.get(key, 0) + 1
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.connections = 0
+            self.requests = {}
+
+    # --- 응답 본문 생성 -------------------------------------------------
+
+    def render_rss(self, offset: int = 0, count: int = None) -> str:
+        """offset/count로 기사 범위를 잘라 서로 겹치는 여러 피드를 흉내 냄"""
+        pub_date = formatdate(self.started_at, usegmt=True)
+        article_ids = self.article_ids()
+        if count is not None:
+            article_ids = [
+                article_ids[(offset + i) % len(article_ids)] for i in range(count)
+            ]
+        items = "".join(
+            f"""<item><title>스텁 기사 {aid} {' '.join(article_words(aid, 'title', 4))}</title>
+<link>{self.base_url}/rss/articles/{aid}?oc=5</link>
+<guid isPermaLink="false">{aid}</guid>
+<pubDate>{pub_date}</pubDate>
+<source url="{self.base_url}">스텁 언론사 {int(aid[3:]) % 7}</source></item>"""
+            for aid in article_ids
+        )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f"<title>Stub News</title><link>{self.base_url}</link>{items}</channel></rss>"
+        )
+
+    def render_google_page(self, aid: str) -> str:
+        # 실제 페이지처럼 "%.@." 접두어 뒤에 여는 대괄호가 빠진 JSON 배열
+        data_p = "%.@." + json.dumps(["ko", "KR", aid, 0, 0, 0, 0, 1700000000, "sig"])[1:]
+        padding = "<div class='pad'>" + "x" * 1024 + "</div>"
+        return (
+            "<!doctype html><html><head><title>Google News</title></head><body>"
+            + padding * self.page_padding_kb
+            + f'<c-wiz jsrenderer="stub" data-p="{html.escape(data_p)}"><div>{aid}</div></c-wiz>'
+            + "</body></html>"
+        )
+
+    def render_batchexecute(self, body: str) -> str:
+        f_req = json.loads(parse_qs(body)["f.req"][0])
+        entries = []
+        for rpc in f_req[0]:
+            match = ARTICLE_ID_PATTERN.search(rpc[1])
+            url = f"{self.base_url}/article/{match.group(0)}" if match else None
+            entries.append(
+                ["wrb.fr", rpc[0], json.dumps(["garturlres", url, 1]), None, None, None, rpc[3]]
+            )
+        return ")]}'\n\n" + json.dumps(entries)
+
+    def render_article(self, aid: str) -> str:
+        if self.article_pages:
+            return self.article_pages[int(aid[3:]) % len(self.article_pages)]
+        # 기사마다 다른 문장 (ID로 고정한 난수로 가상 단어 조합)
+        paragraphs = "".join(
+            f"<p>{aid} 기사의 {i}번째 문단입니다. "
+            + " ".join(
+                " ".join(article_words(aid, f"{i}:{j}", 3)) + "했다."
+                for j in range(3)
+            )
+            + "</p>"
+            for i in range(self.article_paragraphs)
+        )
+        return (
+            f"<!doctype html><html lang='ko'><head><title>{aid}</title></head>"
+            f"<body><article><h1>스텁 기사 {aid}</h1>{paragraphs}</article></body></html>"
+        )
+
+    # --- 서버 수명 관리 -------------------------------------------------
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive 지원
+
+            def setup(self):
+                with server._lock:
+                    server.connections += 1
+                time.sleep(server.handshake_delay)
+                super().setup()
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, body: str, content_type: str, status: int = 200, headers=None):
+                data = body.encode("utf-8")
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                path = urlsplit(self.path).path
+                query = parse_qs(urlsplit(self.path).query)
+                time.sleep(server.response_delay)
+                if path == "/rss":
+                    # 기사 목록이 같으면 ETag가 같으므로 조건부 요청에 304로 응답
+                    offset = int(query.get("offset", ["0"])[0])
+                    count = int(query["count"][0]) if "count" in query else None
+                    etag = f'"{server.n_articles}-{offset}-{count}"'
+                    if self.headers.get("If-None-Match") == etag:
+                        server.count("rss_not_modified")
+                        self.send_response(304)
+                        self.send_header("ETag", etag)
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    server.count("rss")
+                    self._send(
+                        server.render_rss(offset, count),
+                        "application/rss+xml; charset=utf-8",
+                        headers={"ETag": etag},
+                    )
+                elif path.startswith("/rss/articles/"):
+                    server.count("google_page")
+                    aid = path.rsplit("/", 1)[-1]
+                    self._send(server.render_google_page(aid), "text/html; charset=utf-8")
+                elif path.startswith("/article/"):
+                    with server._lock:
+                        server.articles_in_flight += 1
+                        in_flight = server.articles_in_flight
+                    try:
+                        if server.max_concurrent_articles and in_flight > server.max_concurrent_articles:
+                            server.count("article_429")
+                            self._send("too many requests", "text/plain", status=429)
+                            return
+                        server.count("article")
+                        aid = path.rsplit("/", 1)[-1]
+                        time.sleep(server.article_delay_for(aid))
+                        self._send(server.render_article(aid), "text/html; charset=utf-8")
+                    finally:
+                        with server._lock:
+                            server.articles_in_flight -= 1
+                else:
+                    self._send("not found", "text/plain", status=404)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length).decode("utf-8")
+                time.sleep(server.response_delay)
+                if urlsplit(self.path).path == API_PATH:
+                    server.count("batchexecute")
+                    self._send(server.render_batchexecute(body), "application/json; charset=utf-8")
+                else:
+                    self._send("not found", "text/plain", status=404)
+
+        return Handler
+
+    def start(self) -> "StubNewsServer":
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+
+    def __enter__(self) -> "StubNewsServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
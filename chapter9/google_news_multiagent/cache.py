@@ -0,0 +1,243 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Optional
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """캐시용 SQLite 연결 (autocommit + WAL: 여러 프로세스가 같은 파일을 동시에 읽고 써도 안전)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    return conn
+
+
+class SQLiteCache:
+    """TTL과 최대 항목 수(LRU 제거)를 가진 SQLite 기반 key-value 캐시"""
+
+    EVICT_EVERY = 64  # 쓰기 N회마다 만료/초과 항목 정리
+
+    def __init__(self, path: str, table: str, ttl: float, max_entries: int):
+        self.path = path
+        self.table = table
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+
+        self._conn = connect(path)
+        self._conn.execute(
+            f"""CREATE TABLE IF NOT EXISTS {table} (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {table}_accessed ON {table}(accessed_at)"
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (만료된 항목은 삭제 후 미스로 처리)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, created_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl:
+                if row is not None:
+                    self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+
+            # ① 최근 사용 시각 갱신 (LRU 제거 기준)
+            self._conn.execute(
+                f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, value: Any) -> None:
+        """캐시 저장 (같은 키는 덮어쓰기)"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            self._writes += 1
+            if self._writes % self.EVICT_EVERY == 0:
+                self._evict()
+
+    def _evict(self) -> None:
+        # ② 만료 항목 삭제 후, 최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+        self._conn.execute(
+            f"DELETE FROM {self.table} WHERE created_at < ?", (time.time() - self.ttl,)
+        )
+        (count,) = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()
+        if count > self.max_entries:
+            self._conn.execute(
+                f"""DELETE FROM {self.table} WHERE key IN (
+                    SELECT key FROM {self.table} ORDER BY accessed_at LIMIT ?
+                )""",
+                (count - self.max_entries,),
+            )
+
+    def values(self) -> list[Any]:
+        """만료되지 않은 모든 값 (학습 데이터 조회 등 일괄 처리용)"""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT value FROM {self.table} WHERE created_at >= ?",
+                (time.time() - self.ttl,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def evict(self) -> None:
+        """만료/초과 항목을 즉시 정리합니다."""
+        with self._lock:
+            self._evict()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """적중/미스 통계"""
+        return {"hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class ArticleStore:
+    """정규화 URL → 추출 본문을 저장하는 내용 주소(content-addressed) 기사 저장소
+
+    본문은 SHA-256 해시로 한 번만 저장하고(같은 본문을 가진 URL은 공유),
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 URL부터 제거합니다.
+    """
+
+    EVICT_EVERY = 32
+
+    def __init__(self, path: str, ttl: float, max_bytes: int, store_html: bool = False):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.store_html = store_html
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+
+        self._conn = connect(path)
+        self._conn.executescript(
+            """CREATE TABLE IF NOT EXISTS contents (
+                hash TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                html BLOB,
+                size INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS articles (
+                url_key TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS articles_accessed ON articles(accessed_at);"""
+        )
+
+    def get(self, url_key: str) -> Optional[dict[str, Any]]:
+        """저장된 본문 조회 → {"text", "hash", "fetched_at"} (만료/없음이면 None)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                """SELECT c.text, a.content_hash, a.fetched_at FROM articles a
+                JOIN contents c ON c.hash = a.content_hash WHERE a.url_key = ?""",
+                (url_key,),
+            ).fetchone()
+            if row is None or now - row[2] > self.ttl:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE articles SET accessed_at = ? WHERE url_key = ?", (now, url_key)
+            )
+            self.hits += 1
+            return {"text": row[0], "hash": row[1], "fetched_at": row[2]}
+
+    def get_html(self, url_key: str) -> Optional[bytes]:
+        """압축 저장한 원본 HTML 조회 (store_html=True로 저장한 경우)"""
+        with self._lock:
+            row = self._conn.execute(
+                """SELECT c.html FROM articles a
+                JOIN contents c ON c.hash = a.content_hash WHERE a.url_key = ?""",
+                (url_key,),
+            ).fetchone()
+        return zlib.decompress(row[0]) if row and row[0] else None
+
+    def put(self, url_key: str, text: str, html: Optional[bytes] = None) -> str:
+        """본문 저장 후 내용 해시를 반환합니다."""
+        content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        compressed = zlib.compress(html, 6) if html and self.store_html else None
+        size = len(text.encode("utf-8")) + (len(compressed) if compressed else 0)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO contents VALUES (?, ?, ?, ?)",
+                (content_hash, text, compressed, size),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?)",
+                (url_key, content_hash, now, now),
+            )
+            self._writes += 1
+            if self._writes % self.EVICT_EVERY == 0:
+                self._evict()
+        return content_hash
+
+    def _total_bytes(self) -> int:
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM contents").fetchone()[0]
+
+    def _evict(self) -> None:
+        # ① 만료된 URL 삭제
+        self._conn.execute(
+            "DELETE FROM articles WHERE fetched_at < ?", (time.time() - self.ttl,)
+        )
+        # ② 용량 초과 시 가장 오래 사용하지 않은 URL부터 묶음 단위로 삭제
+        while self._total_bytes() > self.max_bytes:
+            deleted = self._conn.execute(
+                """DELETE FROM articles WHERE url_key IN (
+                    SELECT url_key FROM articles ORDER BY accessed_at LIMIT 64
+                )"""
+            ).rowcount
+            self._delete_orphans()
+            if not deleted:
+                break
+        self._delete_orphans()
+
+    def _delete_orphans(self) -> None:
+        # 어떤 URL도 참조하지 않는 본문 삭제
+        self._conn.execute(
+            "DELETE FROM contents WHERE hash NOT IN (SELECT content_hash FROM articles)"
+        )
+
+    def evict(self) -> None:
+        with self._lock:
+            self._evict()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,411 @@
+"""
+LangGraph 워크플로우 체크포인터 - 실행 ID(thread_id)별 그래프 상태를 로컬 SQLite 파일에 저장
+
+노드가 상태 전체를 돌려주므로 매 단계 raw_news 같은 큰 채널도 새 버전으로 기록됩니다.
+채널 값은 직렬화 결과의 SHA-256 해시로 한 번만 저장하고(내용이 같은 버전은 공유),
+큰 값은 zlib으로 압축해 체크포인트 쓰기 비용을 노드 실행 시간에 비해 작게 유지합니다.
+"""
+import hashlib
+import os
+import random
+import threading
+import time
+import zlib
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import Any, Optional
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+from cache import connect
+from config import Config
+
+COMPRESS_MIN_BYTES = 512  # 이보다 큰 직렬화 값만 압축
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    parent_id TEXT,
+    checkpoint BLOB NOT NULL,
+    metadata BLOB NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS channel_versions (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    version TEXT NOT NULL,
+    hash TEXT,
+    PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    compressed INTEGER NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    task_path TEXT NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+"""
+
+
+class SQLiteCheckpointSaver(BaseCheckpointSaver[str]):
+    """실행 ID별 체크포인트를 SQLite에 저장하는 체크포인터 (runs 테이블로 실행 상태도 기록)"""
+
+    def __init__(self, path: Optional[str] = None, max_runs: Optional[int] = None, serde=None):
+        super().__init__(serde=serde)
+        self.path = path or os.path.join(Config.CACHE_DIR, Config.CHECKPOINT_FILE)
+        self.max_runs = max_runs or Config.CHECKPOINT_MAX_RUNS
+        self.bytes_written = 0
+        self.write_seconds = 0.0
+        self._lock = threading.Lock()
+        self._conn = connect(self.path)
+        self._conn.executescript(SCHEMA)
+
+    # --- 직렬화 -----------------------------------------------------------
+
+    def _store_blob(self, value: Any) -> str:
+        """값을 직렬화해 내용 해시로 저장하고 해시를 반환합니다. (같은 내용은 한 번만 저장)"""
+        type_, data = self.serde.dumps_typed(value)
+        digest = hashlib.sha256(type_.encode("utf-8") + b"\0" + data).hexdigest()
+        compressed = len(data) > COMPRESS_MIN_BYTES
+        if compressed:
+            data = zlib.compress(data, 1)
+        inserted = self._conn.execute(
+            "INSERT OR IGNORE INTO blobs VALUES (?, ?, ?, ?)",
+            (digest, type_, int(compressed), data),
+        ).rowcount
+        if inserted:
+            self.bytes_written += len(data)
+        return digest
+
+    def _load_blob(self, digest: str) -> Any:
+        type_, compressed, data = self._conn.execute(
+            "SELECT type, compressed, data FROM blobs WHERE hash = ?", (digest,)
+        ).fetchone()
+        return self.serde.loads_typed((type_, zlib.decompress(data) if compressed else data))
+
+    def _dumps(self, value: Any) -> bytes:
+        type_, data = self.serde.dumps_typed(value)
+        return type_.encode("utf-8") + b"\0" + data
+
+    def _loads(self, raw: bytes) -> Any:
+        type_, data = raw.split(b"\0", 1)
+        return self.serde.loads_typed((type_.decode("utf-8"), data))
+
+    # --- 조회 -------------------------------------------------------------
+
+    def _to_tuple(self, thread_id: str, checkpoint_ns: str, row: tuple) -> CheckpointTuple:
+        checkpoint_id, parent_id, checkpoint_raw, metadata_raw = row
+        checkpoint: Checkpoint = self._loads(checkpoint_raw)
+        channel_values = {}
+        for channel, version in checkpoint["channel_versions"].items():
+            found = self._conn.execute(
+                """SELECT hash FROM channel_versions
+                WHERE thread_id = ? AND checkpoint_ns = ? AND channel = ? AND version = ?""",
+                (thread_id, checkpoint_ns, channel, str(version)),
+            ).fetchone()
+            if found and found[0] is not None:
+                channel_values[channel] = self._load_blob(found[0])
+        writes = self._conn.execute(
+            """SELECT task_id, channel, hash FROM writes
+            WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?
+            ORDER BY task_id, idx""",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+
+        def config_for(cid: str) -> RunnableConfig:
+            return {
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": cid,
+                }
+            }
+
+        return CheckpointTuple(
+            config=config_for(checkpoint_id),
+            checkpoint={**checkpoint, "channel_values": channel_values},
+            metadata=self._loads(metadata_raw),
+            parent_config=config_for(parent_id) if parent_id else None,
+            pending_writes=[
+                (task_id, channel, self._load_blob(digest)) for task_id, channel, digest in writes
+            ],
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """checkpoint_id가 있으면 해당 체크포인트, 없으면 실행의 가장 최근 체크포인트"""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        query = """SELECT checkpoint_id, parent_id, checkpoint, metadata FROM checkpoints
+            WHERE thread_id = ? AND checkpoint_ns = ?"""
+        params: tuple = (thread_id, checkpoint_ns)
+        if checkpoint_id := get_checkpoint_id(config):
+            query += " AND checkpoint_id = ?"
+            params += (checkpoint_id,)
+        else:
+            query += " ORDER BY checkpoint_id DESC LIMIT 1"
+        with self._lock:
+            row = self._conn.execute(query, params).fetchone()
+            return self._to_tuple(thread_id, checkpoint_ns, row) if row else None
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        """최근 체크포인트부터 조건에 맞는 체크포인트를 반환합니다."""
+        query = "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_id, checkpoint, metadata FROM checkpoints"
+        clauses, params = [], []
+        if config:
+            clauses.append("thread_id = ?")
+            params.append(config["configurable"]["thread_id"])
+            if (checkpoint_ns := config["configurable"].get("checkpoint_ns")) is not None:
+                clauses.append("checkpoint_ns = ?")
+                params.append(checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                clauses.append("checkpoint_id = ?")
+                params.append(checkpoint_id)
+        if before and (before_id := get_checkpoint_id(before)):
+            clauses.append("checkpoint_id < ?")
+            params.append(before_id)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY checkpoint_id DESC"
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+            results = []
+            for thread_id, checkpoint_ns, *row in rows:
+                if limit is not None and len(results) >= limit:
+                    break
+                if filter:
+                    metadata = self._loads(row[3])
+                    if not all(metadata.get(key) == value for key, value in filter.items()):
+                        continue
+                results.append(self._to_tuple(thread_id, checkpoint_ns, tuple(row)))
+        yield from results
+
+    # --- 저장 -------------------------------------------------------------
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """체크포인트 저장 (이번 단계에서 바뀐 채널만 새 버전으로 기록, 한 트랜잭션)"""
+        started = time.perf_counter()
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        checkpoint = checkpoint.copy()
+        values = checkpoint.pop("channel_values")
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for channel, version in new_versions.items():
+                    digest = self._store_blob(values[channel]) if channel in values else None
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO channel_versions VALUES (?, ?, ?, ?, ?)",
+                        (thread_id, checkpoint_ns, channel, str(version), digest),
+                    )
+                checkpoint_raw = self._dumps(checkpoint)
+                metadata_raw = self._dumps(get_checkpoint_metadata(config, metadata))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        thread_id,
+                        checkpoint_ns,
+                        checkpoint["id"],
+                        config["configurable"].get("checkpoint_id"),
+                        checkpoint_raw,
+                        metadata_raw,
+                    ),
+                )
+                self._conn.execute(
+                    "UPDATE runs SET updated_at = ? WHERE run_id = ?", (time.time(), thread_id)
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        self.bytes_written += len(checkpoint_raw) + len(metadata_raw)
+        self.write_seconds += time.perf_counter() - started
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """노드 하나의 출력(다음 체크포인트 전까지의 중간 결과) 저장"""
+        started = time.perf_counter()
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for idx, (channel, value) in enumerate(writes):
+                    idx = WRITES_IDX_MAP.get(channel, idx)
+                    # 특수 채널(오류/중단 등)은 덮어쓰고, 일반 채널은 처음 기록만 유지
+                    verb = "INSERT OR REPLACE" if idx < 0 else "INSERT OR IGNORE"
+                    self._conn.execute(
+                        f"{verb} INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            thread_id,
+                            checkpoint_ns,
+                            checkpoint_id,
+                            task_id,
+                            idx,
+                            channel,
+                            self._store_blob(value),
+                            task_path,
+                        ),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        self.write_seconds += time.perf_counter() - started
+
+    def delete_thread(self, thread_id: str) -> None:
+        """실행 하나의 체크포인트를 모두 삭제합니다. (다른 실행이 쓰지 않는 값도 정리)"""
+        with self._lock:
+            for table in ("checkpoints", "channel_versions", "writes", "runs"):
+                column = "run_id" if table == "runs" else "thread_id"
+                self._conn.execute(f"DELETE FROM {table} WHERE {column} = ?", (thread_id,))
+            self._conn.execute(
+                """DELETE FROM blobs WHERE hash NOT IN (
+                    SELECT hash FROM channel_versions WHERE hash IS NOT NULL
+                    UNION SELECT hash FROM writes
+                )"""
+            )
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return self.get_tuple(config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        for item in self.list(config, filter=filter, before=before, limit=limit):
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return self.put(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        self.put_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        self.delete_thread(thread_id)
+
+    def get_next_version(self, current: Optional[str], channel: None) -> str:
+        # InMemorySaver와 같은 형식 (정수 버전 + 임의 소수부, 문자열 정렬 = 버전 순서)
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    # --- 실행 관리 ---------------------------------------------------------
+
+    def start_run(self, run_id: str) -> None:
+        """실행 시작 기록 (재개하는 실행이면 상태만 running으로 되돌림)"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """INSERT INTO runs VALUES (?, 'running', ?, ?)
+                ON CONFLICT(run_id) DO UPDATE SET status = 'running', updated_at = excluded.updated_at""",
+                (run_id, now, now),
+            )
+
+    def finish_run(self, run_id: str, status: str = "done") -> None:
+        """실행 종료 기록 ("done" 또는 "failed") 후 오래된 실행 정리"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE runs SET status = ?, updated_at = ? WHERE run_id = ?",
+                (status, time.time(), run_id),
+            )
+            old_runs = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT run_id FROM runs ORDER BY started_at DESC LIMIT -1 OFFSET ?",
+                    (self.max_runs,),
+                ).fetchall()
+            ]
+        for old_run in old_runs:
+            self.delete_thread(old_run)
+
+    def last_unfinished_run(self) -> Optional[str]:
+        """가장 최근에 시작해 끝나지 않은(실패했거나 중단된) 실행 ID"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT run_id FROM runs WHERE status != 'done' ORDER BY started_at DESC LIMIT 1"
+            ).fetchone()
+        return row[0] if row else None
+
+    def stats(self) -> dict[str, float]:
+        """이번 프로세스에서 체크포인트 쓰기에 쓴 바이트/시간"""
+        return {"bytes_written": self.bytes_written, "write_seconds": round(self.write_seconds, 4)}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,262 @@
+"""
+로컬 카테고리 분류기 - 해시 문자 n-gram TF-IDF + 다항 로지스틱 회귀 (NumPy만 사용)
+
+과거 LLM 분류 결과(카테고리 라벨 저장소, outputs/ 보고서)로 학습하고,
+확신도가 높은 기사는 LLM 호출 없이 바로 분류합니다.
+
+학습: python classifier.py [--reports outputs] [--epochs 300]
+"""
+import argparse
+import glob
+import json
+import os
+import re
+import zlib
+from collections import Counter
+from typing import Iterable, Optional
+
+import numpy as np
+
+from config import Config
+from cache import SQLiteCache
+
+WORD_PATTERN = re.compile(r"\w+")
+SOURCE_SUFFIX_PATTERN = re.compile(r"\s+-\s+[^-]+$")
+
+
+def label_store() -> SQLiteCache:
+    """LLM이 분류한 (제목, 요약, 카테고리) 기록 저장소 - 분류기 학습 데이터"""
+    return SQLiteCache(
+        path=os.path.join(Config.CACHE_DIR, "category_labels.sqlite3"),
+        table="category_labels",
+        ttl=Config.CATEGORY_LABEL_TTL,
+        max_entries=Config.CATEGORY_LABEL_MAX_ENTRIES,
+    )
+
+
+def record_label(store: SQLiteCache, title: str, summary: str, category: str) -> None:
+    key = zlib.crc32(title.encode("utf-8")).to_bytes(4, "big").hex() + title[:64]
+    store.set(
+        key,
+        json.dumps({"title": title, "summary": summary, "category": category}, ensure_ascii=False),
+    )
+
+
+def tokenize(text: str) -> Counter:
+    """단어 + 단어 내부 문자 2/3-gram (형태소 분석기 없이 한국어 어간 공유)"""
+    features = Counter()
+    for word in WORD_PATTERN.findall(text.lower()):
+        features["w:" + word] += 1
+        padded = f"<{word}>"
+        for n in (2, 3):
+            for i in range(len(padded) - n + 1):
+                features["c:" + padded[i : i + n]] += 1
+    return features
+
+
+class LocalCategoryClassifier:
+    """해시 특징 TF-IDF 위의 다항 로지스틱 회귀 분류기"""
+
+    N_FEATURES = 2**18
+
+    def __init__(self, classes: list[str], weights: np.ndarray, bias: np.ndarray, idf: np.ndarray):
+        self.classes = classes
+        self.weights = weights  # (N_FEATURES, 클래스 수)
+        self.bias = bias
+        self.idf = idf
+
+    # ---------- 특징 추출 ----------
+
+    @classmethod
+    def _hashed(cls, text: str) -> tuple[np.ndarray, np.ndarray]:
+        counts = Counter()
+        for feature, count in tokenize(text).items():
+            counts[zlib.crc32(feature.encode("utf-8")) % cls.N_FEATURES] += count
+        indices = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        tf = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+        return indices, 1.0 + np.log(tf)
+
+    @staticmethod
+    def text_of(title: str, summary: str = "") -> str:
+        # 제목 끝의 " - 언론사"는 카테고리와 무관하므로 제외
+        return f"{SOURCE_SUFFIX_PATTERN.sub('', title)} {summary}"
+
+    def _vector(self, text: str) -> tuple[np.ndarray, np.ndarray]:
+        indices, values = self._hashed(text)
+        values = values * self.idf[indices]
+        norm = np.linalg.norm(values)
+        return indices, values / norm if norm else values
+
+    # ---------- 예측 ----------
+
+    def predict_proba(self, title: str, summary: str = "") -> np.ndarray:
+        indices, values = self._vector(self.text_of(title, summary))
+        logits = values @ self.weights[indices] + self.bias
+        logits -= logits.max()
+        probs = np.exp(logits)
+        return probs / probs.sum()
+
+    def predict(self, title: str, summary: str = "") -> tuple[str, float]:
+        """(카테고리, 확신도) 반환"""
+        probs = self.predict_proba(title, summary)
+        best = int(probs.argmax())
+        return self.classes[best], float(probs[best])
+
+    # ---------- 학습 ----------
+
+    @classmethod
+    def fit(
+        cls,
+        samples: list[tuple[str, str, str]],
+        epochs: int = 300,
+        learning_rate: float = 0.05,
+        l2: float = 1e-4,
+    ) -> "LocalCategoryClassifier":
+        """(제목, 요약, 카테고리) 목록으로 학습 (희소 행렬을 CSR 배열로 직접 다룸)"""
+        classes = sorted({category for _, _, category in samples})
+        class_index = {category: i for i, category in enumerate(classes)}
+        hashed = [cls._hashed(cls.text_of(title, summary)) for title, summary, _ in samples]
+        labels = np.array([class_index[category] for _, _, category in samples])
+
+        # ① 문서 빈도 → IDF (학습에 없던 특징은 가장 큰 IDF)
+        n_docs = len(samples)
+        df = np.zeros(cls.N_FEATURES, dtype=np.float32)
+        for indices, _ in hashed:
+            df[indices] += 1
+        idf = (np.log((1 + n_docs) / (1 + df)) + 1).astype(np.float32)
+
+        # ② TF-IDF + L2 정규화한 CSR 배열
+        lengths = np.array([len(indices) for indices, _ in hashed])
+        indptr = np.concatenate([[0], np.cumsum(lengths)])
+        indices = np.concatenate([indices for indices, _ in hashed])
+        values = np.concatenate([values for _, values in hashed]) * idf[indices]
+        rows = np.repeat(np.arange(n_docs), lengths)
+        norms = np.sqrt(np.add.reduceat(values**2, indptr[:-1]))
+        values /= np.where(norms > 0, norms, 1)[rows]
+
+        # ③ 전체 배치 경사 하강 (Adam) 으로 소프트맥스 교차 엔트로피 최소화
+        #    학습 데이터에 나온 특징의 가중치만 갱신
+        n_classes = len(classes)
+        used = np.unique(indices)
+        position = np.searchsorted(used, indices)
+        onehot = np.eye(n_classes, dtype=np.float32)[labels]
+        params = [np.zeros((len(used), n_classes), np.float32), np.zeros(n_classes, np.float32)]
+        moments = [[np.zeros_like(p), np.zeros_like(p)] for p in params]
+        beta1, beta2 = 0.9, 0.999
+
+        for step in range(1, epochs + 1):
+            used_weights, bias = params
+            logits = np.add.reduceat(used_weights[position] * values[:, None], indptr[:-1]) + bias
+            logits -= logits.max(axis=1, keepdims=True)
+            probs = np.exp(logits)
+            probs /= probs.sum(axis=1, keepdims=True)
+            error = (probs - onehot) / n_docs
+
+            grad = l2 * used_weights
+            np.add.at(grad, position, error[rows] * values[:, None])
+            for param, g, (m, v) in zip(params, (grad, error.sum(axis=0)), moments):
+                m += (1 - beta1) * (g - m)
+                v += (1 - beta2) * (g**2 - v)
+                m_hat = m / (1 - beta1**step)
+                v_hat = v / (1 - beta2**step)
+                param -= learning_rate * m_hat / (np.sqrt(v_hat) + 1e-8)
+
+        weights = np.zeros((cls.N_FEATURES, n_classes), dtype=np.float32)
+        weights[used] = params[0]
+        bias = params[1]
+        return cls(classes, weights, bias, idf)
+
+    # ---------- 저장/불러오기 ----------
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 쓰던 도중 읽히지 않도록 임시 파일에 쓴 뒤 교체
+        tmp_path = f"{path}.tmp.npz"
+        np.savez_compressed(
+            tmp_path,
+            classes=np.array(self.classes),
+            weights=self.weights.astype(np.float16),
+            bias=self.bias,
+            idf=self.idf.astype(np.float16),
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["LocalCategoryClassifier"]:
+        """모델 파일이 없으면 None"""
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as data:
+            return cls(
+                [str(c) for c in data["classes"]],
+                data["weights"].astype(np.float32),
+                data["bias"],
+                data["idf"].astype(np.float32),
+            )
+
+
+def model_path() -> str:
+    """모델 파일 경로 (상대 경로면 CACHE_DIR 기준)"""
+    return os.path.join(Config.CACHE_DIR, Config.CLASSIFIER_MODEL_FILE)
+
+
+def load_report_samples(report_dir: str) -> Iterable[tuple[str, str, str]]:
+    """과거 보고서(markdown)의 카테고리 섹션에서 (제목, 요약, 카테고리) 추출"""
+    category = None
+    for path in sorted(glob.glob(os.path.join(report_dir, "*.md"))):
+        with open(path, encoding="utf-8") as f:
+            title = None
+            for line in f:
+                if match := re.match(r"### (.+?) \(\d+건\)", line):
+                    category = match.group(1)
+                elif match := re.match(r"#### \d+\. (.+)", line):
+                    title = match.group(1).strip()
+                elif title and category and line.startswith("- **요약**:"):
+                    yield title, line.split(":", 1)[1].strip(), category
+                    title = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로컬 카테고리 분류기 학습")
+    parser.add_argument("--reports", default=Config.OUTPUT_DIR, help="과거 보고서 디렉터리")
+    parser.add_argument("--epochs", type=int, default=300)
+    args = parser.parse_args()
+
+    # ① LLM 라벨 기록 + 과거 보고서 (같은 제목은 LLM 라벨 기록 우선)
+    samples = {}
+    for title, summary, category in load_report_samples(args.reports):
+        samples[title] = (title, summary, category)
+    store = label_store()
+    for value in store.values():
+        record = json.loads(value)
+        samples[record["title"]] = (record["title"], record["summary"], record["category"])
+    samples = [s for s in samples.values() if s[2] in Config.NEWS_CATEGORIES + ["기타"]]
+    if len(samples) < 20 or len({s[2] for s in samples}) < 2:
+        print(f"학습 데이터가 부족합니다 ({len(samples)}건). LLM 분류 결과가 더 쌓인 뒤 실행하세요.")
+        return
+
+    # ② 20% 검증 분할로 임계값별 적용 비율/정확도 확인 후 전체 데이터로 학습
+    rng = np.random.default_rng(0)
+    order = rng.permutation(len(samples))
+    split = len(samples) // 5
+    valid = [samples[i] for i in order[:split]]
+    model = LocalCategoryClassifier.fit([samples[i] for i in order[split:]], args.epochs)
+    predictions = [model.predict(title, summary) for title, summary, _ in valid]
+    print(f"학습 {len(samples) - split}건 / 검증 {split}건")
+    for threshold in (0.5, 0.6, 0.7, 0.8, 0.9):
+        confident = [
+            (pred, sample[2]) for (pred, prob), sample in zip(predictions, valid)
+            if prob >= threshold
+        ]
+        accuracy = sum(p == y for p, y in confident) / len(confident) if confident else 0.0
+        print(
+            f"  임계값 {threshold:.1f}: 로컬 처리 {len(confident) / max(1, split):.0%}, "
+            f"정확도 {accuracy:.1%}"
+        )
+
+    LocalCategoryClassifier.fit(samples, args.epochs).save(model_path())
+    print(f"모델 저장: {model_path()}")
+
+
+if __name__ == "__main__":
+    main()
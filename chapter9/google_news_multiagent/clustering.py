@@ -0,0 +1,76 @@
+"""
+기사 스토리 묶기 - 제목/도입부 TF-IDF 벡터의 코사인 유사도 위에서 평균 연결 병합 군집 (NumPy)
+
+표현이 달라도 같은 사건을 다룬 기사들은 고유명사·숫자·핵심 어휘를 공유하므로
+단어 + 문자 n-gram TF-IDF 유사도가 높게 나옵니다.
+"""
+import math
+from collections import Counter
+
+import numpy as np
+
+from article import Article
+from classifier import SOURCE_SUFFIX_PATTERN, tokenize
+
+
+def tfidf_matrix(texts: list[str]) -> np.ndarray:
+    """L2 정규화한 TF-IDF 행렬 (두 문서 이상에 나온 특징 열만 유지)
+
+    한 문서에만 나온 특징은 내적에 기여하지 않으므로 열에서 빼되, 정규화에는 포함합니다.
+    """
+    docs = [tokenize(text) for text in texts]
+    df = Counter()
+    for doc in docs:
+        df.update(doc.keys())
+    n_docs = len(docs)
+    columns = {feature: j for j, feature in enumerate(f for f, count in df.items() if count > 1)}
+
+    matrix = np.zeros((n_docs, max(1, len(columns))), dtype=np.float32)
+    for i, doc in enumerate(docs):
+        weights = {
+            feature: (1 + math.log(tf)) * (math.log((1 + n_docs) / (1 + df[feature])) + 1)
+            for feature, tf in doc.items()
+        }
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        for feature, weight in weights.items():
+            if (j := columns.get(feature)) is not None:
+                matrix[i, j] = weight / norm
+    return matrix
+
+
+def average_linkage(similarity: np.ndarray, threshold: float) -> list[list[int]]:
+    """평균 연결 병합 군집 - 군집 간 평균 유사도가 threshold 미만이 될 때까지 병합"""
+    n = len(similarity)
+    sim = similarity.astype(np.float64, copy=True)
+    np.fill_diagonal(sim, -np.inf)
+    sizes = np.ones(n)
+    members = [[i] for i in range(n)]
+
+    while n > 1:
+        i, j = divmod(int(np.argmax(sim)), n)
+        if sim[i, j] < threshold:
+            break
+        # j를 i에 병합 (Lance-Williams: 크기 가중 평균)
+        merged = (sizes[i] * sim[i] + sizes[j] * sim[j]) / (sizes[i] + sizes[j])
+        sim[i], sim[:, i] = merged, merged
+        sim[j], sim[:, j] = -np.inf, -np.inf
+        sim[i, i] = -np.inf
+        sizes[i] += sizes[j]
+        members[i] += members[j]
+        members[j] = []
+
+    return sorted((sorted(group) for group in members if group), key=lambda group: group[0])
+
+
+def story_text(news_item: Article, lead: str) -> str:
+    # 제목은 두 번 반영 (도입부보다 사건을 더 잘 나타냄), 제목 끝 언론사 이름 제외
+    title = SOURCE_SUFFIX_PATTERN.sub("", news_item.title)
+    return f"{title} {title} {lead}"
+
+
+def cluster_stories(texts: list[str], threshold: float) -> list[list[int]]:
+    """같은 사건을 다룬 문서 인덱스 묶음 목록 (단독 문서도 묶음 하나)"""
+    if len(texts) < 2:
+        return [[i] for i in range(len(texts))]
+    vectors = tfidf_matrix(texts)
+    return average_linkage(vectors @ vectors.T, threshold)
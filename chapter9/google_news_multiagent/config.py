@@ -11,15 +11,115 @@ class Config:
     ROOT_DIR :str= os.path.dirname(os.path.abspath(__file__))
 
     RSS_URL: str = "https://news.google.com/rss?hl=ko&gl=KR&ceid=KR:ko"
+    # 함께 수집할 피드 목록 (토픽/지역/검색 피드 추가 가능, 같은 기사는 한 번만 처리)
+    # 예: "https://news.google.com/rss/headlines/section/topic/BUSINESS?hl=ko&gl=KR&ceid=KR:ko"
+    #     "https://news.google.com/rss/search?q=반도체&hl=ko&gl=KR&ceid=KR:ko"
+    RSS_URLS: list[str] = [RSS_URL]
     MAX_NEWS_COUNT: int = 60
 
-    BATCH_SIZE: int = 10
+    BATCH_SIZE: int = 10  # 진행 상황 출력 단위
+
+    # 단계별 LLM 입력 본문 토큰 예산 (수집 시 문장 경계에서 미리 잘라 둠)
+    SUMMARY_INPUT_TOKENS: int = 350
+    CATEGORY_INPUT_TOKENS: int = 150
+
+    # LLM 호출 스케줄러 (동시에 진행할 요청 수 + 분당 요청/토큰 한도, 0이면 제한 없음)
+    LLM_MAX_CONCURRENCY: int = 10
+    LLM_REQUESTS_PER_MINUTE: int = 500
+    LLM_TOKENS_PER_MINUTE: int = 200000
+    # 요청 하나에 묶어 요약할 기사 수 (1이면 기사마다 따로 요청)
+    SUMMARY_PACK_SIZE: int = 1
+    # True면 요약과 분류를 LLM 호출 한 번으로 처리 (collect → digest → report)
+    FUSED_DIGEST: bool = False
+    # True면 단계 장벽 없이 기사마다 수집 → 요약 → 분류를 바로 이어서 처리 (stream → report)
+    # 전체 기사를 한 번에 봐야 하는 유사 중복/스토리 묶기와 묶음 요약은 사용하지 않음
+    STREAMING: bool = False
+    STREAM_QUEUE_SIZE: int = 16  # 단계 사이 대기열 크기 (가득 차면 앞 단계가 대기 = 배압)
+
+    # 요약 방식: "llm"(항상 LLM), "extractive"(항상 추출 요약),
+    # "auto"(기사별 정책: 단신·EXTRACTIVE_CATEGORIES·토큰 상한 초과 기사는 추출 요약, 나머지는 LLM)
+    SUMMARY_BACKEND: str = "llm"
+    EXTRACTIVE_SENTENCES: int = 3  # 추출 요약 문장 수
+    EXTRACTIVE_MAX_TOKENS: int = 120  # "auto"일 때 이 토큰 수 이하의 단신은 추출 요약
+    EXTRACTIVE_CATEGORIES: list[str] = []  # 로컬 분류기가 이 카테고리로 판단하면 추출 요약 (예: ["생활/문화"])
+    SUMMARY_LLM_TOKEN_BUDGET: int = 0  # 실행당 요약 LLM 토큰 상한, 넘으면 나머지는 추출 요약 (0이면 제한 없음)
+
+    # 유사 중복 기사 묶기 (수집 → 요약 사이, 본문 MinHash 추정 유사도가 임계값 이상이면 같은 그룹)
+    NEAR_DUP_DEDUP: bool = True
+    NEAR_DUP_THRESHOLD: float = 0.6
+    NEAR_DUP_NUM_PERM: int = 128  # MinHash 서명 길이
+
+    # 스토리 묶기 (같은 사건을 다른 표현으로 보도한 기사들을 묶어 스토리마다 종합 요약 하나)
+    STORY_CLUSTERING: bool = True
+    STORY_CLUSTER_THRESHOLD: float = 0.55  # 제목/도입부 TF-IDF 평균 코사인 유사도 기준
+    STORY_MAX_ARTICLES: int = 5  # 종합 요약 프롬프트에 넣을 최대 기사 수
+
+    # 로컬 카테고리 분류기 (확신도가 임계값 이상이면 LLM 호출 생략, 학습: python classifier.py)
+    LOCAL_CLASSIFIER: bool = True  # 모델 파일이 없으면 LLM으로만 분류
+    CLASSIFIER_MODEL_FILE: str = "category_classifier.npz"  # 상대 경로면 CACHE_DIR 기준
+    CLASSIFIER_THRESHOLD: float = 0.8
+    CLASSIFIER_AUDIT_RATE: float = 0.1  # 확신도가 높아도 LLM으로 함께 분류해 일치율을 재는 비율
+    CATEGORY_LABEL_TTL: float = 180 * 24 * 3600  # LLM 분류 결과(학습 데이터) 보관 기간(초)
+    CATEGORY_LABEL_MAX_ENTRIES: int = 50000
 
     NEWS_CATEGORIES: list[str] = ["경제", "정치", "사회", "생활/문화", "IT/과학", "외교"]
 
     NEWS_PER_CATEGORY: int = 30
     OUTPUT_DIR: str = f"{ROOT_DIR}/outputs"
 
+    # HTTP 클라이언트 설정 (수집 에이전트가 하나의 커넥션 풀을 공유)
+    HTTP_TIMEOUT: float = 10.0
+    HTTP_CONNECT_TIMEOUT: float = 5.0
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 10
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP2: bool = False  # h2 패키지가 설치된 경우에만 적용
+
+    # 요청 스케줄러 설정 (전체/호스트별 동시성 + 429·5xx·느린 응답 시 적응형 감속)
+    FETCH_MAX_CONCURRENCY: int = 32
+    FETCH_SLOW_SECONDS: float = 5.0  # 이보다 느린 응답은 해당 호스트 동시성 감소
+    FETCH_MAX_RETRIES: int = 2
+    FETCH_BACKOFF_BASE: float = 1.0
+    FETCH_BACKOFF_MAX: float = 30.0
+
+    # 기사 본문 다운로드 설정
+    ARTICLE_TIMEOUT: float = 15.0  # 기사 한 건의 전체 다운로드 제한 시간(초)
+    ARTICLE_MAX_BYTES: int = 2 * 1024 * 1024  # 이 크기를 넘는 본문은 잘라서 사용
+    DECODE_BATCH_SIZE: int = 20  # batchexecute POST 한 번에 묶을 원문 URL 디코딩 RPC 수
+    EXTRACT_WORKERS: int = os.cpu_count() or 1  # 본문 추출 프로세스 수 (0이면 프로세스 풀 미사용)
+
+    # 로컬 캐시 설정 (SQLite)
+    CACHE_DIR: str = f"{ROOT_DIR}/.cache"
+    URL_CACHE_TTL: float = 7 * 24 * 3600  # Google News 기사 ID → 원문 URL 보관 기간(초)
+    URL_CACHE_MAX_ENTRIES: int = 20000
+    ARTICLE_CACHE_TTL: float = 3 * 24 * 3600  # 추출한 기사 본문 보관 기간(초)
+    ARTICLE_CACHE_MAX_BYTES: int = 200 * 1024 * 1024  # 넘으면 오래 안 쓴 기사부터 제거
+    ARTICLE_CACHE_STORE_HTML: bool = False  # 원본 HTML도 압축 저장할지 여부
+    SUMMARY_CACHE_TTL: float = 14 * 24 * 3600  # AI 요약 보관 기간(초)
+    SUMMARY_CACHE_MAX_ENTRIES: int = 50000
+
+    # 워크플로우 체크포인트 (노드가 끝날 때마다 상태 저장, 실패한 실행은 python main.py --resume 으로 이어서 실행)
+    CHECKPOINTS: bool = True
+    CHECKPOINT_FILE: str = "checkpoints.sqlite3"  # CACHE_DIR 기준
+    CHECKPOINT_MAX_RUNS: int = 20  # 보관할 최근 실행 수 (넘으면 오래된 실행의 체크포인트 삭제)
+
+    # 상주(daemon) 모드 설정 (python daemon.py)
+    DAEMON_INTERVAL: float = 30 * 60  # 실행 시작 간격(초), 실행이 더 길면 끝나는 즉시 다음 실행
+    DAEMON_HOST: str = "127.0.0.1"
+    DAEMON_PORT: int = 8080  # /health, /last-run 엔드포인트 (0이면 HTTP 서버 미사용)
+
+    # 실행 지표 (노드/기사별 소요 시간, 도메인별 HTTP 지연, LLM 지연·토큰, 캐시 적중률, 오류 수)
+    METRICS_JSON: bool = True  # 보고서 옆에 <보고서 이름>.metrics.json 저장
+    METRICS_PROMETHEUS: bool = True  # 상주 모드에서 GET /metrics (Prometheus 텍스트 형식)
+
+    # 증분 수집 설정 (ETag/Last-Modified 조건부 요청 + 이미 처리한 항목 건너뛰기)
+    INCREMENTAL: bool = False
+    SEEN_ENTRY_TTL: float = 7 * 24 * 3600
+    SEEN_ENTRY_MAX_ENTRIES: int = 50000
+    # 본문 수집에 이만큼 실패한 항목은 처리 완료로 기록 (4xx/HTML 아님/본문 추출 실패는 바로 기록)
+    SEEN_ENTRY_MAX_ATTEMPTS: int = 3
+
     @classmethod
     def validate(cls)->bool:
         """설정 값 유효성 검사"""
@@ -0,0 +1,239 @@
+"""
+상주(daemon) 모드 - 한 프로세스에서 워크플로우를 주기적으로 다시 실행합니다.
+
+cron으로 main.py를 매번 실행하면 파이썬 시작, 무거운 import, LLM/HTTP 클라이언트 생성,
+본문 추출 프로세스 풀 생성, 캐시 연결을 매번 다시 합니다. 상주 모드는 이것들을 한 번만 만들고
+실행 사이에도 유지하며(keep-alive 연결, 추출 워커, 로드한 분류기), 보고서는 원자적으로 저장합니다.
+
+실행: python daemon.py [--interval 1800] [--port 8080] [--once]
+  GET /health   : 상태 (마지막 실행이 실패했거나 실행 간격의 3배 넘게 성공이 없으면 503)
+  GET /last-run : 마지막 실행의 시작 시각, 노드별 소요 시간, 처리 건수, 보고서 경로
+  GET /metrics  : 마지막 실행 지표 (Prometheus 텍스트 형식, Config.METRICS_PROMETHEUS)
+"""
+import argparse
+import asyncio
+import json
+import signal
+import time
+from datetime import datetime
+from typing import Any, Optional
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from langchain_core.messages import HumanMessage
+
+from config import Config
+from metrics import RunMetrics
+from state import NewsState
+from utils import save_report
+
+
+class NewsDaemon:
+    """워크플로우와 에이전트(클라이언트/캐시)를 한 번 만들고 주기적으로 실행하는 스케줄러"""
+
+    def __init__(
+        self,
+        llm,
+        collector=None,
+        interval: Optional[float] = None,
+        output_dir: Optional[str] = None,
+        checkpointer=None,
+    ):
+        from agents.collector import RSSCollectorAgent
+        from workflow import create_news_workflow
+
+        self.interval = Config.DAEMON_INTERVAL if interval is None else interval
+        self.output_dir = output_dir or Config.OUTPUT_DIR
+        self.collector = collector or RSSCollectorAgent()
+        self.checkpointer = checkpointer
+        self.metrics = RunMetrics()
+        # 에이전트·스케줄러·캐시 연결은 실행 사이에도 그대로 재사용 (지표만 실행마다 초기화)
+        self.app = create_news_workflow(
+            llm, collector=self.collector, checkpointer=checkpointer, metrics=self.metrics
+        )
+        self.started_at = time.time()
+        self.runs = 0
+        self.failures = 0
+        self.running = False
+        self.last_run: dict[str, Any] = {}
+        self.last_success_at: Optional[float] = None
+        self._stop = asyncio.Event()
+
+    async def __aenter__(self) -> "NewsDaemon":
+        await self.collector.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.collector.__aexit__(*exc_info)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    async def run_once(self) -> dict[str, Any]:
+        """워크플로우를 한 번 실행하고 노드별 소요 시간과 결과를 기록합니다."""
+        # 실행 간격이 짧아도 체크포인트 실행 ID가 겹치지 않도록 마이크로초까지 사용
+        run_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        run_config = {"configurable": {"thread_id": run_id}}
+        record: dict[str, Any] = {"run_id": run_id, "started_at": time.time(), "nodes": {}}
+        self.running = True
+        self.runs += 1
+        self.metrics.reset()
+        if self.checkpointer is not None:
+            self.checkpointer.start_run(run_id)
+
+        started = time.perf_counter()
+        final_state: dict[str, Any] = {}
+        try:
+            # ① 노드별 소요 시간은 워크플로우가 실행 지표에 기록
+            initial_state = NewsState(
+                messages=[HumanMessage(content="Google News RSS 처리를 시작합니다.")]
+            )
+            final_state = await self.app.ainvoke(initial_state, run_config)
+
+            # ② 보고서는 임시 파일에 쓴 뒤 교체 (읽는 쪽이 쓰다 만 파일을 보지 않도록)
+            if final_state.get("final_report"):
+                record["report"] = save_report(final_state["final_report"], self.output_dir)
+                if Config.METRICS_JSON:
+                    record["metrics"] = self.metrics.save_json(record["report"])
+            record["status"] = "done"
+            self.last_success_at = time.time()
+        except Exception as e:
+            self.failures += 1
+            record["status"] = "failed"
+            record["error"] = str(e)
+            print(f"[Daemon] 실행 {run_id} 실패: {e}")
+        finally:
+            self.running = False
+            if self.checkpointer is not None:
+                self.checkpointer.finish_run(run_id, status=record.get("status", "failed"))
+
+        record["nodes"] = {node: round(seconds, 3) for node, seconds in self.metrics.nodes.items()}
+        record["duration"] = round(time.perf_counter() - started, 3)
+        record["articles"] = len(final_state.get("raw_news", []))
+        record["summarized"] = len(final_state.get("summarized_news", []))
+        record["errors"] = len(final_state.get("error_log", []))
+        self.last_run = record
+        print(
+            f"[Daemon] 실행 {run_id} {record['status']}: {record['duration']}s, "
+            f"기사 {record['articles']}건, 보고서 {record.get('report', '-')}"
+        )
+        return record
+
+    async def run_forever(self, max_runs: Optional[int] = None) -> None:
+        """interval 간격으로 실행 (실행이 interval보다 길면 끝나는 즉시 다음 실행)"""
+        while not self._stop.is_set():
+            started = time.monotonic()
+            await self.run_once()
+            if max_runs is not None and self.runs >= max_runs:
+                break
+            wait = self.interval - (time.monotonic() - started)
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=max(0.0, wait))
+            except TimeoutError:
+                pass
+
+    # --- 상태 엔드포인트 ---------------------------------------------------
+
+    def health(self) -> tuple[int, dict[str, Any]]:
+        now = time.time()
+        stale = (
+            self.last_success_at is not None
+            and now - self.last_success_at > 3 * max(self.interval, 1)
+        )
+        failed = self.last_run.get("status") == "failed"
+        status = 503 if failed or stale else 200
+        return status, {
+            "status": "ok" if status == 200 else "degraded",
+            "uptime_seconds": round(now - self.started_at, 1),
+            "running": self.running,
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_success_age_seconds": (
+                round(now - self.last_success_at, 1) if self.last_success_at else None
+            ),
+        }
+
+    def prometheus(self) -> str:
+        """상주 프로세스 상태 + 마지막 실행 지표 (Prometheus 텍스트 형식)"""
+        lines = [
+            "# TYPE news_daemon_runs_total counter",
+            f"news_daemon_runs_total {self.runs}",
+            "# TYPE news_daemon_failures_total counter",
+            f"news_daemon_failures_total {self.failures}",
+            "# TYPE news_daemon_last_run_duration_seconds gauge",
+            f"news_daemon_last_run_duration_seconds {self.last_run.get('duration', 0)}",
+        ]
+        return "\n".join(lines) + "\n" + self.metrics.to_prometheus()
+
+    async def handle_http(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """GET /health, GET /last-run, GET /metrics 만 처리하는 최소 HTTP/1.0 응답"""
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            path = request_line[1] if len(request_line) > 1 else "/"
+            content_type = "application/json; charset=utf-8"
+            if path == "/metrics" and Config.METRICS_PROMETHEUS:
+                status, body = 200, self.prometheus()
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            elif path == "/health":
+                status, body = self.health()
+            elif path == "/last-run":
+                status, body = (200, self.last_run) if self.last_run else (404, {"error": "no runs yet"})
+            else:
+                status, body = 404, {"error": "not found"}
+            if not isinstance(body, str):
+                body = json.dumps(body, ensure_ascii=False)
+            data = body.encode("utf-8")
+            reason = {200: "OK", 404: "Not Found", 503: "Service Unavailable"}[status]
+            writer.write(
+                f"HTTP/1.0 {status} {reason}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(data)}\r\n\r\n".encode("latin-1") + data
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def start_server(self, host: Optional[str] = None, port: Optional[int] = None):
+        """상태 엔드포인트 서버 시작 (port가 0이면 시작하지 않음)"""
+        port = Config.DAEMON_PORT if port is None else port
+        if not port:
+            return None
+        server = await asyncio.start_server(self.handle_http, host or Config.DAEMON_HOST, port)
+        print(f"[Daemon] 상태 엔드포인트: http://{host or Config.DAEMON_HOST}:{port}/health")
+        return server
+
+
+async def main(args: argparse.Namespace) -> None:
+    if not Config.validate():
+        raise SystemExit("API 키가 설정되지 않았습니다. .env 파일을 확인해주세요.")
+
+    from langchain_openai import ChatOpenAI
+    from checkpoint import SQLiteCheckpointSaver
+
+    llm = ChatOpenAI(
+        model=Config.MODEL_NAME, max_tokens=Config.MAX_TOKENS, api_key=Config.OPENAI_API_KEY
+    )
+    checkpointer = SQLiteCheckpointSaver() if Config.CHECKPOINTS else None
+    async with NewsDaemon(llm, interval=args.interval, checkpointer=checkpointer) as daemon:
+        # SIGINT/SIGTERM이면 진행 중인 실행을 마친 뒤 종료
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, daemon.stop)
+        server = await daemon.start_server(port=args.port)
+        try:
+            await daemon.run_forever(max_runs=1 if args.once else None)
+        finally:
+            if server is not None:
+                server.close()
+                await server.wait_closed()
+    print("[Daemon] 종료")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Google News 멀티에이전트 상주 모드")
+    parser.add_argument("--interval", type=float, default=None, help="실행 간격(초)")
+    parser.add_argument("--port", type=int, default=None, help="상태 엔드포인트 포트 (0이면 끔)")
+    parser.add_argument("--once", action="store_true", help="한 번만 실행하고 종료")
+    asyncio.run(main(parser.parse_args()))
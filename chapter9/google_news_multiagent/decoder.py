@@ -0,0 +1,66 @@
+import html
+import json
+import re
+from typing import Optional
+
+# Google News 원문 URL 디코딩용 batchexecute RPC 식별자
+DECODE_RPC_ID = "Fbv4je"
+RESPONSE_PREFIX = ")]}'"
+
+# <c-wiz ... data-p="..."> 속성만 바로 찾는 패턴 (큰따옴표/작은따옴표 모두 허용)
+DATA_P_PATTERN = re.compile(
+    r"""<c-wiz\b[^>]*?\sdata-p=(?:"([^"]*)"|'([^']*)')""", re.IGNORECASE
+)
+
+
+def scan_data_p(page_html: str) -> Optional[str]:
+    """DOM 트리를 만들지 않고 첫 번째 c-wiz[data-p] 값을 찾습니다."""
+    match = DATA_P_PATTERN.search(page_html)
+    if not match:
+        return None
+    raw_value = match.group(1) if match.group(1) is not None else match.group(2)
+    return html.unescape(raw_value)
+
+
+def build_decode_rpc(data_p: str, index: str = "generic") -> list:
+    """c-wiz[data-p] 값으로 디코딩 RPC 하나를 구성합니다."""
+    json_data = json.loads(data_p.replace("%.@.", '["garturlreq",'))
+    return [
+        DECODE_RPC_ID,
+        json.dumps(json_data[:-6] + json_data[-2:]),
+        "null",
+        index,
+    ]
+
+
+def build_request_payload(rpcs: list[list]) -> dict[str, str]:
+    """여러 RPC를 하나의 batchexecute 요청 본문(f.req)으로 묶습니다."""
+    return {"f.req": json.dumps([rpcs])}
+
+
+def _response_entries(text: str) -> list:
+    body = text.replace(RESPONSE_PREFIX, "", 1).strip()
+    try:
+        return json.loads(body)
+    except json.JSONDecodeError:
+        # 청크 형식(길이 줄 + JSON 배열 줄) 응답은 줄 단위로 파싱
+        entries = []
+        for line in body.splitlines():
+            if line.startswith("["):
+                entries.extend(json.loads(line))
+        return entries
+
+
+def parse_decode_response(text: str) -> dict[str, Optional[str]]:
+    """batchexecute 응답을 {RPC 인덱스: 원문 URL} 으로 변환합니다."""
+    decoded = {}
+    for entry in _response_entries(text):
+        if len(entry) < 3 or entry[0] != "wrb.fr" or entry[1] != DECODE_RPC_ID:
+            continue
+        # 단일 RPC 요청은 인덱스 자리에 "generic"이 들어옴
+        index = entry[-1] if isinstance(entry[-1], str) else "generic"
+        try:
+            decoded[index] = json.loads(entry[2])[1]
+        except (TypeError, IndexError, json.JSONDecodeError):
+            decoded[index] = None
+    return decoded
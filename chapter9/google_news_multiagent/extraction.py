@@ -0,0 +1,98 @@
+import asyncio
+import json
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+import trafilatura
+from trafilatura.utils import decode_file
+
+from config import Config
+
+CHOSUN_CONTENT_PATTERN = re.compile(r"Fusion\.globalContent\s*=\s*({.*?});", re.DOTALL)
+
+
+def extract_chosun_content(html_content: str) -> str:
+    """조선일보 기사 내용을 특별 처리합니다."""
+    match = CHOSUN_CONTENT_PATTERN.search(html_content)
+
+    if match:
+        try:
+            content_data = json.loads(match.group(1))
+            texts = []
+            if "content_elements" in content_data:
+                for element in content_data["content_elements"]:
+                    if element.get("type") == "text" and "content" in element:
+                        texts.append(element["content"])
+            return "\n\n".join(texts)
+        except json.JSONDecodeError:
+            pass
+    return ""
+
+
+def extract_article_text(url: str, downloaded: bytes) -> str:
+    """다운로드한 HTML(bytes)에서 기사 본문 텍스트를 추출합니다. (워커 프로세스에서 실행)"""
+    # 모바일 헬스 조선은 리액트 아님
+    if "m.health.chosun.com" not in url and "chosun.com" in url:
+        return extract_chosun_content(decode_file(downloaded))
+
+    # trafilatura로 일반 기사 추출 (한국어 최적화, 인코딩 판별 포함)
+    return (
+        trafilatura.extract(
+            downloaded,
+            include_comments=False,
+            include_images=False,
+            include_links=False,
+            target_language="ko",
+        )
+        or ""
+    )
+
+
+class ArticleExtractor:
+    """HTML → 텍스트 추출(CPU 작업)을 프로세스 풀로 분산하는 단계"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        # 0이면 프로세스 풀 없이 현재 스레드에서 바로 추출
+        self.max_workers = Config.EXTRACT_WORKERS if max_workers is None else max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # 이벤트 루프/스레드를 가진 부모를 fork하지 않도록 spawn 사용
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    async def extract(self, url: str, downloaded: bytes) -> str:
+        """풀에 추출을 맡기고, 워커가 죽으면 풀을 다시 만들어 한 번 더 시도합니다."""
+        if not self.max_workers:
+            return extract_article_text(url, downloaded)
+
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            pool = self._get_pool()
+            try:
+                return await loop.run_in_executor(
+                    pool, extract_article_text, url, downloaded
+                )
+            except BrokenProcessPool:
+                # 같은 풀을 쓰던 다른 작업이 이미 교체했을 수 있으므로 현재 풀일 때만 폐기
+                if self._pool is pool:
+                    self._pool = None
+                    pool.shutdown(wait=False, cancel_futures=True)
+                print(f"  추출 워커 비정상 종료 ({attempt + 1}/2): {url}")
+            except Exception as e:
+                print(f"  본문 추출 오류 ({url}): {str(e)[:50]}")
+                return ""
+        return ""
+
+    def shutdown(self) -> None:
+        """워커 프로세스를 정리합니다."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
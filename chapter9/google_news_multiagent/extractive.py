@@ -0,0 +1,120 @@
+"""
+추출 요약기 - 문장 유사도 행렬 위의 TextRank (NumPy, LLM 호출 없음)
+
+문장을 문자 2-gram 벡터로 만들고 코사인 유사도 그래프에서 PageRank 점수가 높은
+문장을 원래 순서대로 골라 요약으로 사용합니다. 뉴스는 앞 문장이 중요하므로
+무작위 이동(teleport) 확률을 앞쪽 문장에 더 많이 줍니다.
+"""
+import re
+from typing import Optional
+
+import numpy as np
+
+from config import Config
+from article import Article
+from token_budget import estimate_tokens, iter_sentences
+
+MAX_SENTENCES = 40  # 앞에서부터 이 문장 수까지만 그래프 구성
+MIN_SENTENCE_CHARS = 10
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def _sentence_vectors(sentences: list[str]) -> np.ndarray:
+    """문장별 문자 2-gram 빈도 행렬 (열은 이 기사에서 나온 2-gram)"""
+    columns: dict[str, int] = {}
+    rows, cols = [], []
+    for row, sentence in enumerate(sentences):
+        text = WHITESPACE_PATTERN.sub(" ", sentence.lower())
+        for i in range(len(text) - 1):
+            gram = text[i : i + 2]
+            if gram[0] == " " or gram[1] == " ":
+                continue
+            rows.append(row)
+            cols.append(columns.setdefault(gram, len(columns)))
+    matrix = np.zeros((len(sentences), max(1, len(columns))), dtype=np.float32)
+    np.add.at(matrix, (rows, cols), 1.0)
+    return matrix
+
+
+def textrank_scores(
+    sentences: list[str], damping: float = 0.85, lead_bias: float = 1.0, iterations: int = 30
+) -> np.ndarray:
+    """문장별 TextRank 점수"""
+    vectors = _sentence_vectors(sentences)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors /= np.where(norms > 0, norms, 1)
+
+    # ① 코사인 유사도 그래프 (자기 자신 제외) → 행 정규화한 전이 행렬
+    similarity = vectors @ vectors.T
+    np.fill_diagonal(similarity, 0.0)
+    out_degree = similarity.sum(axis=1, keepdims=True)
+    n = len(sentences)
+    transition = np.where(out_degree > 0, similarity / np.where(out_degree > 0, out_degree, 1), 1 / n)
+
+    # ② 앞 문장일수록 큰 teleport 확률 (lead_bias=0이면 균등)
+    teleport = 1.0 / (1.0 + lead_bias * np.arange(n, dtype=np.float32))
+    teleport /= teleport.sum()
+
+    # ③ 거듭제곱법
+    scores = np.full(n, 1 / n, dtype=np.float32)
+    for _ in range(iterations):
+        updated = (1 - damping) * teleport + damping * (scores @ transition)
+        if np.abs(updated - scores).sum() < 1e-5:
+            return updated
+        scores = updated
+    return scores
+
+
+def extractive_summary(text: str, n_sentences: int = 3, max_sentences: Optional[int] = None) -> str:
+    """점수가 높은 문장 n개를 원래 순서대로 이어 붙인 요약"""
+    sentences = []
+    for sentence in iter_sentences(text):
+        sentence = sentence.strip()
+        if len(sentence) >= MIN_SENTENCE_CHARS:
+            sentences.append(sentence)
+            if len(sentences) >= (max_sentences or MAX_SENTENCES):
+                break
+    if len(sentences) <= n_sentences:
+        return " ".join(sentences) or text.strip()
+
+    scores = textrank_scores(sentences)
+    chosen = np.sort(np.argsort(-scores, kind="stable")[:n_sentences])
+    return " ".join(sentences[i] for i in chosen)
+
+
+class SummaryPolicy:
+    """기사별로 추출 요약과 LLM 요약 중 하나를 고르는 정책 (실행마다 새로 생성)
+
+    - backend가 "llm"/"extractive"면 모든 기사에 같은 방식 사용
+    - "auto"면 단신(토큰 수가 EXTRACTIVE_MAX_TOKENS 이하), 로컬 분류기가 저우선순위
+      카테고리로 판단한 기사, LLM 토큰 예산을 넘긴 이후의 기사는 추출 요약
+    """
+
+    def __init__(self, classifier=None, backend: Optional[str] = None):
+        self.backend = backend or Config.SUMMARY_BACKEND
+        self.classifier = classifier if Config.EXTRACTIVE_CATEGORIES else None
+        self.llm_tokens = 0
+        self.reasons: dict[str, int] = {}
+
+    def choose(self, news_item: Article, llm_cost: int) -> str:
+        """"llm" 또는 "extractive" 반환 (llm_cost: LLM으로 요약할 때의 예상 토큰)"""
+        reason = self._reason(news_item, llm_cost)
+        self.reasons[reason] = self.reasons.get(reason, 0) + 1
+        if reason == "llm":
+            self.llm_tokens += llm_cost
+            return "llm"
+        return "extractive"
+
+    def _reason(self, news_item: Article, llm_cost: int) -> str:
+        if self.backend != "auto":
+            return self.backend
+        if estimate_tokens(news_item.content) <= Config.EXTRACTIVE_MAX_TOKENS:
+            return "short"
+        if self.classifier is not None:
+            category, confidence = self.classifier.predict(news_item.title, news_item.content)
+            if category in Config.EXTRACTIVE_CATEGORIES and confidence >= Config.CLASSIFIER_THRESHOLD:
+                return "low_priority"
+        budget = Config.SUMMARY_LLM_TOKEN_BUDGET
+        if budget and self.llm_tokens + llm_cost > budget:
+            return "over_budget"
+        return "llm"
@@ -0,0 +1,178 @@
+import asyncio
+import importlib.util
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from config import Config
+from metrics import RunMetrics
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """커넥션 풀을 공유하는 비동기 HTTP 클라이언트 생성"""
+    # ① h2 패키지가 없으면 HTTP/1.1 keep-alive로 동작
+    http2 = Config.HTTP2 and importlib.util.find_spec("h2") is not None
+
+    limits = httpx.Limits(
+        max_connections=Config.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=Config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=Config.HTTP_KEEPALIVE_EXPIRY,
+    )
+    timeout = httpx.Timeout(Config.HTTP_TIMEOUT, connect=Config.HTTP_CONNECT_TIMEOUT)
+    return httpx.AsyncClient(http2=http2, limits=limits, timeout=timeout)
+
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class FetchTicket:
+    """slot() 안에서 요청 결과(상태 코드, Retry-After)를 스케줄러에 알리는 객체"""
+
+    def __init__(self):
+        self.status: Optional[int] = None
+        self.retry_after: Optional[float] = None
+
+    def update(self, response: httpx.Response) -> None:
+        self.status = response.status_code
+        retry_after = response.headers.get("retry-after", "")
+        self.retry_after = float(retry_after) if retry_after.isdigit() else None
+
+
+class _HostState:
+    """호스트별 적응형 동시성 상태 (AIMD: 성공 시 +1, 제한/오류 시 절반)"""
+
+    def __init__(self, max_limit: int):
+        self.max_limit = max_limit
+        self.limit = max_limit
+        self.in_flight = 0
+        self.successes = 0
+        self.strikes = 0
+        self.resume_at = 0.0
+        self.condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self.condition:
+            while True:
+                # 백오프 중이면 재개 시각까지 대기
+                wait = self.resume_at - time.monotonic()
+                if wait > 0:
+                    try:
+                        await asyncio.wait_for(self.condition.wait(), wait)
+                    except TimeoutError:
+                        pass
+                    continue
+                if self.in_flight < self.limit:
+                    self.in_flight += 1
+                    return
+                await self.condition.wait()
+
+    async def release(self) -> None:
+        async with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+
+
+class FetchScheduler:
+    """전체/호스트별 동시 요청 수를 제한하고 429·5xx·느린 응답에 맞춰 속도를 조절하는 스케줄러"""
+
+    def __init__(
+        self,
+        max_concurrency: int = None,
+        per_host: int = None,
+        metrics: Optional[RunMetrics] = None,
+    ):
+        self.per_host = per_host or Config.HTTP_MAX_CONNECTIONS_PER_HOST
+        self._global = asyncio.Semaphore(max_concurrency or Config.FETCH_MAX_CONCURRENCY)
+        self._hosts: dict[str, _HostState] = {}
+        self.throttled = 0
+        self.slow = 0
+        self.retries = 0
+        # 도메인별 요청 지연/상태 코드 기록 (슬롯을 얻은 뒤부터 응답을 다 받을 때까지)
+        self.metrics = metrics or RunMetrics()
+
+    def _host(self, url: str) -> _HostState:
+        host = urlsplit(url).netloc
+        if host not in self._hosts:
+            self._hosts[host] = _HostState(self.per_host)
+        return self._hosts[host]
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """호스트 슬롯 → 전역 슬롯 순으로 점유 (막힌 호스트가 전역 슬롯을 잡고 있지 않도록)"""
+        host = self._host(url)
+        await host.acquire()
+        ticket = FetchTicket()
+        failed = False
+        elapsed = 0.0
+        try:
+            async with self._global:
+                # 전역 슬롯 대기는 호스트가 느린 것이 아니므로 슬롯을 얻은 뒤부터 측정
+                requested = time.perf_counter()
+                try:
+                    yield ticket
+                finally:
+                    elapsed = time.perf_counter() - requested
+                    self.metrics.observe_http(url, elapsed, ticket.status)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._adapt(host, ticket, failed, elapsed)
+            await host.release()
+
+    def _adapt(self, host: _HostState, ticket: FetchTicket, failed: bool, elapsed: float) -> None:
+        now = time.monotonic()
+        if ticket.status in RETRYABLE_STATUS:
+            # ① 제한/서버 오류: 동시성 절반 + 지수 백오프 (Retry-After 우선)
+            self.throttled += 1
+            host.strikes += 1
+            host.limit = max(1, host.limit // 2)
+            backoff = ticket.retry_after or Config.FETCH_BACKOFF_BASE * 2 ** (host.strikes - 1)
+            host.resume_at = max(host.resume_at, now + min(backoff, Config.FETCH_BACKOFF_MAX))
+            host.successes = 0
+        elif failed or elapsed > Config.FETCH_SLOW_SECONDS:
+            # ② 연결 오류/느린 응답: 동시성 1 감소
+            self.slow += 1
+            host.limit = max(1, host.limit - 1)
+            host.successes = 0
+        else:
+            # ③ 정상 응답: 현재 한도만큼 연속 성공하면 1 증가
+            host.strikes = 0
+            host.successes += 1
+            if host.successes >= host.limit and host.limit < host.max_limit:
+                host.limit += 1
+                host.successes = 0
+
+    async def request(
+        self, client: httpx.AsyncClient, method: str, url: str, **kwargs
+    ) -> httpx.Response:
+        """slot 안에서 요청하고, 429/5xx면 백오프 후 재시도합니다."""
+        for attempt in range(Config.FETCH_MAX_RETRIES + 1):
+            async with self.slot(url) as ticket:
+                response = await client.request(method, url, **kwargs)
+                ticket.update(response)
+            if response.status_code not in RETRYABLE_STATUS or attempt == Config.FETCH_MAX_RETRIES:
+                return response
+            self.retries += 1
+        return response
+
+    def reset_stats(self) -> None:
+        """실행마다 카운터만 초기화 (호스트별 적응 한도는 다음 실행에도 유지)"""
+        self.throttled = 0
+        self.slow = 0
+        self.retries = 0
+
+    def stats(self) -> dict:
+        """실행 요약용 통계"""
+        return {
+            "throttled": self.throttled,
+            "slow_or_failed": self.slow,
+            "retries": self.retries,
+            "host_limits": {
+                host: state.limit for host, state in self._hosts.items()
+                if state.limit < state.max_limit
+            },
+        }
@@ -0,0 +1,95 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from config import Config
+from metrics import RunMetrics
+
+
+class TokenBucket:
+    """분당 한도를 초당 비율로 채우는 토큰 버킷 (한도가 없으면 바로 통과)"""
+
+    def __init__(self, per_minute: Optional[int]):
+        self.capacity = per_minute or 0
+        self.tokens = float(self.capacity)
+        self.rate = self.capacity / 60
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: int = 1) -> None:
+        if not self.capacity:
+            return
+        amount = min(amount, self.capacity)
+        # 락을 잡은 채 기다려서 먼저 온 요청부터 순서대로 통과
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+
+
+class LLMScheduler:
+    """N개의 LLM 요청을 계속 진행 중으로 유지하는 슬라이딩 윈도 스케줄러
+
+    배치 단위 gather와 달리 한 요청이 끝나는 즉시 다음 요청이 시작되며,
+    분당 요청 수(RPM)/토큰 수(TPM) 한도를 지키고 결과는 입력 순서대로 돌려줍니다.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        metrics: Optional[RunMetrics] = None,
+    ):
+        self.max_concurrency = max_concurrency or Config.LLM_MAX_CONCURRENCY
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if requests_per_minute is None:
+            requests_per_minute = Config.LLM_REQUESTS_PER_MINUTE
+        if tokens_per_minute is None:
+            tokens_per_minute = Config.LLM_TOKENS_PER_MINUTE
+        self._requests = TokenBucket(requests_per_minute)
+        self._tokens = TokenBucket(tokens_per_minute)
+        # 스케줄러를 공유하는 에이전트들이 같은 지표 객체에 기록
+        self.metrics = metrics or RunMetrics()
+
+    async def run(self, func: Callable[[], Awaitable[Any]], tokens: int = 0) -> Any:
+        """한도 안에서 LLM 호출 하나를 실행합니다."""
+        async with self._semaphore:
+            await self._requests.acquire(1)
+            await self._tokens.acquire(tokens)
+            return await func()
+
+    async def map(
+        self,
+        func: Callable[[Any], Awaitable[Any]],
+        items: list,
+        cost: Optional[Callable[[Any], int]] = None,
+        return_exceptions: bool = False,
+        label: str = "처리",
+    ) -> list:
+        """모든 항목에 func를 적용하고 입력 순서대로 결과를 반환합니다."""
+        total = len(items)
+        done = 0
+        report_every = max(1, Config.BATCH_SIZE)
+
+        async def run_one(item: Any) -> Any:
+            nonlocal done
+            started = time.perf_counter()
+            try:
+                return await self.run(lambda: func(item), cost(item) if cost else 0)
+            finally:
+                # 항목(기사/묶음/스토리)별 대기 + 처리 시간
+                key = getattr(item, "title", None)
+                self.metrics.observe_article(time.perf_counter() - started, key)
+                done += 1
+                if done % report_every == 0 or done == total:
+                    print(f"  {done}/{total}건 {label} 완료")
+
+        return await asyncio.gather(
+            *(run_one(item) for item in items), return_exceptions=return_exceptions
+        )
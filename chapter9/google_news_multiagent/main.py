@@ -1,6 +1,6 @@
-import os
 import logging
 import asyncio
+import argparse
 from datetime import datetime
 from dotenv import load_dotenv
 load_dotenv()
@@ -9,6 +9,10 @@ from langchain_core.messages import HumanMessage
 from langchain_openai import ChatOpenAI
 
 from workflow import create_news_workflow
+from checkpoint import SQLiteCheckpointSaver
+from metrics import RunMetrics
+from utils import save_report
+from agents.collector import RSSCollectorAgent
 from config import Config
 from state import NewsState
 
@@ -19,7 +23,16 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def main():
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Google News AI 멀티에이전트 시스템")
+    parser.add_argument(
+        "--resume", action="store_true", help="마지막으로 실패/중단된 실행을 이어서 실행"
+    )
+    parser.add_argument("--run-id", help="재개할 실행 ID (--resume과 함께 사용)")
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace):
     """Google News AI 멀티에이전트 시스템의 메인 실행 함수"""
     print(
         """
@@ -42,36 +55,98 @@ RSS 수집 → AI 요약 → 카테고리 분류 → 리포트 생성
             max_tokens=Config.MAX_TOKENS,
             api_key=Config.OPENAI_API_KEY,
         )
-        app = create_news_workflow(llm)
 
-        # ④ 워크플로우 실행 - 초기 상태 설정 후 비동기로 전체 파이프라인 실행
-        initial_state = NewsState(
-            messages=[HumanMessage(content="Google News RSS 처리를 시작합니다.")]
-        )
-        final_state = await app.ainvoke(initial_state)
+        # ④ 체크포인터 준비 - 노드가 끝날 때마다 상태를 실행 ID별로 저장
+        checkpointer = SQLiteCheckpointSaver() if Config.CHECKPOINTS else None
+        run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        resume = False
+        if args.resume:
+            if checkpointer is None:
+                raise ValueError("체크포인트가 꺼져 있어 재개할 수 없습니다. (Config.CHECKPOINTS)")
+            resume_id = args.run_id or checkpointer.last_unfinished_run()
+            if resume_id is None:
+                print("재개할 실행이 없어 새로 실행합니다.")
+            else:
+                run_id, resume = resume_id, True
+        run_config = {"configurable": {"thread_id": run_id}}
+
+        # ⑤ 워크플로우 실행 - 초기 상태 설정 후 비동기로 전체 파이프라인 실행
+        # 수집 에이전트의 HTTP 커넥션 풀은 실행이 끝나면 닫힘
+        # 에이전트들이 공유하는 실행 지표 (보고서 옆에 .metrics.json으로 저장)
+        metrics = RunMetrics()
+        async with RSSCollectorAgent() as collector:
+            app = create_news_workflow(
+                llm, collector=collector, checkpointer=checkpointer, metrics=metrics
+            )
+            if checkpointer is not None:
+                checkpointer.start_run(run_id)
+            try:
+                if resume:
+                    # 입력 없이 실행하면 마지막 체크포인트의 다음 노드부터 이어서 실행
+                    snapshot = await app.aget_state(run_config)
+                    print(f"실행 {run_id} 재개: {', '.join(snapshot.next) or '완료된 실행'}부터")
+                    final_state = await app.ainvoke(None, run_config)
+                else:
+                    print(f"실행 ID: {run_id}")
+                    initial_state = NewsState(
+                        messages=[HumanMessage(content="Google News RSS 처리를 시작합니다.")]
+                    )
+                    final_state = await app.ainvoke(initial_state, run_config)
+            except Exception:
+                if checkpointer is not None:
+                    checkpointer.finish_run(run_id, status="failed")
+                    print(f"\n실행 {run_id} 실패 - python main.py --resume 으로 이어서 실행할 수 있습니다.")
+                raise
+            if checkpointer is not None:
+                checkpointer.finish_run(run_id)
 
-        # ⑤ 최종 보고서 저장 및 출력 - 처리 결과를 파일로 저장하고 요약 정보 표시
+        # ⑥ 최종 보고서 저장 및 출력 - 처리 결과를 파일로 저장하고 요약 정보 표시
         if not final_state.get("final_report"):
+            if incremental := final_state.get("run_stats", {}).get("incremental"):
+                unchanged = sum(1 for status in incremental["feed_status"].values() if status == 304)
+                print(
+                    f"\n새로 수집된 뉴스가 없습니다. "
+                    f"(변경 없는 피드 {unchanged}/{len(incremental['feed_status'])}개)"
+                )
             print("\n생성된 보고서가 없습니다.")
             return
 
-        os.makedirs(Config.OUTPUT_DIR, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = os.path.join(Config.OUTPUT_DIR, f"news_report_{timestamp}.md")
-
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(final_state["final_report"])
+        filename = save_report(final_state["final_report"], Config.OUTPUT_DIR)
 
         print("\n" + "=" * 60)
         print("처리 완료")
         print("=" * 60)
         print(f"\n보고서가 저장되었습니다: {filename}")
+        if Config.METRICS_JSON:
+            print(f"실행 지표: {metrics.save_json(filename)}")
+            if metrics.nodes:
+                node, seconds = max(metrics.nodes.items(), key=lambda item: item[1])
+                print(f"  가장 오래 걸린 단계: {node} ({seconds:.2f}s)")
         print(f"처리된 뉴스: {len(final_state.get('summarized_news', []))}건")
+        run_stats = final_state.get("run_stats", {})
+        for key, label in (
+            ("url_cache", "URL 디코딩 캐시"),
+            ("article_cache", "기사 본문 캐시"),
+            ("summary_cache", "요약 캐시"),
+        ):
+            if cache_stats := run_stats.get(key):
+                print(f"{label}: 적중 {cache_stats['hits']}건 / 미스 {cache_stats['misses']}건")
+        if checkpointer is not None:
+            checkpoint_stats = checkpointer.stats()
+            print(
+                f"체크포인트: {checkpoint_stats['bytes_written'] / 1024:.0f}KB 기록, "
+                f"{checkpoint_stats['write_seconds']:.3f}s"
+            )
+        if local := run_stats.get("local_classifier"):
+            print(
+                f"로컬 분류기: LLM 호출 {local['llm_calls_avoided']}건 절약 / "
+                f"{local['llm_calls']}건 LLM 분류"
+            )
         print("\n보고서 미리보기:")
         print("-" * 60)
         print(final_state["final_report"][:500] + "...")
 
-    # ⑥ 예외 처리 - 사용자 중단과 일반 오류를 구분하여 처리
+    # ⑦ 예외 처리 - 사용자 중단과 일반 오류를 구분하여 처리
     except KeyboardInterrupt:
         print("\n\n사용자에 의해 중단되었습니다.")
     except Exception as e:
@@ -79,6 +154,6 @@ RSS 수집 → AI 요약 → 카테고리 분류 → 리포트 생성
         print(f"\n오류 발생: {e}")
 
 
-# ⑦ 프로그램 진입점 - 비동기 메인 함수를 실행
+# ⑧ 프로그램 진입점 - 비동기 메인 함수를 실행
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main(parse_args()))
\ No newline at end of file
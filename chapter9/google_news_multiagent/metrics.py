@@ -0,0 +1,287 @@
+import bisect
+import json
+import os
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Optional
+from urllib.parse import urlsplit
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from utils import write_atomic
+
+# Prometheus 기본값과 같은 지연 시간 구간(초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SLOWEST_ARTICLES = 5  # 단계별로 보관할 가장 느린 기사 수
+
+# 현재 실행 중인 노드/스트리밍 단계 이름 (LLM 호출과 기사별 구간을 단계별로 나누는 데 사용)
+current_stage: ContextVar[str] = ContextVar("metrics_stage", default="-")
+
+
+class Histogram:
+    """관측값을 모두 보관하는 지연 시간 히스토그램 (JSON은 분위수, Prometheus는 누적 구간)"""
+
+    def __init__(self):
+        self.values: list[float] = []
+
+    def observe(self, value: float) -> None:
+        bisect.insort(self.values, value)
+
+    def quantile(self, q: float) -> float:
+        return self.values[min(len(self.values) - 1, int(q * len(self.values)))]
+
+    def to_dict(self) -> dict[str, Any]:
+        if not self.values:
+            return {"count": 0}
+        total = sum(self.values)
+        return {
+            "count": len(self.values),
+            "sum": round(total, 3),
+            "mean": round(total / len(self.values), 4),
+            "p50": round(self.quantile(0.5), 4),
+            "p95": round(self.quantile(0.95), 4),
+            "max": round(self.values[-1], 4),
+        }
+
+    def prometheus(self, name: str, labels: dict[str, str]) -> list[str]:
+        lines = [
+            f"{name}_bucket{format_labels({**labels, 'le': str(bound)})} "
+            f"{bisect.bisect_right(self.values, bound)}"
+            for bound in LATENCY_BUCKETS
+        ]
+        lines.append(f"{name}_bucket{format_labels({**labels, 'le': '+Inf'})} {len(self.values)}")
+        lines.append(f"{name}_sum{format_labels(labels)} {sum(self.values):.6f}")
+        lines.append(f"{name}_count{format_labels(labels)} {len(self.values)}")
+        return lines
+
+
+def format_labels(labels: dict[str, str]) -> str:
+    """Prometheus 라벨 (역슬래시, 따옴표, 줄바꿈 이스케이프)"""
+    escaped = []
+    for key, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        escaped.append(f'{key}="{value}"')
+    return "{" + ",".join(escaped) + "}"
+
+
+class RunMetrics:
+    """실행 한 번의 노드/기사별 소요 시간, 도메인별 HTTP 지연, LLM 지연·토큰, 캐시 적중률, 오류 수
+
+    에이전트들이 같은 객체를 공유하며 기록하고, 상주 모드에서는 실행마다 reset()으로 비웁니다.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.started_at = time.time()
+        self.nodes: dict[str, float] = {}
+        self.articles: dict[str, Histogram] = defaultdict(Histogram)
+        self.slowest: dict[str, list[tuple[float, str]]] = defaultdict(list)
+        self.http: dict[str, Histogram] = defaultdict(Histogram)
+        self.http_status: Counter = Counter()
+        self.llm: dict[str, Histogram] = defaultdict(Histogram)
+        self.llm_tokens: dict[str, Counter] = defaultdict(Counter)
+        self.llm_errors: Counter = Counter()
+        self.caches: dict[str, dict[str, int]] = {}
+        self.errors: Counter = Counter()
+
+    # --- 기록 -------------------------------------------------------------
+
+    @contextmanager
+    def stage(self, name: str):
+        """이 블록 안의 LLM 호출/기사별 구간을 name 단계로 기록"""
+        token = current_stage.set(name)
+        try:
+            yield
+        finally:
+            current_stage.reset(token)
+
+    def node(
+        self, name: str, func: Callable[[Any], Awaitable[Any]]
+    ) -> Callable[[Any], Awaitable[Any]]:
+        """워크플로우 노드 함수를 감싸 노드 소요 시간을 기록"""
+
+        async def timed(state):
+            started = time.perf_counter()
+            with self.stage(name):
+                try:
+                    return await func(state)
+                finally:
+                    self.nodes[name] = round(
+                        self.nodes.get(name, 0.0) + time.perf_counter() - started, 4
+                    )
+
+        return timed
+
+    def observe_article(
+        self, seconds: float, key: Optional[str] = None, stage: Optional[str] = None
+    ) -> None:
+        stage = stage or current_stage.get()
+        self.articles[stage].observe(seconds)
+        if key:
+            slowest = self.slowest[stage]
+            bisect.insort(slowest, (-seconds, key))
+            del slowest[SLOWEST_ARTICLES:]
+
+    def observe_http(self, url: str, seconds: float, status: Optional[int]) -> None:
+        domain = urlsplit(url).netloc
+        self.http[domain].observe(seconds)
+        self.http_status[(domain, str(status) if status is not None else "error")] += 1
+
+    def observe_llm(
+        self, seconds: float, input_tokens: int = 0, output_tokens: int = 0, failed: bool = False
+    ) -> None:
+        stage = current_stage.get()
+        self.llm[stage].observe(seconds)
+        self.llm_tokens[stage]["input"] += input_tokens
+        self.llm_tokens[stage]["output"] += output_tokens
+        if failed:
+            self.llm_errors[stage] += 1
+
+    def count_error(self, component: str, n: int = 1) -> None:
+        self.errors[component] += n
+
+    def record_caches(self, run_stats: dict[str, Any]) -> None:
+        """run_stats에서 적중/미스 통계가 있는 캐시만 모음"""
+        for name, stats in run_stats.items():
+            if isinstance(stats, dict) and {"hits", "misses"} <= stats.keys():
+                self.caches[name] = {"hits": stats["hits"], "misses": stats["misses"]}
+
+    def record_errors(self, error_log: list[str]) -> None:
+        """상태의 오류 기록을 "에이전트: 내용" 접두어 기준으로 집계"""
+        for error in error_log:
+            self.count_error(error.split(":", 1)[0].strip())
+
+    # --- 내보내기 -----------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        caches = {}
+        for name, stats in self.caches.items():
+            total = stats["hits"] + stats["misses"]
+            caches[name] = {**stats, "hit_rate": round(stats["hits"] / total, 4) if total else None}
+        http_status: dict[str, dict[str, int]] = defaultdict(dict)
+        for (domain, status), count in sorted(self.http_status.items()):
+            http_status[domain][status] = count
+        return {
+            "started_at": self.started_at,
+            "nodes": self.nodes,
+            "articles": {
+                stage: {
+                    **hist.to_dict(),
+                    "slowest": [
+                        {"key": key, "seconds": round(-negative, 4)}
+                        for negative, key in self.slowest.get(stage, [])
+                    ],
+                }
+                for stage, hist in self.articles.items()
+            },
+            "http": {
+                domain: {**hist.to_dict(), "status": http_status[domain]}
+                for domain, hist in self.http.items()
+            },
+            "llm": {
+                stage: {
+                    **hist.to_dict(),
+                    "input_tokens": self.llm_tokens[stage]["input"],
+                    "output_tokens": self.llm_tokens[stage]["output"],
+                    "errors": self.llm_errors[stage],
+                }
+                for stage, hist in self.llm.items()
+            },
+            "caches": caches,
+            "errors": dict(self.errors),
+        }
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 형식 (마지막 실행 기준)"""
+        lines = [
+            "# TYPE news_run_started_timestamp_seconds gauge",
+            f"news_run_started_timestamp_seconds {self.started_at:.3f}",
+            "# TYPE news_node_duration_seconds gauge",
+            *(
+                f"news_node_duration_seconds{format_labels({'node': node})} {seconds}"
+                for node, seconds in self.nodes.items()
+            ),
+            "# TYPE news_article_stage_duration_seconds histogram",
+        ]
+        for stage, hist in self.articles.items():
+            lines += hist.prometheus("news_article_stage_duration_seconds", {"stage": stage})
+        lines.append("# TYPE news_http_request_duration_seconds histogram")
+        for domain, hist in self.http.items():
+            lines += hist.prometheus("news_http_request_duration_seconds", {"domain": domain})
+        lines.append("# TYPE news_http_responses_total counter")
+        lines += [
+            f"news_http_responses_total{format_labels({'domain': d, 'status': s})} {count}"
+            for (d, s), count in sorted(self.http_status.items())
+        ]
+        lines.append("# TYPE news_llm_request_duration_seconds histogram")
+        for stage, hist in self.llm.items():
+            lines += hist.prometheus("news_llm_request_duration_seconds", {"stage": stage})
+        lines.append("# TYPE news_llm_tokens_total counter")
+        for stage, tokens in self.llm_tokens.items():
+            for kind in ("input", "output"):
+                labels = format_labels({"stage": stage, "type": kind})
+                lines.append(f"news_llm_tokens_total{labels} {tokens[kind]}")
+        lines.append("# TYPE news_llm_errors_total counter")
+        lines += [
+            f"news_llm_errors_total{format_labels({'stage': stage})} {n}"
+            for stage, n in self.llm_errors.items()
+        ]
+        lines.append("# TYPE news_cache_requests_total counter")
+        for name, stats in self.caches.items():
+            for result, key in (("hit", "hits"), ("miss", "misses")):
+                labels = format_labels({"cache": name, "result": result})
+                lines.append(f"news_cache_requests_total{labels} {stats[key]}")
+        lines.append("# TYPE news_errors_total counter")
+        lines += [
+            f"news_errors_total{format_labels({'component': component})} {n}"
+            for component, n in self.errors.items()
+        ]
+        return "\n".join(lines) + "\n"
+
+    def save_json(self, report_path: str) -> str:
+        """보고서 옆에 같은 이름의 .metrics.json으로 저장하고 경로를 반환"""
+        path = os.path.splitext(report_path)[0] + ".metrics.json"
+        write_atomic(path, json.dumps(self.to_dict(), ensure_ascii=False, indent=2))
+        return path
+
+
+class LLMMetricsCallback(BaseCallbackHandler):
+    """채팅 모델 호출마다 지연 시간과 토큰 수(usage_metadata)를 RunMetrics에 기록하는 콜백"""
+
+    run_inline = True  # 호출한 코루틴 안에서 실행 (현재 단계 ContextVar 유지)
+
+    def __init__(self, metrics: RunMetrics):
+        self.metrics = metrics
+        self._started: dict[Any, float] = {}
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs) -> None:
+        self._started[run_id] = time.perf_counter()
+
+    def on_llm_end(self, response, *, run_id, **kwargs) -> None:
+        started = self._started.pop(run_id, None)
+        if started is None:
+            return
+        usage = {}
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                usage = getattr(message, "usage_metadata", None) or usage
+        self.metrics.observe_llm(
+            time.perf_counter() - started,
+            usage.get("input_tokens", 0),
+            usage.get("output_tokens", 0),
+        )
+
+    def on_llm_error(self, error, *, run_id, **kwargs) -> None:
+        if (started := self._started.pop(run_id, None)) is not None:
+            self.metrics.observe_llm(time.perf_counter() - started, failed=True)
+
+
+def instrument_llm(llm, metrics: RunMetrics) -> None:
+    """모델의 콜백 목록에 지표 콜백을 추가 (이전 워크플로우가 붙인 지표 콜백은 교체)"""
+    callbacks = [cb for cb in (llm.callbacks or []) if not isinstance(cb, LLMMetricsCallback)]
+    llm.callbacks = callbacks + [LLMMetricsCallback(metrics)]
@@ -0,0 +1,93 @@
+"""
+유사 중복 기사 탐지 - 본문 문자 shingle의 MinHash 서명 + LSH 밴드 색인 (NumPy)
+
+같은 밴드 버킷에 들어온 후보 쌍만 서명 일치율(추정 Jaccard 유사도)로 확인하고,
+임계값을 넘는 쌍을 union-find로 묶어 그룹을 만듭니다.
+"""
+import re
+import zlib
+from collections import defaultdict
+
+import numpy as np
+
+SHINGLE_SIZE = 5
+MERSENNE_PRIME = (1 << 32) - 5  # 2^32 미만 최대 소수 (uint64 곱셈에서 넘침 없음)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def shingle_hashes(text: str, k: int = SHINGLE_SIZE) -> np.ndarray:
+    """공백을 제거한 본문의 문자 k-gram 해시 집합"""
+    text = WHITESPACE_PATTERN.sub("", text.lower())
+    if len(text) <= k:
+        return np.array([zlib.crc32(text.encode("utf-8"))], dtype=np.uint64)
+    hashes = np.fromiter(
+        (zlib.crc32(text[i : i + k].encode("utf-8")) for i in range(len(text) - k + 1)),
+        dtype=np.uint64,
+        count=len(text) - k + 1,
+    )
+    return np.unique(hashes)
+
+
+def choose_bands(num_perm: int, threshold: float) -> tuple[int, int]:
+    """(밴드 수, 밴드당 행 수) - 후보가 되는 유사도 (1/b)^(1/r)가 임계값 이하인 것 중 가장 가까운 값"""
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if (1 / bands) ** (1 / rows) <= threshold:
+            best = (bands, rows)
+    return best
+
+
+class MinHashLSH:
+    """MinHash 서명과 LSH 밴드 색인으로 유사 중복 그룹을 찾습니다."""
+
+    def __init__(self, threshold: float, num_perm: int = 128, seed: int = 1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, MERSENNE_PRIME, num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, MERSENNE_PRIME, num_perm, dtype=np.uint64)
+        self.bands, self.rows = choose_bands(num_perm, threshold)
+
+    def signature(self, text: str) -> np.ndarray:
+        hashes = shingle_hashes(text)
+        # (a * x + b) mod p 를 순열마다 한 번에 계산해 최솟값을 서명으로 사용
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % MERSENNE_PRIME
+        return permuted.min(axis=1)
+
+    def group(self, texts: list[str]) -> list[list[int]]:
+        """유사 중복 그룹 목록 (각 그룹은 인덱스 오름차순, 단독 항목도 그룹 하나)"""
+        if not texts:
+            return []
+        signatures = np.array([self.signature(text) for text in texts]).reshape(len(texts), -1)
+        parent = list(range(len(texts)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        # ① 밴드별 버킷 → 같은 버킷의 항목이 후보
+        checked = set()
+        for band in range(self.bands):
+            buckets = defaultdict(list)
+            band_rows = signatures[:, band * self.rows : (band + 1) * self.rows]
+            for i, row in enumerate(band_rows):
+                buckets[row.tobytes()].append(i)
+            for members in buckets.values():
+                for position, j in enumerate(members):
+                    for i in members[:position]:
+                        if (i, j) in checked or find(i) == find(j):
+                            continue
+                        checked.add((i, j))
+                        # ② 서명 일치율(추정 Jaccard 유사도)로 확인 후 병합
+                        if np.mean(signatures[i] == signatures[j]) >= self.threshold:
+                            parent[find(j)] = find(i)
+
+        groups = defaultdict(list)
+        for i in range(len(texts)):
+            groups[find(i)].append(i)
+        return sorted(groups.values(), key=lambda members: members[0])
@@ -4,14 +4,18 @@ from pydantic import BaseModel, ConfigDict
 from langchain_core.messages import BaseMessage
 from langgraph.graph.message import add_messages
 
+from article import Article
+
 class NewsState(BaseModel):
     """뉴스 처리 상태를 관리하는 데이터 모델"""
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     messages: Annotated[list[BaseMessage],add_messages]=[]
-    raw_news: list[dict[str,Any]]=[]
-    summarized_news: list[dict[str,Any]]=[]
+    raw_news: list[Article]=[]
+    story_clusters: list[list[int]]=[]  # 같은 사건을 다룬 raw_news 인덱스 묶음
+    summarized_news: list[Article]=[]  # 요약을 덧붙인 raw_news 기사 (사본이 아닌 같은 객체)
 
-    categorized_news: dict[str,list[dict[str,Any]]]={}
+    categorized_news: dict[str,list[int]]={}  # 카테고리 → summarized_news 인덱스
     final_report:str=""
-    error_log:list[str]=[]
\ No newline at end of file
+    error_log:list[str]=[]
+    run_stats:dict[str,Any]={}  # 캐시 적중률 등 실행 요약 정보
\ No newline at end of file
@@ -0,0 +1,113 @@
+"""
+토큰 예산 기반 본문 자르기 - 네트워크에서 토크나이저 파일을 받지 않는 오프라인 토큰 추정기
+
+문자 종류별 평균 토큰 비율(GPT-4o 계열 기준 근사)로 토큰 수를 추정하고,
+본문은 문장 경계에서 예산에 맞게 자릅니다.
+"""
+import math
+import re
+from typing import Any, Dict, Iterator
+
+from config import Config
+
+# 문자 종류별 연속 구간 → 구간 길이당 토큰 수
+TOKEN_RUN_PATTERN = re.compile(
+    r"(?P<hangul>[가-힣ㄱ-ㆎ]+)"
+    r"|(?P<cjk>[぀-ヿ一-鿿]+)"
+    r"|(?P<latin>[A-Za-z]+)"
+    r"|(?P<digit>\d+)"
+    r"|(?P<space>\s+)"
+    r"|(?P<other>.)",
+    re.DOTALL,
+)
+TOKENS_PER_CHAR = {
+    "hangul": 0.7,  # 한글 음절 약 1.4자당 1토큰
+    "cjk": 1.0,
+    "latin": 0.25,  # 영문 약 4자당 1토큰
+    "digit": 1 / 3,  # 숫자는 최대 3자리씩 묶임
+    "space": 0.0,  # 공백은 대부분 다음 토큰에 합쳐짐
+    "other": 1.0,  # 문장 부호/기호
+}
+
+# 문장 끝(. ! ? 。 … 뒤 닫는 따옴표/괄호 포함) 다음 공백, 또는 줄바꿈
+SENTENCE_END_PATTERN = re.compile(r"(?<=[.!?。…])[\"'”’)\]]*\s+|\n+")
+
+# 단계별 입력 토큰 예산 (Config 속성 이름)
+STAGE_BUDGETS = {
+    "summary": "SUMMARY_INPUT_TOKENS",
+    "category": "CATEGORY_INPUT_TOKENS",
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """오프라인 토큰 수 추정"""
+    tokens = 0.0
+    for match in TOKEN_RUN_PATTERN.finditer(text):
+        kind = match.lastgroup
+        if kind in ("latin", "digit"):
+            tokens += math.ceil(len(match.group()) * TOKENS_PER_CHAR[kind])
+        else:
+            tokens += len(match.group()) * TOKENS_PER_CHAR[kind]
+    return math.ceil(tokens)
+
+
+def iter_sentences(text: str) -> Iterator[str]:
+    """문장 단위로 분리 (구분 공백은 앞 문장에 포함)"""
+    start = 0
+    for match in SENTENCE_END_PATTERN.finditer(text):
+        yield text[start : match.end()]
+        start = match.end()
+    if start < len(text):
+        yield text[start:]
+
+
+def truncate_to_tokens(text: str, budget: int) -> str:
+    """토큰 예산 안에 들어가도록 문장 경계에서 자릅니다.
+
+    앞에서부터 예산이 찰 때까지만 읽으므로 긴 본문도 전체를 스캔하지 않습니다.
+    첫 문장부터 예산을 넘으면 그 문장은 단어 경계에서 자릅니다.
+    """
+    return text[: truncation_end(text, budget)]
+
+
+def truncation_end(text: str, budget: int) -> int:
+    """truncate_to_tokens 결과의 길이 (결과는 항상 text의 앞부분)"""
+    used, end = 0, 0
+    for sentence in iter_sentences(text):
+        cost = estimate_tokens(sentence)
+        if used + cost > budget:
+            if not end:
+                return _truncate_words(sentence, budget)
+            return len(text[:end].rstrip())
+        used += cost
+        end += len(sentence)
+    return len(text)
+
+
+def _truncate_words(sentence: str, budget: int) -> int:
+    # 예산에 들어가는 가장 긴 단어 접두사를 이분 탐색 (접두사 길이 반환)
+    words = sentence.split(" ")
+    low, high = 0, len(words)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if estimate_tokens(" ".join(words[:mid])) <= budget:
+            low = mid
+        else:
+            high = mid - 1
+    return len(" ".join(words[:low]))
+
+
+def stage_input_ends(content: str) -> Dict[str, int]:
+    """단계별 예산으로 자른 본문의 길이 ({"summary": ..., "category": ...})
+
+    잘린 본문은 항상 원문의 앞부분이므로 사본 대신 길이만 보관합니다.
+    """
+    return {
+        stage: truncation_end(content, getattr(Config, attr))
+        for stage, attr in STAGE_BUDGETS.items()
+    }
+
+
+def stage_input(news_item: Any, stage: str) -> str:
+    """수집 단계에서 길이를 미리 계산해 둔 단계별 입력 (Article.stage_input)"""
+    return news_item.stage_input(stage)
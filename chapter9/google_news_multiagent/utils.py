@@ -1,5 +1,11 @@
+import os
 import re
+import tempfile
 from datetime import datetime, timedelta
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# URL 정규화 시 제거할 추적용 쿼리 파라미터
+TRACKING_PARAMS = {"fbclid", "gclid"}  # utm_* 와 함께 제거하는 추적 파라미터
 
 def clean_html(html_text: str)-> str:
     """HTML 태그 제거"""
@@ -34,5 +40,55 @@ def convert_gmt_to_kst(gmt_time_str:str)-> str:
     return kst_time.strftime("%Y-%m-%d %H:%M:%S")
 
 
+def normalize_url(url: str) -> str:
+    """중복 판정용 URL 정규화 (스킴/www./추적 파라미터/프래그먼트/끝 슬래시 제거)
+
+    m. 호스트와 ref/from 같은 파라미터는 다른 내용을 가리킬 수 있어 그대로 둡니다.
+    """
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower().removeprefix("www.")
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if key.lower() not in TRACKING_PARAMS and not key.lower().startswith("utm_")
+        )
+    )
+    return urlunsplit(("", host, parts.path.rstrip("/"), query, "")).lstrip("/")
+
+
+def normalize_title(title: str, source: str = "") -> str:
+    """중복 판정용 제목 정규화 (Google News의 ' - 언론사' 꼬리표, 기호, 공백 제거)"""
+    if not title:
+        return ""
+    if source and title.endswith(f" - {source}"):
+        title = title[: -len(source) - 3]
+    elif " - " in title:
+        title = title.rsplit(" - ", 1)[0]
+    return re.sub(r"[\W_]+", "", title).lower()
+
+
+def write_atomic(path: str, text: str) -> None:
+    """같은 디렉터리의 임시 파일에 쓴 뒤 교체 (읽는 쪽은 완성된 파일만 보게 됨)"""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 
-    
+def save_report(report: str, output_dir: str) -> str:
+    """보고서를 output_dir/news_report_<시각>.md 로 원자적으로 저장하고 경로를 반환합니다."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = os.path.join(output_dir, f"news_report_{timestamp}.md")
+    write_atomic(filename, report)
+    return filename
@@ -1,4 +1,5 @@
 from langchain_openai import ChatOpenAI
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import StateGraph, END
 
 from state import NewsState
@@ -6,32 +7,122 @@ from agents.collector import RSSCollectorAgent
 from agents.summarizer import NewsSummarizerAgent
 from agents.organizer import NewsOrganizerAgent
 from agents.reporter import ReportGeneratorAgent
+from agents.digester import NewsDigestAgent
+from agents.deduplicator import NearDuplicateAgent
+from agents.clusterer import StoryClusterAgent
+from agents.streamer import StreamingPipelineAgent
+from config import Config
+from llm_scheduler import LLMScheduler
+from metrics import RunMetrics, instrument_llm
 
 
-def create_news_workflow(llm: ChatOpenAI = None) -> StateGraph:
-    """뉴스 처리 워크플로우 생성 - RSS 수집 → AI 요약 → 카테고리 분류 → 보고서 생성"""
+def create_news_workflow(
+    llm: ChatOpenAI = None,
+    collector: RSSCollectorAgent = None,
+    fused: bool = None,
+    dedupe: bool = None,
+    cluster: bool = None,
+    streaming: bool = None,
+    checkpointer: BaseCheckpointSaver = None,
+    metrics: RunMetrics = None,
+) -> StateGraph:
+    """뉴스 처리 워크플로우 생성 - RSS 수집 → AI 요약 → 카테고리 분류 → 보고서 생성
+
+    fused=True(기본값 Config.FUSED_DIGEST)면 요약과 분류를 한 노드(digest)에서
+    구조화 출력 호출 한 번으로 처리합니다.
+    dedupe=True(기본값 Config.NEAR_DUP_DEDUP)면 수집과 요약 사이에서 유사 중복 기사를 묶습니다.
+    cluster=True(기본값 Config.STORY_CLUSTERING)면 같은 사건의 기사들을 스토리로 묶어
+    스토리마다 종합 요약 하나를 만듭니다. (2단계 그래프에서만 사용)
+    streaming=True(기본값 Config.STREAMING)면 수집·요약·분류를 한 노드(stream)에서
+    기사 단위로 겹쳐 실행합니다. (유사 중복/스토리 묶기 미사용)
+    checkpointer를 전달하면 노드가 끝날 때마다 상태를 저장하므로, 같은 실행 ID(thread_id)로
+    입력 없이 다시 실행하면 마지막으로 끝난 노드 다음부터 이어서 실행합니다.
+    metrics를 전달하면 모든 에이전트가 그 객체에 노드/기사별 소요 시간, HTTP·LLM 지연,
+    토큰 수, 캐시 적중률, 오류 수를 기록합니다. (상주 모드는 실행마다 metrics.reset())
+    """
+    fused = Config.FUSED_DIGEST if fused is None else fused
+    dedupe = Config.NEAR_DUP_DEDUP if dedupe is None else dedupe
+    streaming = Config.STREAMING if streaming is None else streaming
+    dedupe = dedupe and not streaming
+    cluster = (Config.STORY_CLUSTERING if cluster is None else cluster) and not fused and not streaming
 
     # ① 각 작업을 담당할 4개의 전문 에이전트 인스턴스 생성
-    collector = RSSCollectorAgent()  # RSS 피드 수집 전담
-    summarizer = NewsSummarizerAgent(llm)  # AI 요약 생성 전담
-    organizer = NewsOrganizerAgent(llm)  # 카테고리 분류 전담
-    reporter = ReportGeneratorAgent()  # 보고서 작성 전담
+    # collector를 전달하면 호출자가 HTTP 커넥션 풀의 수명을 관리
+    collector = collector or RSSCollectorAgent(metrics=metrics)  # RSS 피드 수집 전담
+    # 모든 에이전트가 하나의 실행 지표 객체를 공유 (LLM 지연·토큰은 모델 콜백으로 기록)
+    if metrics is None:
+        metrics = collector.metrics
+    collector.metrics = metrics
+    if llm is not None:
+        instrument_llm(llm, metrics)
+    # 요약/분류 에이전트는 하나의 LLM 스케줄러(동시성, 분당 요청/토큰 한도)를 공유
+    llm_scheduler = LLMScheduler(metrics=metrics)
+    if fused:
+        digester = NewsDigestAgent(llm, llm_scheduler)  # 요약 + 분류 동시 처리
+    else:
+        summarizer = NewsSummarizerAgent(llm, llm_scheduler)  # AI 요약 생성 전담
+        organizer = NewsOrganizerAgent(llm, llm_scheduler)  # 카테고리 분류 전담
+    reporter = ReportGeneratorAgent(metrics)  # 보고서 작성 전담
+    # 유사 중복 기사 묶기 (대표 기사만 요약/분류)
+    deduplicator = NearDuplicateAgent(llm_calls_per_article=1 if fused else 2)
+    clusterer = StoryClusterAgent()  # 같은 사건 기사 묶기 (스토리 단위 요약/분류)
 
     # ② NewsState를 state객체로 사용하는 워크플로우 그래프 생성
     workflow = StateGraph(NewsState)
 
+    if streaming:
+        # 스트리밍: 수집 → 요약 → 분류를 기사마다 이어서 처리하는 노드 하나 + 보고서
+        streamer = StreamingPipelineAgent(
+            collector,
+            summarizer=None if fused else summarizer,
+            organizer=None if fused else organizer,
+            digester=digester if fused else None,
+            metrics=metrics,
+        )
+        workflow.add_node("stream", metrics.node("stream", streamer.run_pipeline))
+        workflow.add_node("report", metrics.node("report", reporter.generate_report))
+        workflow.set_entry_point("stream")
+        workflow.add_conditional_edges(
+            "stream",
+            lambda state: "report" if state.raw_news or state.error_log else END,
+            {"report": "report", END: END},
+        )
+        workflow.add_edge("report", END)
+        return workflow.compile(checkpointer=checkpointer)
+
     # ③ 각 에이전트의 메서드를 워크플로우 노드로 등록
-    workflow.add_node("collect", collector.collect_rss)
-    workflow.add_node("summarize", summarizer.summarize_news)
-    workflow.add_node("organize", organizer.organize_news)
-    workflow.add_node("report", reporter.generate_report)
+    # (노드마다 소요 시간을 기록하고, 노드 안의 LLM 호출/기사별 구간을 노드 이름으로 구분)
+    workflow.add_node("collect", metrics.node("collect", collector.collect_rss))
+    if dedupe:
+        workflow.add_node("dedupe", metrics.node("dedupe", deduplicator.dedupe_news))
+    if cluster:
+        workflow.add_node("cluster", metrics.node("cluster", clusterer.cluster_news))
+    if fused:
+        workflow.add_node("digest", metrics.node("digest", digester.digest_news))
+    else:
+        workflow.add_node("summarize", metrics.node("summarize", summarizer.summarize_news))
+        workflow.add_node("organize", metrics.node("organize", organizer.organize_news))
+    workflow.add_node("report", metrics.node("report", reporter.generate_report))
 
     # ④ 워크플로우 실행 순서 정의 (순차적 파이프라인)
     workflow.set_entry_point("collect")  # 시작점 설정
-    workflow.add_edge("collect", "summarize")  # 수집 → 요약
-    workflow.add_edge("summarize", "organize")  # 요약 → 분류
-    workflow.add_edge("organize", "report")  # 분류 → 보고서
+    # 새 뉴스도 오류도 없으면 (증분 모드에서 바뀐 항목 없음) LLM 단계 없이 종료
+    # 수집 → (중복 묶기 →) (스토리 묶기 →) 요약
+    pre_llm_nodes = [node for node, used in (("dedupe", dedupe), ("cluster", cluster)) if used]
+    chain = pre_llm_nodes + ["digest" if fused else "summarize"]
+    workflow.add_conditional_edges(
+        "collect",
+        lambda state: chain[0] if state.raw_news or state.error_log else END,
+        {chain[0]: chain[0], END: END},
+    )
+    for source, target in zip(chain, chain[1:]):
+        workflow.add_edge(source, target)
+    if fused:
+        workflow.add_edge("digest", "report")  # 요약·분류 → 보고서
+    else:
+        workflow.add_edge("summarize", "organize")  # 요약 → 분류
+        workflow.add_edge("organize", "report")  # 분류 → 보고서
     workflow.add_edge("report", END)  # 보고서 → 종료
 
     # ⑤ 실행 가능한 워크플로우 객체로 컴파일하여 반환
-    return workflow.compile()
\ No newline at end of file
+    return workflow.compile(checkpointer=checkpointer)
\ No newline at end of file